@@ -2,15 +2,12 @@
 CLI command for analyzing job postings.
 """
 
+import sys
 import click
-from dotenv import load_dotenv
-from ..core.job_scraper import JobScraper
-from ..core.role_analyzer import RoleAnalyzer
-from ..core.apollo_search import ApolloClient
-from ..database.db import save_analyzed_job, save_contacts
-
-# Load environment variables
-load_dotenv()
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from ..core import fast_json
+from .display import SEPARATOR, display_apollo_contacts
 
 
 @click.command()
@@ -61,7 +58,21 @@ load_dotenv()
     default=None,
     help="Comma-separated test emails to use instead of Apollo search (e.g., 'email1@test.com,email2@test.com')"
 )
-def analyze(job_url: str, save: bool, format: str, search_apollo: bool, max_contacts_per_role: int, enrich_emails: int, add_to_sequence: str, no_confirm: bool, test_emails: str):
+@click.option(
+    "--no-cache",
+    "--force",
+    "no_cache",
+    is_flag=True,
+    default=False,
+    help="Ignore cached and saved analyses and re-fetch/re-analyze the job posting"
+)
+@click.option(
+    "--cache-similarity",
+    type=click.FloatRange(0.0, 1.0),
+    default=None,
+    help="Reuse the analysis of a previous posting whose content is at least this similar (e.g. 0.92). Off by default."
+)
+def analyze(job_url: str, save: bool, format: str, search_apollo: bool, max_contacts_per_role: int, enrich_emails: int, add_to_sequence: str, no_confirm: bool, test_emails: str, no_cache: bool, cache_similarity: float):
     """
     Analyze a job posting and suggest relevant roles to contact.
 
@@ -70,21 +81,129 @@ def analyze(job_url: str, save: bool, format: str, search_apollo: bool, max_cont
     Example:
         email-recruiters analyze https://www.linkedin.com/jobs/view/123456789
     """
+    # Heavy dependencies (scraper, Gemini, SQLAlchemy) are imported here so other
+    # subcommands and --help don't pay for them
+    from dotenv import load_dotenv
+    from ..core.job_scraper import JobScraper
+    from ..core.scrape_cache import SCRAPE_CACHE_TTL
+    from ..core.role_analyzer import RoleAnalyzer
+    from ..core.apollo_search import ApolloClient, ApolloContact
+    from ..core.http import create_session
+    from ..core.contact_id_cache import create_new_contacts
+    from ..core.analysis_cache import (
+        analysis_version,
+        get_cached,
+        get_saved,
+        put_cached,
+        get_cached_roles,
+        put_cached_roles,
+        find_similar_roles,
+        reuse_similar_roles,
+        put_similarity_entry,
+    )
+    from ..database.db import save_analyzed_job_with_contacts
+
+    # Load environment variables
+    load_dotenv()
+
+    # In JSON mode, progress/status goes to stderr so stdout stays pure JSON
+    status_to_stderr = format == "json"
+
+    def info(message=None):
+        click.echo(message, err=status_to_stderr)
+
+    # One HTTP connection pool for the scraper and Apollo.io, and one Apollo client
+    # shared by every phase, created on first use
+    http_session = create_session()
+    apollo_client = None
+
+    def _apollo():
+        nonlocal apollo_client
+        apollo_client = apollo_client or ApolloClient(session=http_session)
+        return apollo_client
+
     try:
-        click.echo("Fetching job posting...")
+        # Resolve the sequence before any scraping/AI/Apollo work so a typo in its
+        # name doesn't waste the whole run (the lookup is cached on the client)
+        sequence = None
+        if add_to_sequence:
+            try:
+                sequence = _apollo().find_sequence_by_name(add_to_sequence)
+            except Exception as e:
+                click.echo(f"Error looking up sequence '{add_to_sequence}': {str(e)}", err=True)
+                if "403" in str(e):
+                    click.echo("Note: Sequences API requires a MASTER API key.", err=True)
+                sys.exit(1)
+
+            if not sequence:
+                click.echo(f"Error: Sequence '{add_to_sequence}' not found.", err=True)
+                click.echo("Run './run_cli.sh list-sequences' to see available sequences.", err=True)
+                sys.exit(1)
+
+        # Reuse a previous analysis of this URL if one was made with the same model + prompt
+        cache_version = analysis_version()
+        cached = None if no_cache else get_cached(job_url, cache_version)
+
+        # Fall back to the job saved by an earlier `analyze --save` of this URL
+        if not cached and save and not no_cache:
+            cached = get_saved(job_url)
+            if cached:
+                put_cached(job_url, cache_version, *cached)
+
+        if cached:
+            info("Using cached analysis (pass --force to re-analyze)")
+            info()
+            job, job_info, roles = cached
+        else:
+            info("Fetching job posting...")
+
+            # Scrape the job posting
+            scraper = JobScraper(session=http_session, cache_ttl=None if no_cache else SCRAPE_CACHE_TTL)
+            job = scraper.scrape_job_posting(job_url)
+
+            info("Job posting fetched successfully!")
+            info()
+
+            # Identical content (e.g. the same posting under another URL) reuses its analysis
+            cached_roles = None if no_cache else get_cached_roles(job.raw_content, cache_version)
+
+            # Near-duplicate content (opt-in) is matched by embedding similarity
+            analyzer = None
+            embedding = None
+            if not cached_roles and cache_similarity is not None and not no_cache:
+                analyzer = RoleAnalyzer()
+                try:
+                    embedding = analyzer.embed(job.raw_content or job.description or "")
+                except Exception as e:
+                    info(f"Warning: Similarity cache unavailable: {str(e)}")
+                if embedding:
+                    similar = find_similar_roles(embedding, cache_version, cache_similarity)
+                    if similar:
+                        score, similar_roles = similar
+                        cached_roles = reuse_similar_roles(job, similar_roles)
+                        if cached_roles:
+                            info(f"Job content is {score:.0%} similar to a previous analysis; reusing its roles")
+                        else:
+                            info(f"Job content is {score:.0%} similar to a previous analysis of another company or unknown title; analyzing it anyway")
 
-        # Scrape the job posting
-        scraper = JobScraper()
-        job = scraper.scrape_job_posting(job_url)
+            if cached_roles:
+                if embedding is None:
+                    info("Job content matches a previous analysis; skipping AI analysis")
+                job_info, roles = cached_roles
+            else:
+                info("Analyzing job posting with AI...")
 
-        click.echo("Job posting fetched successfully!")
-        click.echo()
+                # Analyze the job posting (extracts info + suggests roles)
+                analyzer = analyzer or RoleAnalyzer()
+                job_info, roles = analyzer.analyze_from_job_posting(job)
 
-        click.echo("Analyzing job posting with AI...")
+                put_cached_roles(job.raw_content, cache_version, job_info, roles)
+                if embedding:
+                    put_similarity_entry(job.raw_content, cache_version, embedding, job_info, roles)
 
-        # Analyze the job posting (extracts info + suggests roles)
-        analyzer = RoleAnalyzer()
-        job_info, roles = analyzer.analyze_from_job_posting(job)
+            # A near-duplicate's roles are only a stand-in, so they aren't cached under this URL
+            if not (embedding and cached_roles):
+                put_cached(job_url, cache_version, job, job_info, roles)
 
         # Update job object with LLM-extracted information
         job.title = job_info.get("title")
@@ -93,22 +212,25 @@ def analyze(job_url: str, save: bool, format: str, search_apollo: bool, max_cont
         company_domain = job_info.get("company_domain")
         linkedin_company = job_info.get("linkedin_company")
 
-        click.echo(f"Analysis complete! Found {len(roles)} suggested roles.")
-        click.echo()
+        info(f"Analysis complete! Found {len(roles)} suggested roles.")
+        info()
 
         # Display basic info
         if format == "text":
-            click.echo("=" * 80)
-            click.echo(f"Job Title: {job.title or 'N/A'}")
-            click.echo(f"Company: {job.company or 'N/A'}")
+            lines = [
+                SEPARATOR,
+                f"Job Title: {job.title or 'N/A'}",
+                f"Company: {job.company or 'N/A'}",
+            ]
             if company_domain:
-                click.echo(f"Domain: {company_domain}")
+                lines.append(f"Domain: {company_domain}")
             if linkedin_company:
-                click.echo(f"LinkedIn: https://{linkedin_company}")
-            click.echo(f"Location: {job.location or 'N/A'}")
-            click.echo(f"URL: {job.url}")
-            click.echo("=" * 80)
-            click.echo()
+                lines.append(f"LinkedIn: https://{linkedin_company}")
+            lines.append(f"Location: {job.location or 'N/A'}")
+            lines.append(f"URL: {job.url}")
+            lines.append(SEPARATOR)
+            lines.append("")
+            click.echo("\n".join(lines))
 
         # Display results
         if format == "text":
@@ -116,24 +238,32 @@ def analyze(job_url: str, save: bool, format: str, search_apollo: bool, max_cont
 
             # Show search tips if we have company domain
             if company_domain:
-                click.echo()
-                click.echo("=" * 80)
-                click.echo("Search Tips:")
-                click.echo(f"  On Apollo/LinkedIn, filter by domain: @{company_domain}")
-                click.echo(f"  Example search: \"Product Manager @{company_domain}\"")
+                lines = [
+                    "",
+                    SEPARATOR,
+                    "Search Tips:",
+                    f"  On Apollo/LinkedIn, filter by domain: @{company_domain}",
+                    f"  Example search: \"Product Manager @{company_domain}\"",
+                ]
                 if linkedin_company:
-                    click.echo(f"  LinkedIn company page: https://{linkedin_company}")
-                click.echo("=" * 80)
+                    lines.append(f"  LinkedIn company page: https://{linkedin_company}")
+                lines.append(SEPARATOR)
+                click.echo("\n".join(lines))
         elif format == "json":
             _display_json_format(job, roles)
 
         # Handle test emails if provided
         apollo_contacts = {}
+
+        # IDs of contacts whose job title custom field was set when they were created
+        titled_contact_ids = set()
+        # IDs of contacts created for an earlier job, which keep that job's title and sequence
+        reused_contact_ids = set()
         if test_emails:
-            click.echo()
-            click.echo("=" * 80)
-            click.echo("TEST MODE: Creating test contacts in Apollo.io")
-            click.echo("=" * 80)
+            info()
+            info(SEPARATOR)
+            info("TEST MODE: Creating test contacts in Apollo.io")
+            info(SEPARATOR)
 
             # Parse comma-separated emails
             email_list = [email.strip() for email in test_emails.split(",") if email.strip()]
@@ -141,53 +271,71 @@ def analyze(job_url: str, save: bool, format: str, search_apollo: bool, max_cont
             if not email_list:
                 click.echo("Error: No valid emails provided in --test-emails", err=True)
             else:
-                click.echo(f"Creating {len(email_list)} test contacts...")
-                click.echo()
+                info(f"Creating {len(email_list)} test contacts...")
+                info()
 
                 try:
-                    apollo_client = ApolloClient()
+                    apollo_client = _apollo()
                     test_contacts = []
 
-                    for i, email in enumerate(email_list, 1):
-                        click.echo(f"  Creating contact {i}: {email}")
-
-                        # Create contact in Apollo.io
-                        result = apollo_client.create_contact(
-                            email=email,
-                            first_name=f"Test",
-                            last_name=f"Contact {i}",
-                            title="Test Contact",
-                            organization_name="Test Organization"
-                        )
+                    # Set the job title at creation time so no follow-up update is needed
+                    title_fields = None
+                    if add_to_sequence and job.title:
+                        title_fields = apollo_client.job_title_custom_fields(job.title)
+
+                    # Create contacts in Apollo.io concurrently, reading results back in input order
+                    with ThreadPoolExecutor(max_workers=apollo_client.MAX_CONCURRENT_CONTACT_CREATES) as executor:
+                        futures = [
+                            executor.submit(
+                                apollo_client.create_contact,
+                                email=email,
+                                first_name="Test",
+                                last_name=f"Contact {i}",
+                                title="Test Contact",
+                                organization_name="Test Organization",
+                                custom_fields=title_fields
+                            )
+                            for i, email in enumerate(email_list, 1)
+                        ]
 
-                        # Extract contact info from response
-                        contact_data = result.get("contact", {})
-                        person_id = contact_data.get("id")
-
-                        # Create ApolloContact object
-                        from ..core.apollo_search import ApolloContact
-                        contact = ApolloContact(
-                            name=f"Test Contact {i}",
-                            title="Test Contact",
-                            email=email,
-                            linkedin_url=None,
-                            company="Test Organization",
-                            organization_id=None,
-                            person_id=person_id
-                        )
+                        for i, (email, future) in enumerate(zip(email_list, futures), 1):
+                            info(f"  Creating contact {i}: {email}")
+                            try:
+                                result = future.result()
+                            except Exception as e:
+                                # One failed create shouldn't drop the contacts that were created
+                                click.echo(f"  Warning: Failed to create {email}: {str(e)}", err=True)
+                                continue
+
+                            # Extract contact info from response
+                            contact_data = result.get("contact", {})
+                            person_id = contact_data.get("id")
+
+                            # Create ApolloContact object
+                            contact = ApolloContact(
+                                name=f"Test Contact {i}",
+                                title="Test Contact",
+                                email=email,
+                                linkedin_url=None,
+                                company="Test Organization",
+                                organization_id=None,
+                                person_id=person_id
+                            )
 
-                        test_contacts.append(contact)
-                        click.echo(f"    ✓ Created with ID: {person_id}")
+                            test_contacts.append(contact)
+                            if title_fields and person_id:
+                                titled_contact_ids.add(person_id)
+                            info(f"    ✓ Created with ID: {person_id}")
 
-                    click.echo()
-                    click.echo(f"✓ Successfully created {len(test_contacts)} test contacts!")
+                    info()
+                    info(f"✓ Successfully created {len(test_contacts)} test contacts!")
 
                     # Store contacts in the same format as Apollo search
                     if test_contacts:
                         apollo_contacts["Test Contacts"] = test_contacts
 
                     if format == "text":
-                        _display_apollo_contacts(apollo_contacts)
+                        display_apollo_contacts(apollo_contacts)
 
                 except Exception as e:
                     click.echo(f"Error creating test contacts: {str(e)}", err=True)
@@ -195,70 +343,79 @@ def analyze(job_url: str, save: bool, format: str, search_apollo: bool, max_cont
         # Search Apollo.io if requested (skip if test emails provided)
         elif search_apollo:
             if not company_domain:
-                click.echo()
+                info()
                 click.echo("Warning: Cannot search Apollo.io - company domain not found", err=True)
             else:
-                click.echo()
-                click.echo("Searching for contacts on Apollo.io...")
+                info()
+                info("Searching for contacts on Apollo.io...")
                 try:
-                    apollo_client = ApolloClient()
-                    apollo_contacts = apollo_client.search_by_role_suggestions(
-                        domain=company_domain,
-                        role_suggestions=roles,
-                        max_per_role=max_contacts_per_role,
-                        enrich_top_n=enrich_emails if enrich_emails > 0 else None
-                    )
+                    apollo_client = _apollo()
+
+                    # Set the job title at creation time so no follow-up update is needed.
+                    # The custom field lookup doesn't depend on the search, so it runs alongside it.
+                    with ThreadPoolExecutor(max_workers=1) as executor:
+                        title_fields_future = None
+                        if add_to_sequence and job.title:
+                            title_fields_future = executor.submit(apollo_client.job_title_custom_fields, job.title)
+
+                        apollo_contacts = apollo_client.search_by_role_suggestions(
+                            domain=company_domain,
+                            role_suggestions=roles,
+                            max_per_role=max_contacts_per_role,
+                            enrich_top_n=enrich_emails if enrich_emails > 0 else None,
+                            on_role_searched=lambda role, contacts: info(
+                                f"  {role.title}: {len(contacts)} contact(s)"
+                            )
+                        )
+
+                        title_fields = title_fields_future.result() if title_fields_future else None
 
-                    total_found = sum(len(contacts) for contacts in apollo_contacts.values())
-                    click.echo(f"Found {total_found} contacts across {len(apollo_contacts)} roles!")
-                    click.echo()
+                    found_contacts = list(chain.from_iterable(apollo_contacts.values()))
+                    total_found = len(found_contacts)
+                    info(f"Found {total_found} contacts across {len(apollo_contacts)} roles!")
+                    info()
 
                     # Save contacts to user's Apollo account to get contact_ids
-                    click.echo("Saving contacts to your Apollo account...")
-                    saved_count = 0
-                    for role_title, contacts in apollo_contacts.items():
-                        for contact in contacts:
-                            # Only save contacts with valid emails
-                            if contact.email and contact.email != "email_not_unlocked@domain.com":
-                                try:
-                                    # Parse name into first and last
-                                    name_parts = contact.name.split(' ', 1)
-                                    first_name = name_parts[0] if len(name_parts) > 0 else contact.name
-                                    last_name = name_parts[1] if len(name_parts) > 1 else ""
-
-                                    # Create contact in user's account
-                                    result = apollo_client.create_contact(
-                                        email=contact.email,
-                                        first_name=first_name,
-                                        last_name=last_name,
-                                        title=contact.title,
-                                        organization_name=contact.company
-                                    )
+                    info("Saving contacts to your Apollo account...")
 
-                                    # Extract contact_id from response
-                                    contact_data = result.get("contact", {})
-                                    contact.contact_id = contact_data.get("id")
+                    # Only save contacts with valid emails
+                    to_save = [contact for contact in found_contacts if contact.has_unlocked_email]
+
+                    skipped_count = total_found - len(to_save)
+                    if skipped_count:
+                        info(f"  Skipping {skipped_count} contacts without unlocked emails")
+
+                    # Contacts are created concurrently; log errors but continue with the others.
+                    # Contacts already created for these emails are reused (Apollo doesn't dedupe)
+                    reused, failures = create_new_contacts(
+                        apollo_client, to_save, custom_fields=title_fields
+                    )
+                    for contact, error in failures:
+                        click.echo(f"  Warning: Failed to save {contact.name}: {str(error)}", err=True)
+                    if reused:
+                        info(f"  Reusing {len(reused)} contacts already in your account")
+                    reused_contact_ids.update(contact.contact_id for contact in reused)
 
-                                    if contact.contact_id:
-                                        saved_count += 1
-                                except Exception as e:
-                                    # Log error but continue with other contacts
-                                    click.echo(f"  Warning: Failed to save {contact.name}: {str(e)}", err=True)
+                    for contact in to_save:
+                        if contact.contact_id and title_fields:
+                            titled_contact_ids.add(contact.contact_id)
+                    saved_count = sum(1 for contact in to_save if contact.contact_id)
 
-                    click.echo(f"✓ Saved {saved_count}/{total_found} contacts to your account")
-                    click.echo()
+                    info(f"✓ Saved {saved_count}/{total_found} contacts to your account")
+                    info()
 
                     if format == "text":
-                        _display_apollo_contacts(apollo_contacts)
+                        display_apollo_contacts(apollo_contacts)
 
                 except Exception as e:
                     click.echo(f"Error searching Apollo.io: {str(e)}", err=True)
 
         # Save to database
         if save:
-            click.echo()
-            click.echo("Saving to database...")
-            job_id = save_analyzed_job(
+            info()
+            info("Saving to database...")
+            # Job, roles and any Apollo contacts are written in one transaction
+            job_id, saved_count = save_analyzed_job_with_contacts(
                 url=job.url,
                 title=job.title,
                 company=job.company,
@@ -267,138 +424,153 @@ def analyze(job_url: str, save: bool, format: str, search_apollo: bool, max_cont
                 linkedin_company_url=linkedin_company,
                 description=job.description,
                 raw_content=job.raw_content,
-                suggested_roles=roles
+                suggested_roles=roles,
+                contacts=chain.from_iterable(apollo_contacts.values())
             )
-            click.echo(f"Saved successfully! Job ID: {job_id}")
+            info(f"Saved successfully! Job ID: {job_id}")
 
-            # Save Apollo contacts if any were found
             if apollo_contacts:
-                click.echo("Saving Apollo.io contacts to database...")
-                all_contacts = []
-                for role_title, contacts in apollo_contacts.items():
-                    all_contacts.extend(contacts)
-
-                saved_count = save_contacts(job_id, all_contacts)
-                click.echo(f"Saved {saved_count} contacts to database!")
+                info(f"Saved {saved_count} Apollo.io contacts to database!")
 
         # Add contacts to sequence if requested
         if add_to_sequence and apollo_contacts:
-            click.echo()
-            click.echo("=" * 80)
-            click.echo(f"Adding contacts to sequence: '{add_to_sequence}'")
-            click.echo("=" * 80)
-
-            # Collect all contacts
-            all_contacts = []
-            for role_title, contacts in apollo_contacts.items():
-                all_contacts.extend(contacts)
+            info()
+            info(SEPARATOR)
+            info(f"Adding contacts to sequence: '{add_to_sequence}'")
+            info(SEPARATOR)
 
             # Get contact IDs (use contact_id if available, fallback to person_id for test contacts)
-            contact_ids = [c.contact_id or c.person_id for c in all_contacts if (c.contact_id or c.person_id)]
-
-            if not contact_ids:
+            total_contacts = 0
+            contact_ids = []
+            for contacts in apollo_contacts.values():
+                total_contacts += len(contacts)
+                contact_ids.extend(c.contact_id or c.person_id for c in contacts if (c.contact_id or c.person_id))
+
+            # Contacts created for an earlier job keep that job's title and sequence enrollment
+            if reused_contact_ids:
+                contact_ids = [cid for cid in contact_ids if cid not in reused_contact_ids]
+                info(f"Skipping {len(reused_contact_ids)} contacts already added for an earlier job")
+
+            if not contact_ids and reused_contact_ids:
+                info("No new contacts to add to the sequence.")
+            elif not contact_ids:
                 click.echo("Warning: No contacts have saved to your account. Cannot add to sequence.", err=True)
             else:
-                click.echo(f"Found {len(contact_ids)} contacts with Apollo.io IDs")
-                click.echo()
+                info(f"Found {len(contact_ids)} contacts with Apollo.io IDs")
+                info()
+
+                # A confirmation prompt would block forever without a terminal, so fail fast
+                if not no_confirm and not sys.stdin.isatty():
+                    click.echo("Non-interactive mode without --no-confirm; refusing to add contacts.", err=True)
+                    click.echo("Re-run with --no-confirm to add contacts from scripts or CI.", err=True)
+                    sys.exit(1)
 
                 # Show confirmation prompt (unless --no-confirm is set)
                 should_add = no_confirm
 
                 if not no_confirm:
-                    click.echo("IMPORTANT: This will ADD contacts to the sequence but NOT start the campaign.")
-                    click.echo("You will need to manually start/resume the sequence in Apollo.io UI.")
-                    click.echo()
-                    should_add = click.confirm(f"Add {len(contact_ids)} contacts to '{add_to_sequence}'?", default=True)
+                    info("IMPORTANT: This will ADD contacts to the sequence but NOT start the campaign.")
+                    info("You will need to manually start/resume the sequence in Apollo.io UI.")
+                    info()
+                    should_add = click.confirm(
+                        f"Add {len(contact_ids)} contacts to '{add_to_sequence}'?",
+                        default=True,
+                        err=status_to_stderr
+                    )
                 else:
-                    click.echo(f"Auto-adding {len(contact_ids)} contacts to sequence (--no-confirm enabled)...")
+                    info(f"Auto-adding {len(contact_ids)} contacts to sequence (--no-confirm enabled)...")
 
                 if should_add:
                     try:
-                        apollo_client = ApolloClient()
+                        apollo_client = _apollo()
 
-                        # Find sequence by name
-                        sequence = apollo_client.find_sequence_by_name(add_to_sequence)
+                        # Fetch email accounts in the background while contacts are updated
+                        with ThreadPoolExecutor(max_workers=1) as executor:
+                            email_accounts_future = executor.submit(apollo_client.get_email_accounts)
 
-                        if not sequence:
-                            click.echo(f"Error: Sequence '{add_to_sequence}' not found.", err=True)
-                            click.echo("Run './run_cli.sh list-sequences' to see available sequences.", err=True)
-                        else:
                             sequence_id = sequence.get("id")
-                            click.echo(f"Found sequence: {sequence.get('name')} (ID: {sequence_id})")
-                            click.echo()
+                            info(f"Found sequence: {sequence.get('name')} (ID: {sequence_id})")
+                            info()
 
-                            # Update contacts with job title for personalization
-                            click.echo("Updating contacts with job title for email personalization...")
+                            # Update contacts with job title for personalization. Contacts created
+                            # above already carry it, so only the rest need an update call.
+                            info("Updating contacts with job title for email personalization...")
                             updated_count = 0
-                            for contact in all_contacts:
-                                # Use contact_id if available, fallback to person_id for test contacts
-                                contact_id = contact.contact_id or contact.person_id
-                                if contact_id and job.title:
-                                    if apollo_client.update_contact_with_job_title(contact_id, job.title):
-                                        updated_count += 1
+                            if job.title:
+                                untitled_ids = [cid for cid in contact_ids if cid not in titled_contact_ids]
+                                updated_count = len(contact_ids) - len(untitled_ids)
+                                if untitled_ids:
+                                    updated_count += apollo_client.bulk_update_contacts_with_job_title(
+                                        untitled_ids, job.title
+                                    )
 
                             if updated_count > 0:
-                                click.echo(f"✓ Updated {updated_count}/{len(all_contacts)} contacts with job title: '{job.title}'")
-                                click.echo("  (You can now use {{first_name}} and {{custom.job_posting_title}} in your sequence emails)")
+                                info(f"✓ Updated {updated_count}/{total_contacts} contacts with job title: '{job.title}'")
+                                info("  (You can now use {{first_name}} and {{custom.job_posting_title}} in your sequence emails)")
                             else:
-                                click.echo("⚠ Warning: Could not update contacts with job title.")
-                                click.echo("  Make sure you have created a custom field named 'Job_Posting_Title' in Apollo.io")
-                                click.echo("  (Settings -> Custom Fields -> Create Contact Custom Field)")
+                                info("⚠ Warning: Could not update contacts with job title.")
+                                info("  Make sure you have created a custom field named 'Job_Posting_Title' in Apollo.io")
+                                info("  (Settings -> Custom Fields -> Create Contact Custom Field)")
 
-                            click.echo()
+                            info()
 
-                            # Try to fetch email accounts automatically
+                            # Use the automatically fetched email accounts
                             email_account_id = None
                             try:
-                                click.echo("Fetching email accounts...")
-                                email_accounts = apollo_client.get_email_accounts()
+                                info("Fetching email accounts...")
+                                email_accounts = email_accounts_future.result()
                                 if email_accounts:
                                     email_account_id = str(email_accounts[0])
-                                    click.echo(f"Using email account ID: {email_account_id}")
+                                    info(f"Using email account ID: {email_account_id}")
                                 else:
-                                    click.echo("Warning: No email accounts found")
+                                    info("Warning: No email accounts found")
                             except Exception as e:
-                                click.echo(f"Warning: Could not fetch email accounts: {str(e)}")
+                                info(f"Warning: Could not fetch email accounts: {str(e)}")
 
-                            click.echo()
+                            info()
 
                             # Add contacts to sequence
-                            result = apollo_client.add_contacts_to_sequence(
-                                sequence_id=sequence_id,
-                                contact_ids=contact_ids,
-                                sequence_name=add_to_sequence,
-                                email_account_id=email_account_id
-                            )
-
-                            click.echo()
-                            click.echo(f"✓ Successfully added {len(contact_ids)} contacts to sequence!")
-                            click.echo()
-                            click.echo("Next steps:")
-                            click.echo(f"  1. Log into Apollo.io")
-                            click.echo(f"  2. Go to Sequences -> '{add_to_sequence}'")
-                            click.echo(f"  3. Review contacts and manually start/resume the sequence")
-                            click.echo()
-                            click.echo("Email personalization:")
-                            click.echo(f"  - Use {{{{first_name}}}} for the contact's first name")
-                            click.echo(f"  - Use {{{{custom.job_posting_title}}}} for the job title: '{job.title}'")
+                            with click.progressbar(
+                                length=len(contact_ids),
+                                label="Adding contacts",
+                                file=click.get_text_stream("stderr" if status_to_stderr else "stdout")
+                            ) as bar:
+                                result = apollo_client.add_contacts_to_sequence(
+                                    sequence_id=sequence_id,
+                                    contact_ids=contact_ids,
+                                    sequence_name=add_to_sequence,
+                                    email_account_id=email_account_id,
+                                    progress_callback=bar.update
+                                )
+
+                            info()
+                            info(f"✓ Successfully added {result['added_count']} contacts to sequence!")
+                            info()
+                            info("Next steps:")
+                            info(f"  1. Log into Apollo.io")
+                            info(f"  2. Go to Sequences -> '{add_to_sequence}'")
+                            info(f"  3. Review contacts and manually start/resume the sequence")
+                            info()
+                            info("Email personalization:")
+                            info(f"  - Use {{{{first_name}}}} for the contact's first name")
+                            info(f"  - Use {{{{custom.job_posting_title}}}} for the job title: '{job.title}'")
 
                     except Exception as e:
                         click.echo(f"Error adding contacts to sequence: {str(e)}", err=True)
 
                         if "403" in str(e):
-                            click.echo()
+                            info()
                             click.echo("Note: Sequences API requires a MASTER API key.", err=True)
                             click.echo("Please create a master API key in Apollo.io settings.", err=True)
                         elif "Email account ID required" in str(e):
-                            click.echo()
+                            info()
                             click.echo("To fix this:", err=True)
                             click.echo("  1. Log into Apollo.io", err=True)
                             click.echo("  2. Go to Settings -> Email Accounts", err=True)
                             click.echo("  3. Connect your email account to the sequence", err=True)
                             click.echo("  4. OR configure a default sending mailbox for the sequence", err=True)
                 else:
-                    click.echo("Cancelled. Contacts were NOT added to sequence.")
+                    info("Cancelled. Contacts were NOT added to sequence.")
 
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
@@ -407,50 +579,26 @@ def analyze(job_url: str, save: bool, format: str, search_apollo: bool, max_cont
 
 def _display_text_format(roles):
     """Display roles in human-readable text format."""
-    click.echo("Suggested Contacts (in priority order):")
-    click.echo()
+    lines = ["Suggested Contacts (in priority order):", ""]
 
     for role in roles:
-        click.echo(f"{role.priority}. {role.title}")
-        click.echo(f"   Keywords: {', '.join(role.keywords)}")
-        click.echo(f"   Reasoning: {role.reasoning}")
-        click.echo()
+        lines.append(f"{role.priority}. {role.title}")
+        lines.append(f"   Keywords: {', '.join(role.keywords)}")
+        lines.append(f"   Reasoning: {role.reasoning}")
+        lines.append("")
+
+    click.echo("\n".join(lines))
 
 
 def _display_json_format(job, roles):
     """Display results in JSON format."""
-    import json
-
     result = {
         "job": job.to_dict(),
         "suggested_roles": [role.to_dict() for role in roles]
     }
 
-    click.echo(json.dumps(result, indent=2))
-
-
-def _display_apollo_contacts(apollo_contacts):
-    """Display Apollo.io contacts in human-readable format."""
-    click.echo("=" * 80)
-    click.echo("Apollo.io Contacts Found:")
-    click.echo("=" * 80)
-    click.echo()
-
-    for role_title, contacts in apollo_contacts.items():
-        click.echo(f"Role: {role_title}")
-        click.echo("-" * 80)
-
-        for i, contact in enumerate(contacts, 1):
-            click.echo(f"  {i}. {contact.name}")
-            if contact.title:
-                click.echo(f"     Title: {contact.title}")
-            if contact.email:
-                click.echo(f"     Email: {contact.email}")
-            if contact.linkedin_url:
-                click.echo(f"     LinkedIn: {contact.linkedin_url}")
-            click.echo()
-
-        click.echo()
+    # Pretty-print for people; compact when piped to another program or a file
+    click.echo(fast_json.dumps(result, indent=sys.stdout.isatty()))
 
 
 if __name__ == "__main__":
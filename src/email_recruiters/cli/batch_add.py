@@ -7,23 +7,80 @@ found contacts to the configured default sequence.
 
 import click
 import re
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import chain, groupby
+from operator import itemgetter
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from ..config import is_configured, get_sequence_config, load_config
-from ..core.job_scraper import JobScraper
-from ..core.role_analyzer import RoleAnalyzer
-from ..core.apollo_search import ApolloClient
+from .display import SEPARATOR
+
+# Default number of job URLs processed concurrently
+BATCH_WORKERS = 4
+
+# Number of job postings scraped from Jina at the same time, ahead of analysis
+SCRAPE_WORKERS = 8
+
+# Separators between pasted URLs: commas and any whitespace
+URL_SEPARATOR_PATTERN = re.compile(r"[,\s]+")
+
+# Query parameters that only track where a link was clicked, not which job it is
+TRACKING_PARAMS = frozenset({"trk", "trackingid", "refid", "ref", "src", "source"})
+
+
+@dataclass
+class BatchStats:
+    """Counters reported in the batch summary."""
+    total_jobs: int = 0
+    successful: int = 0
+    failed: int = 0
+    total_contacts: int = 0
+    contacts_added: int = 0
+
+
+def _normalize_url(url: str) -> str:
+    """Canonical form of a job URL for spotting duplicates within a batch."""
+    parts = urlsplit(url)
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ]
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/"),
+        urlencode(query),
+        ""
+    ))
 
 
 @click.command(name="batch-add")
-def batch_add():
+@click.option(
+    "--urls-file",
+    type=click.File("r"),
+    default=None,
+    help="Read job URLs from a file (one per line or comma-separated) instead of prompting; '-' reads stdin"
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(1, 16),
+    default=BATCH_WORKERS,
+    show_default=True,
+    help="Number of jobs processed at the same time"
+)
+def batch_add(urls_file, workers):
     """
     Batch process multiple job URLs and add contacts to your configured sequence.
 
-    Prompts for multiple job URLs and processes them automatically,
-    adding all found contacts to your default sequence.
+    Prompts for multiple job URLs (or reads them from --urls-file) and processes
+    them in one run, adding all found contacts to your default sequence.
     """
-    click.echo("=" * 80)
+    click.echo(SEPARATOR)
     click.echo("Batch Add Jobs to Sequence")
-    click.echo("=" * 80)
+    click.echo(SEPARATOR)
     click.echo()
 
     # Check if configured
@@ -46,41 +103,61 @@ def batch_add():
     click.echo(f"Using sequence: {sequence_name}")
     click.echo()
 
-    # Prompt for job URLs
-    click.echo("Enter job URLs (one per line, or comma-separated):")
-    click.echo("Press Enter twice when done, or Ctrl+D")
-    click.echo()
+    # Piped input (e.g. `batch-add < urls.txt`) is read in one go, like --urls-file
+    if urls_file is None and not sys.stdin.isatty():
+        urls_file = sys.stdin
 
-    # Read multiline input
     urls_input = []
-    try:
-        while True:
-            line = input()
-            if not line.strip() and urls_input:  # Empty line after some input
-                break
-            if line.strip():
-                urls_input.append(line.strip())
-    except EOFError:
-        pass  # Ctrl+D pressed
+    if urls_file is not None:
+        # Blank lines and "#" comments are ignored (see job_urls_example.txt)
+        urls_input = [
+            line.strip()
+            for line in urls_file.read().splitlines()
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+    else:
+        # Prompt for job URLs
+        click.echo("Enter job URLs (one per line, or comma-separated):")
+        click.echo("Press Enter twice when done, or Ctrl+D")
+        click.echo()
+
+        # Read multiline input
+        try:
+            while True:
+                line = input()
+                if not line.strip() and urls_input:  # Empty line after some input
+                    break
+                if line.strip():
+                    urls_input.append(line.strip())
+        except EOFError:
+            pass  # Ctrl+D pressed
 
     if not urls_input:
         click.echo("No URLs provided.", err=True)
         raise click.Abort()
 
-    # Parse URLs (handle comma-separated, space-separated, and newline-separated)
-    urls = []
-    for line in urls_input:
-        # Split by comma or whitespace
-        parts = re.split(r'[,\s]+', line)
-        urls.extend([url.strip() for url in parts if url.strip()])
-
-    # Validate URLs (basic check)
+    # Parse and validate URLs in one pass (comma-, space- and newline-separated),
+    # dropping duplicates of the same posting
     valid_urls = []
-    for url in urls:
-        if url.startswith('http://') or url.startswith('https://'):
+    invalid_urls = []
+    duplicate_urls = []
+    seen_urls = set()
+    for line in urls_input:
+        for url in filter(None, URL_SEPARATOR_PATTERN.split(line)):
+            if not url.startswith(("http://", "https://")):
+                invalid_urls.append(url)
+                continue
+            normalized = _normalize_url(url)
+            if normalized in seen_urls:
+                duplicate_urls.append(url)
+                continue
+            seen_urls.add(normalized)
             valid_urls.append(url)
-        else:
-            click.echo(f"⚠ Skipping invalid URL: {url}", err=True)
+
+    if invalid_urls:
+        click.echo(f"⚠ Skipping {len(invalid_urls)} invalid URL(s): {', '.join(invalid_urls)}", err=True)
+    if duplicate_urls:
+        click.echo(f"⚠ Skipping {len(duplicate_urls)} duplicate URL(s): {', '.join(duplicate_urls)}", err=True)
 
     if not valid_urls:
         click.echo("No valid URLs to process.", err=True)
@@ -94,30 +171,70 @@ def batch_add():
     max_contacts_per_role = int(config.get("default_max_contacts_per_role", "3"))
     enrich_count = int(config.get("default_enrich_count", "5"))
 
-    # Initialize clients
-    scraper = JobScraper()
+    # Initialize clients (imported here to keep CLI startup light)
+    from ..core.apollo_search import ApolloClient
+    from ..core.job_scraper import JobScraper
+    from ..core.scrape_cache import SCRAPE_CACHE_TTL
+    from ..core.role_analyzer import RoleAnalyzer
+    from ..core.analysis_cache import (
+        analysis_version,
+        get_cached,
+        put_cached,
+        get_cached_roles,
+        put_cached_roles,
+    )
+    from ..core.contact_id_cache import create_new_contacts
+    from ..core.http import create_session
+
+    # One scraper, analyzer and Apollo client (sharing one HTTP connection pool) for every job
+    http_session = create_session()
+    scraper = JobScraper(session=http_session, cache_ttl=SCRAPE_CACHE_TTL)
     analyzer = RoleAnalyzer()
-    apollo_client = ApolloClient()
+    apollo_client = ApolloClient(session=http_session)
+    cache_version = analysis_version()
+
+    # Jobs at the same company with the same suggested roles would find the same
+    # contacts, so only the first of them searches Apollo. The others wait until its
+    # contacts are written (so they reuse the created contact IDs) and then write the
+    # same contacts themselves; if its search failed they search on their own.
+    # search key -> (Event set once the first job is done, [its contacts or None])
+    searches = {}
+    searches_lock = threading.Lock()
 
     # Track statistics
-    stats = {
-        "total_jobs": len(valid_urls),
-        "successful": 0,
-        "failed": 0,
-        "total_contacts": 0,
-        "contacts_added": 0,
-    }
-
-    # Process each URL
-    for i, url in enumerate(valid_urls, 1):
-        try:
-            click.echo(f"[{i}/{len(valid_urls)}] Processing: {url}")
+    stats = BatchStats(total_jobs=len(valid_urls))
+
+    def load_job(url):
+        """Return (cached analysis, None) if url was analyzed before, else (None, scraped JobPosting)."""
+        cached = get_cached(url, cache_version)
+        if cached:
+            return cached, None
+        return None, scraper.scrape_job_posting(url)
 
-            # Step 1: Scrape job
-            job = scraper.scrape_job_posting(url)
+    def fetch_job(url, loaded):
+        """
+        Stage 1: analyze and search Apollo for one URL, once `loaded` (a load_job future) is done.
 
-            # Step 2: Analyze with AI
-            job_info, roles = analyzer.analyze_from_job_posting(job)
+        Returns the job's outcome; if contacts were found it also carries the job
+        and its contacts (flattened across roles) in "job" / "contacts" for write_job.
+        """
+        messages = []  # (message, err) pairs
+        outcome = {"url": url, "messages": messages, "successful": False, "contacts_found": 0, "contacts_added": 0}
+
+        try:
+            # Steps 1-2: Scrape job and analyze with AI, unless this URL was analyzed before
+            cached, job = loaded.result()
+            if cached:
+                job, job_info, roles = cached
+            else:
+                # Identical content (e.g. the same posting under another URL) reuses its analysis
+                cached_roles = get_cached_roles(job.raw_content, cache_version)
+                if cached_roles:
+                    job_info, roles = cached_roles
+                else:
+                    job_info, roles = analyzer.analyze_from_job_posting(job)
+                    put_cached_roles(job.raw_content, cache_version, job_info, roles)
+                put_cached(url, cache_version, job, job_info, roles)
 
             # Update job with extracted info
             job.title = job_info.get("title")
@@ -126,111 +243,170 @@ def batch_add():
             company_domain = job_info.get("company_domain")
 
             if not company_domain:
-                click.echo(f"  ⚠ No company domain found, skipping", err=True)
-                stats["failed"] += 1
-                continue
+                messages.append(("  ⚠ No company domain found, skipping", True))
+                return outcome
 
-            # Step 3: Search Apollo for contacts
-            apollo_contacts = apollo_client.search_by_role_suggestions(
-                domain=company_domain,
-                role_suggestions=roles,
-                max_per_role=max_contacts_per_role,
-                enrich_top_n=enrich_count
+            search_key = (
+                company_domain.lower(),
+                tuple((role.title, role.priority, tuple(role.keywords[:2])) for role in roles)
             )
+            with searches_lock:
+                earlier = searches.get(search_key)
+                if earlier is None:
+                    searches[search_key] = outcome["search"] = (threading.Event(), [None])
+
+            contacts = None
+            if earlier is not None:
+                done, result = earlier
+                done.wait()
+                contacts = result[0]
+                if contacts is not None:
+                    messages.append((f"  ✓ Same company and roles as an earlier job; reusing its {len(contacts)} contacts", False))
+
+            if contacts is None:
+                # Step 3: Search Apollo for contacts
+                apollo_contacts = apollo_client.search_by_role_suggestions(
+                    domain=company_domain,
+                    role_suggestions=roles,
+                    max_per_role=max_contacts_per_role,
+                    enrich_top_n=enrich_count
+                )
+                contacts = list(chain.from_iterable(apollo_contacts.values()))
+                outcome["contacts_found"] = len(contacts)
+
+            outcome["job"] = job
+            outcome["contacts"] = contacts
+
+        except Exception as e:
+            messages.append((f"  ✗ Error: {str(e)}", True))
+            # Later jobs with the same search must not wait for contacts that won't come
+            finish_search(outcome, None)
+
+        return outcome
+
+    def finish_search(outcome, contacts):
+        """Publish the contacts of a job's search to later jobs waiting on the same search."""
+        search = outcome.pop("search", None)
+        if search is not None:
+            done, result = search
+            result[0] = contacts
+            done.set()
+
+    def write_job(outcome):
+        """Stage 2: create the job's contacts in Apollo and add them to the sequence."""
+        messages = outcome["messages"]
+        job = outcome.pop("job")
+        contacts = outcome.pop("contacts")
 
-            total_found = sum(len(contacts) for contacts in apollo_contacts.values())
-            stats["total_contacts"] += total_found
-
-            # Step 4: Save contacts to user's account
-            saved_count = 0
-            all_contacts = []
-            for role_title, contacts in apollo_contacts.items():
-                for contact in contacts:
-                    all_contacts.append(contact)
-                    # Only save contacts with valid emails
-                    if contact.email and contact.email != "email_not_unlocked@domain.com":
-                        try:
-                            # Parse name
-                            name_parts = contact.name.split(' ', 1)
-                            first_name = name_parts[0] if len(name_parts) > 0 else contact.name
-                            last_name = name_parts[1] if len(name_parts) > 1 else ""
-
-                            # Create contact in user's account
-                            result = apollo_client.create_contact(
-                                email=contact.email,
-                                first_name=first_name,
-                                last_name=last_name,
-                                title=contact.title,
-                                organization_name=contact.company
-                            )
-
-                            # Extract contact_id
-                            contact_data = result.get("contact", {})
-                            contact.contact_id = contact_data.get("id")
-
-                            if contact.contact_id:
-                                saved_count += 1
-                        except Exception:
-                            pass  # Continue with other contacts
+        try:
+            # Step 4: Save contacts with valid emails to user's account, concurrently
+            # (the IDs feed steps 5 and 6; failed creates are skipped). Contacts an
+            # earlier job or run already created aren't duplicated, and keep that
+            # job's title and sequence enrollment, so steps 5 and 6 skip them.
+            to_save = [contact for contact in contacts if contact.has_unlocked_email]
+            reused, _ = create_new_contacts(apollo_client, to_save)
+            reused_ids = {id(contact) for contact in reused}
+            contact_ids = [
+                contact.contact_id for contact in to_save
+                if contact.contact_id and id(contact) not in reused_ids
+            ]
+            if reused:
+                messages.append((f"  ✓ {len(reused)} contacts already added for an earlier job; leaving them as they are", False))
 
             # Step 5: Update contacts with job posting title for personalization
-            if saved_count > 0 and job.title:
-                for contact in all_contacts:
-                    if contact.contact_id:
-                        try:
-                            apollo_client.update_contact_with_job_title(contact.contact_id, job.title)
-                        except Exception:
-                            pass  # Continue with other contacts
+            if contact_ids and job.title:
+                apollo_client.bulk_update_contacts_with_job_title(contact_ids, job.title)
 
             # Step 6: Add to sequence
-            if saved_count > 0:
-                contact_ids = [c.contact_id for c in all_contacts if c.contact_id]
-
-                if contact_ids:
-                    try:
-                        apollo_client.add_contacts_to_sequence(
-                            sequence_id=sequence_id,
-                            contact_ids=contact_ids,
-                            sequence_name=sequence_name,
-                            email_account_id=email_account_id
-                        )
-
-                        stats["contacts_added"] += len(contact_ids)
-                        click.echo(f"  ✓ Added {len(contact_ids)} contacts from {job.company} - {job.title}")
-                    except Exception as e:
-                        click.echo(f"  ✗ Failed to add to sequence: {str(e)}", err=True)
-                        stats["failed"] += 1
-                        continue
-                else:
-                    click.echo(f"  ⚠ No valid contacts to add", err=True)
-            else:
-                click.echo(f"  ⚠ No contacts with emails found", err=True)
-
-            stats["successful"] += 1
+            if contact_ids:
+                try:
+                    result = apollo_client.add_contacts_to_sequence(
+                        sequence_id=sequence_id,
+                        contact_ids=contact_ids,
+                        sequence_name=sequence_name,
+                        email_account_id=email_account_id
+                    )
+
+                    outcome["contacts_added"] = result["added_count"]
+                    messages.append((f"  ✓ Added {result['added_count']} contacts from {job.company} - {job.title}", False))
+                except Exception as e:
+                    messages.append((f"  ✗ Failed to add to sequence: {str(e)}", True))
+                    return outcome
+            elif not reused:
+                messages.append(("  ⚠ No contacts with emails found", True))
+
+            outcome["successful"] = True
 
         except Exception as e:
-            click.echo(f"  ✗ Error: {str(e)}", err=True)
-            stats["failed"] += 1
-            continue
-
-        click.echo()
+            messages.append((f"  ✗ Error: {str(e)}", True))
+
+        finally:
+            finish_search(outcome, contacts)
+
+        return outcome
+
+    # Jobs are I/O-bound (Jina, Gemini, Apollo), so several run at once on the shared
+    # clients. Every scrape is queued up front on its own, wider pool; analysis/search
+    # and writing run on separate pools, so Apollo writes for one job overlap with
+    # scraping/analysis of the next. Results are reported from this thread as each
+    # job finishes.
+    pool_size = max(1, min(workers, len(valid_urls)))
+    processed = 0
+    with ThreadPoolExecutor(max_workers=min(SCRAPE_WORKERS, len(valid_urls))) as scrape_pool, \
+            ThreadPoolExecutor(max_workers=pool_size) as fetch_pool, \
+            ThreadPoolExecutor(max_workers=pool_size) as write_pool:
+        pending = {
+            fetch_pool.submit(fetch_job, url, scrape_pool.submit(load_job, url))
+            for url in valid_urls
+        }
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                outcome = future.result()
+                if "contacts" in outcome:
+                    pending.add(write_pool.submit(write_job, outcome))
+                    continue
+
+                # Write each job's report in as few writes as possible: one per run
+                # of consecutive stdout/stderr lines (usually just one)
+                processed += 1
+                report = [
+                    (f"[{processed}/{len(valid_urls)}] Processed: {outcome['url']}", False),
+                    *outcome["messages"],
+                    ("", False),
+                ]
+                for err, group in groupby(report, key=itemgetter(1)):
+                    click.echo("\n".join(message for message, _ in group), err=err)
+
+                stats.total_contacts += outcome["contacts_found"]
+                stats.contacts_added += outcome["contacts_added"]
+                if outcome["successful"]:
+                    stats.successful += 1
+                else:
+                    stats.failed += 1
 
     # Display summary
-    click.echo("=" * 80)
-    click.echo("Summary")
-    click.echo("=" * 80)
-    click.echo(f"Jobs processed: {stats['successful']}/{stats['total_jobs']}")
-    if stats['failed'] > 0:
-        click.echo(f"Jobs failed: {stats['failed']}")
-    click.echo(f"Contacts found: {stats['total_contacts']}")
-    click.echo(f"Contacts added to sequence: {stats['contacts_added']}")
-    click.echo(f"Sequence: {sequence_name}")
-    click.echo()
-    click.echo("Next steps:")
-    click.echo("  1. Log into Apollo.io")
-    click.echo(f"  2. Go to Sequences → '{sequence_name}'")
-    click.echo("  3. Review contacts and manually start the sequence")
-    click.echo()
+    lines = [
+        SEPARATOR,
+        "Summary",
+        SEPARATOR,
+        f"Jobs processed: {stats.successful}/{stats.total_jobs}",
+    ]
+    if stats.failed > 0:
+        lines.append(f"Jobs failed: {stats.failed}")
+    lines.extend([
+        f"Contacts found: {stats.total_contacts}",
+        f"Contacts added to sequence: {stats.contacts_added}",
+        f"Sequence: {sequence_name}",
+        "",
+        "Next steps:",
+        "  1. Log into Apollo.io",
+        f"  2. Go to Sequences → '{sequence_name}'",
+        "  3. Review contacts and manually start the sequence",
+        "",
+    ])
+    click.echo("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+"""
+Shared human-readable output helpers for CLI commands.
+"""
+
+from typing import List
+
+import click
+
+# Banner and section rules used by every command's text output
+SEPARATOR = "=" * 80
+DIVIDER = "-" * 80
+
+
+def _contact_lines(index: int, contact) -> List[str]:
+    """Lines describing one contact, followed by a blank separator line."""
+    lines = [f"  {index}. {contact.name}"]
+    if contact.title:
+        lines.append(f"     Title: {contact.title}")
+    if contact.email:
+        lines.append(f"     Email: {contact.email}")
+    if contact.linkedin_url:
+        lines.append(f"     LinkedIn: {contact.linkedin_url}")
+    lines.append("")
+    return lines
+
+
+def display_apollo_contacts(apollo_contacts, heading: str = "Apollo.io Contacts Found:"):
+    """
+    Display Apollo.io contacts grouped by role.
+
+    Args:
+        apollo_contacts: Dictionary mapping role titles to lists of ApolloContact
+        heading: Banner line printed above the contacts
+    """
+    lines = [SEPARATOR, heading, SEPARATOR, ""]
+
+    for role_title, contacts in apollo_contacts.items():
+        if not contacts:
+            continue
+
+        lines.append(f"Role: {role_title}")
+        lines.append(DIVIDER)
+
+        for i, contact in enumerate(contacts, 1):
+            lines.extend(_contact_lines(i, contact))
+
+        lines.append("")
+
+    click.echo("\n".join(lines))
@@ -3,11 +3,7 @@ CLI command for listing Apollo.io sequences.
 """
 
 import click
-from dotenv import load_dotenv
-from ..core.apollo_search import ApolloClient
-
-# Load environment variables
-load_dotenv()
+from .display import SEPARATOR
 
 
 @click.command()
@@ -21,6 +17,14 @@ def list_sequences():
     Example:
         email-recruiters list-sequences
     """
+    from dotenv import load_dotenv
+
+    # Load environment variables
+    load_dotenv()
+
+    # requests/Apollo client are only needed once the command actually runs
+    from ..core.apollo_search import ApolloClient
+
     try:
         click.echo("Fetching sequences from Apollo.io...")
         click.echo()
@@ -28,19 +32,12 @@ def list_sequences():
         # Initialize Apollo client
         apollo_client = ApolloClient()
 
-        # Get sequences
-        sequences = apollo_client.list_sequences()
-
-        if not sequences:
-            click.echo("No sequences found in your Apollo.io account.")
-            click.echo()
-            click.echo("Create a sequence in Apollo.io web interface first, then run this command again.")
-            return
+        # Print sequences page by page as they arrive
+        count = 0
+        for count, seq in enumerate(apollo_client.iter_sequences(), 1):
+            if count == 1:
+                click.echo(SEPARATOR)
 
-        click.echo(f"Found {len(sequences)} sequence(s):")
-        click.echo("=" * 80)
-
-        for seq in sequences:
             seq_id = seq.get("id", "N/A")
             name = seq.get("name", "Unnamed")
             active = seq.get("active", False)
@@ -48,16 +45,23 @@ def list_sequences():
 
             status = "Active" if active else "Inactive"
 
-            click.echo(f"\nID: {seq_id}")
-            click.echo(f"Name: {name}")
-            click.echo(f"Status: {status}")
-            click.echo(f"Steps: {num_steps}")
+            click.echo(f"\nID: {seq_id}\nName: {name}\nStatus: {status}\nSteps: {num_steps}")
 
-        click.echo()
-        click.echo("=" * 80)
-        click.echo()
-        click.echo("To add contacts to a sequence, use:")
-        click.echo('  ./run_cli.sh analyze <job_url> --search-apollo --add-to-sequence "Sequence Name"')
+        if not count:
+            click.echo("No sequences found in your Apollo.io account.")
+            click.echo()
+            click.echo("Create a sequence in Apollo.io web interface first, then run this command again.")
+            return
+
+        lines = [
+            "",
+            SEPARATOR,
+            f"Found {count} sequence(s).",
+            "",
+            "To add contacts to a sequence, use:",
+            '  ./run_cli.sh analyze <job_url> --search-apollo --add-to-sequence "Sequence Name"',
+        ]
+        click.echo("\n".join(lines))
 
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
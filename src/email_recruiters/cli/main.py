@@ -2,19 +2,57 @@
 Main CLI entry point for email-recruiters.
 """
 
+import importlib
+
 import click
-from dotenv import load_dotenv
-from .analyze import analyze
-from .search_contacts import search_contacts
-from .list_sequences import list_sequences
-from .setup_wizard import setup_wizard
-from .batch_add import batch_add
 
-# Load environment variables
-load_dotenv()
 
+# Subcommand name -> (module in this package, command attribute, short help).
+# Command modules are imported only when their command runs, so `--help` and
+# `--version` don't pay for requests/Apollo/Gemini imports.
+COMMANDS = {
+    "analyze": ("analyze", "analyze", "Analyze a job posting and suggest relevant roles to contact."),
+    "batch-add": ("batch_add", "batch_add", "Batch process multiple job URLs and add contacts to your configured sequence."),
+    "list-sequences": ("list_sequences", "list_sequences", "List all sequences (email campaigns) in your Apollo.io account."),
+    "search-contacts": ("search_contacts", "search_contacts", "Search for contacts on Apollo.io."),
+    "setup": ("setup_wizard", "setup_wizard", "Interactive setup wizard for first-time configuration."),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports each subcommand's module on first use."""
+
+    def list_commands(self, ctx):
+        return sorted(set(COMMANDS) | set(self.commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.commands:
+            return self.commands[cmd_name]
+        if cmd_name not in COMMANDS:
+            return None
 
-@click.group()
+        module_name, attr, _ = COMMANDS[cmd_name]
+        module = importlib.import_module(f".{module_name}", package=__package__)
+        command = getattr(module, attr)
+        self.commands[cmd_name] = command
+        return command
+
+    def format_commands(self, ctx, formatter):
+        """List subcommands from the static table instead of importing every module."""
+        limit = formatter.width - 6 - max(len(name) for name in self.list_commands(ctx))
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in COMMANDS:
+                help_text = COMMANDS[name][2]
+            else:
+                help_text = self.commands[name].get_short_help_str(limit)
+            rows.append((name, click.utils.make_default_short_help(help_text, limit)))
+
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+@click.group(cls=LazyGroup)
 @click.version_option(version="0.1.0")
 def cli():
     """
@@ -22,15 +60,10 @@ def cli():
 
     Analyze job postings and find relevant contacts for cold emailing.
     """
-    pass
-
+    from dotenv import load_dotenv
 
-# Register commands
-cli.add_command(analyze)
-cli.add_command(search_contacts)
-cli.add_command(list_sequences)
-cli.add_command(setup_wizard)
-cli.add_command(batch_add)
+    # Load environment variables only when a command actually runs (not for --help)
+    load_dotenv()
 
 
 if __name__ == "__main__":
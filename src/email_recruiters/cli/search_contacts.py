@@ -2,14 +2,20 @@
 CLI command for searching contacts on Apollo.io.
 """
 
+from dataclasses import dataclass
+from itertools import chain
+from typing import List
+
 import click
-from dotenv import load_dotenv
-from ..core.apollo_search import ApolloClient
-from ..database.db import get_database, save_contacts
-from ..database.models import AnalyzedJob
+from .display import display_apollo_contacts
+
 
-# Load environment variables
-load_dotenv()
+@dataclass
+class SavedRole:
+    """A saved suggested role, detached from its database session."""
+    title: str
+    keywords: List[str]
+    priority: int
 
 
 @click.command()
@@ -64,6 +70,16 @@ def search_contacts(job_id, domain, titles, max_results, save, enrich_emails):
         # Search and save to database (requires job-id)
         email-recruiters search-contacts --job-id 1 --save
     """
+    from dotenv import load_dotenv
+
+    # Load environment variables
+    load_dotenv()
+
+    # SQLAlchemy and the Apollo client are only needed once the command actually runs
+    from ..core.apollo_search import ApolloClient
+    from ..database.db import get_database, save_contacts
+    from ..database.models import AnalyzedJob, job_with_roles_options
+
     try:
         # Initialize Apollo client
         apollo_client = ApolloClient()
@@ -74,7 +90,13 @@ def search_contacts(job_id, domain, titles, max_results, save, enrich_emails):
 
             db = get_database()
             with db.session() as session:
-                job = session.query(AnalyzedJob).filter_by(id=job_id).first()
+                # Load the job and its suggested roles in one round of queries
+                job = (
+                    session.query(AnalyzedJob)
+                    .options(*job_with_roles_options())
+                    .filter_by(id=job_id)
+                    .first()
+                )
 
                 if not job:
                     click.echo(f"Error: Job with ID {job_id} not found", err=True)
@@ -95,14 +117,9 @@ def search_contacts(job_id, domain, titles, max_results, save, enrich_emails):
                     click.echo()
 
                     # Convert database models to objects that apollo_search expects
-                    class RoleSuggestion:
-                        def __init__(self, title, keywords):
-                            self.title = title
-                            self.keywords = keywords
-
                     role_suggestions = [
-                        RoleSuggestion(role.title, role.keywords)
-                        for role in job.suggested_roles
+                        SavedRole(role.title, role.keywords, role.priority)
+                        for role in sorted(job.suggested_roles, key=lambda r: r.priority)
                     ]
 
                     apollo_contacts = apollo_client.search_by_role_suggestions(
@@ -136,8 +153,7 @@ def search_contacts(job_id, domain, titles, max_results, save, enrich_emails):
             # Enrich top N contacts if requested
             if enrich_emails and contacts and enrich_emails > 0:
                 click.echo(f"\nEnriching top {min(enrich_emails, len(contacts))} contacts to unlock emails...")
-                for i, contact in enumerate(contacts[:enrich_emails]):
-                    apollo_client.enrich_contact(contact, domain)
+                apollo_client.enrich_contacts(contacts[:enrich_emails], domain)
 
             apollo_contacts = {"Custom Search": contacts}
 
@@ -146,11 +162,12 @@ def search_contacts(job_id, domain, titles, max_results, save, enrich_emails):
             raise click.Abort()
 
         # Display results
-        total_found = sum(len(contacts) for contacts in apollo_contacts.values())
+        all_contacts = list(chain.from_iterable(apollo_contacts.values()))
+        total_found = len(all_contacts)
         click.echo(f"Found {total_found} contacts!")
         click.echo()
 
-        _display_contacts(apollo_contacts)
+        display_apollo_contacts(apollo_contacts, heading="Contacts Found:")
 
         # Save contacts if requested
         if save:
@@ -161,10 +178,6 @@ def search_contacts(job_id, domain, titles, max_results, save, enrich_emails):
 
             click.echo()
             click.echo("Saving contacts to database...")
-            all_contacts = []
-            for role_contacts in apollo_contacts.values():
-                all_contacts.extend(role_contacts)
-
             saved_count = save_contacts(job_id, all_contacts)
             click.echo(f"Saved {saved_count} new contacts to database!")
 
@@ -173,32 +186,5 @@ def search_contacts(job_id, domain, titles, max_results, save, enrich_emails):
         raise click.Abort()
 
 
-def _display_contacts(apollo_contacts):
-    """Display Apollo.io contacts in human-readable format."""
-    click.echo("=" * 80)
-    click.echo("Contacts Found:")
-    click.echo("=" * 80)
-    click.echo()
-
-    for role_title, contacts in apollo_contacts.items():
-        if not contacts:
-            continue
-
-        click.echo(f"Role: {role_title}")
-        click.echo("-" * 80)
-
-        for i, contact in enumerate(contacts, 1):
-            click.echo(f"  {i}. {contact.name}")
-            if contact.title:
-                click.echo(f"     Title: {contact.title}")
-            if contact.email:
-                click.echo(f"     Email: {contact.email}")
-            if contact.linkedin_url:
-                click.echo(f"     LinkedIn: {contact.linkedin_url}")
-            click.echo()
-
-        click.echo()
-
-
 if __name__ == "__main__":
     search_contacts()
@@ -7,14 +7,12 @@ and configuration setup.
 
 import click
 import os
-from dotenv import load_dotenv
 from ..config import (
     load_config,
-    save_config,
-    validate_apollo_key,
+    save_config_values,
     fuzzy_match_sequence,
 )
-from ..core.apollo_search import ApolloClient
+from .display import SEPARATOR, DIVIDER
 
 
 @click.command(name="setup")
@@ -24,9 +22,9 @@ def setup_wizard():
 
     Validates API keys, helps select default sequence, and saves preferences.
     """
-    click.echo("=" * 80)
+    click.echo(SEPARATOR)
     click.echo("EmailRecruiters Setup Wizard")
-    click.echo("=" * 80)
+    click.echo(SEPARATOR)
     click.echo()
 
     # Load existing config
@@ -34,7 +32,7 @@ def setup_wizard():
 
     # Step 1: Check API Keys
     click.echo("Step 1: Checking API Keys")
-    click.echo("-" * 80)
+    click.echo(DIVIDER)
 
     missing_keys = []
 
@@ -68,12 +66,17 @@ def setup_wizard():
 
     # Step 2: Validate Apollo API Key
     click.echo("Step 2: Validating Apollo.io API Key")
-    click.echo("-" * 80)
+    click.echo(DIVIDER)
 
     apollo_key = config["apollo_api_key"]
     click.echo("Testing Apollo.io connection...")
 
-    if not validate_apollo_key(apollo_key):
+    # Listing sequences validates the key, and the same list is used in Step 3
+    from ..core.apollo_search import ApolloClient
+    try:
+        apollo_client = ApolloClient(api_key=apollo_key)
+        sequences = apollo_client.list_sequences()
+    except Exception:
         click.echo("✗ Apollo.io API key is invalid!", err=True)
         click.echo()
         click.echo("Please check your APOLLO_API_KEY in .env file.")
@@ -85,15 +88,9 @@ def setup_wizard():
 
     # Step 3: Select Default Sequence
     click.echo("Step 3: Select Default Sequence")
-    click.echo("-" * 80)
+    click.echo(DIVIDER)
 
     try:
-        apollo_client = ApolloClient(api_key=apollo_key)
-
-        # Fetch sequences
-        click.echo("Fetching your Apollo.io sequences...")
-        sequences = apollo_client.list_sequences()
-
         if not sequences:
             click.echo("No sequences found in your Apollo.io account.", err=True)
             click.echo("Please create a sequence in Apollo.io first.")
@@ -129,7 +126,7 @@ def setup_wizard():
                 selected_sequence = sequences[idx]
         except ValueError:
             # Not a number, try fuzzy matching
-            matches = fuzzy_match_sequence(selection, sequences)
+            matches = fuzzy_match_sequence(selection, sequences, limit=3)
 
             if not matches:
                 click.echo(f"No sequences found matching '{selection}'", err=True)
@@ -139,13 +136,12 @@ def setup_wizard():
                 selected_sequence = matches[0]
             else:
                 # Multiple matches, show top 3
-                click.echo()
-                click.echo("Multiple matches found:")
-                for i, seq in enumerate(matches[:3], 1):
-                    click.echo(f"  {i}. {seq.get('name')}")
+                lines = ["", "Multiple matches found:"]
+                lines.extend(f"  {i}. {seq.get('name')}" for i, seq in enumerate(matches, 1))
+                click.echo("\n".join(lines))
 
                 choice = click.prompt("Select one (1-3)", type=int)
-                if 1 <= choice <= min(3, len(matches)):
+                if 1 <= choice <= len(matches):
                     selected_sequence = matches[choice - 1]
 
         if not selected_sequence:
@@ -184,16 +180,18 @@ def setup_wizard():
         # Step 4: Save Configuration
         click.echo()
         click.echo("Step 4: Saving Configuration")
-        click.echo("-" * 80)
+        click.echo(DIVIDER)
 
-        save_config("DEFAULT_SEQUENCE_NAME", seq_name, user_config=True)
-        save_config("DEFAULT_SEQUENCE_ID", seq_id, user_config=True)
-        save_config("DEFAULT_EMAIL_ACCOUNT_ID", email_account_id, user_config=True)
+        save_config_values({
+            "DEFAULT_SEQUENCE_NAME": seq_name,
+            "DEFAULT_SEQUENCE_ID": seq_id,
+            "DEFAULT_EMAIL_ACCOUNT_ID": email_account_id,
+        }, user_config=True)
 
         click.echo()
-        click.echo("=" * 80)
+        click.echo(SEPARATOR)
         click.echo("✓ Setup Complete!")
-        click.echo("=" * 80)
+        click.echo(SEPARATOR)
         click.echo()
         click.echo("Configuration saved:")
         click.echo(f"  Sequence: {seq_name}")
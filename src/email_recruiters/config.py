@@ -5,19 +5,49 @@ Handles loading, saving, and validating user configuration including
 Apollo API key, default sequence, and email account settings.
 """
 
+import functools
+import heapq
 import os
+import re
+import tempfile
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, Dict, Any
-from dotenv import load_dotenv, set_key, find_dotenv
+from typing import Optional, Dict, Any, Tuple
 
 # Config file location
 CONFIG_DIR = Path.home() / ".email_recruiters"
 CONFIG_FILE = CONFIG_DIR / "config.env"
 
+# Configuration key -> (environment variable, default value)
+CONFIG_KEYS: Dict[str, Tuple[str, Optional[str]]] = {
+    "apollo_api_key": ("APOLLO_API_KEY", None),
+    "gemini_api_key": ("GEMINI_API_KEY", None),
+    "jina_api_key": ("JINA_API_KEY", None),
+    "default_sequence_name": ("DEFAULT_SEQUENCE_NAME", None),
+    "default_sequence_id": ("DEFAULT_SEQUENCE_ID", None),
+    "default_email_account_id": ("DEFAULT_EMAIL_ACCOUNT_ID", None),
+    "default_max_contacts_per_role": ("DEFAULT_MAX_CONTACTS_PER_ROLE", "3"),
+    "default_enrich_count": ("DEFAULT_ENRICH_COUNT", "5"),
+}
+
+# Minimum rapidfuzz WRatio (0-100) for a typo-tolerant sequence name match
+TYPO_MATCH_CUTOFF = 70
+
+# Matches the key of a KEY=value (or export KEY=value) line in a .env file
+ENV_KEY_PATTERN = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_.]*)\s*=")
+
+
+# Set once the config directory is known to exist, so later saves skip the mkdir
+_config_dir_ready = False
+
 
 def ensure_config_dir():
-    """Ensure the config directory exists."""
+    """Ensure the config directory exists (checked once per process)."""
+    global _config_dir_ready
+    if _config_dir_ready:
+        return
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    _config_dir_ready = True
 
 
 def load_config() -> Dict[str, Optional[str]]:
@@ -28,9 +58,19 @@ def load_config() -> Dict[str, Optional[str]]:
     1. Project .env file (for API keys)
     2. User config file ~/.email_recruiters/config.env (for preferences)
 
+    The files are read once per process; saving a value updates the
+    environment and clears the cache, so the next call sees it.
+
     Returns:
         Dictionary with configuration values
     """
+    return dict(_load_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> Dict[str, Optional[str]]:
+    from dotenv import load_dotenv, find_dotenv
+
     # Load project .env first
     project_env = find_dotenv()
     if project_env:
@@ -40,16 +80,8 @@ def load_config() -> Dict[str, Optional[str]]:
     if CONFIG_FILE.exists():
         load_dotenv(CONFIG_FILE)
 
-    return {
-        "apollo_api_key": os.getenv("APOLLO_API_KEY"),
-        "gemini_api_key": os.getenv("GEMINI_API_KEY"),
-        "jina_api_key": os.getenv("JINA_API_KEY"),
-        "default_sequence_name": os.getenv("DEFAULT_SEQUENCE_NAME"),
-        "default_sequence_id": os.getenv("DEFAULT_SEQUENCE_ID"),
-        "default_email_account_id": os.getenv("DEFAULT_EMAIL_ACCOUNT_ID"),
-        "default_max_contacts_per_role": os.getenv("DEFAULT_MAX_CONTACTS_PER_ROLE", "3"),
-        "default_enrich_count": os.getenv("DEFAULT_ENRICH_COUNT", "5"),
-    }
+    environ = os.environ
+    return {key: environ.get(env_var, default) for key, (env_var, default) in CONFIG_KEYS.items()}
 
 
 def save_config(key: str, value: str, user_config: bool = True) -> bool:
@@ -65,6 +97,27 @@ def save_config(key: str, value: str, user_config: bool = True) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    return save_config_values({key: value}, user_config=user_config)
+
+
+def save_config_values(values: Dict[str, str], user_config: bool = True) -> bool:
+    """
+    Save several configuration values with a single rewrite of the config file.
+
+    Existing lines for the given keys are replaced in place, other lines
+    (including comments) are kept, and new keys are appended. The file is
+    replaced atomically, so a crash never leaves it half written.
+
+    Args:
+        values: Dictionary of configuration key -> value
+        user_config: If True, saves to user config (~/.email_recruiters/config.env)
+                    If False, saves to project .env
+
+    Returns:
+        True if successful, False otherwise
+    """
+    from dotenv import find_dotenv
+
     try:
         if user_config:
             ensure_config_dir()
@@ -77,19 +130,57 @@ def save_config(key: str, value: str, user_config: bool = True) -> bool:
             else:
                 target_file = project_env
 
-        set_key(target_file, key, value)
+        _rewrite_env_file(target_file, values)
+
+        # load_dotenv never overrides variables that are already set, so without
+        # this the next load_config() in this process would still see the old values
+        os.environ.update(values)
         return True
     except Exception as e:
         print(f"Error saving config: {e}")
         return False
+    finally:
+        _load_config.cache_clear()
+
+
+def _rewrite_env_file(path: str, values: Dict[str, str]) -> None:
+    """Write values into a .env file (quoted like dotenv's set_key) and atomically replace it."""
+    lines = []
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+
+    def format_line(key: str, value: str) -> str:
+        escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+        return f"{key}='{escaped}'"
+
+    remaining = dict(values)
+    for i, line in enumerate(lines):
+        match = ENV_KEY_PATTERN.match(line)
+        if match and match.group(1) in remaining:
+            key = match.group(1)
+            lines[i] = format_line(key, remaining.pop(key))
+    lines.extend(format_line(key, value) for key, value in remaining.items())
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".env.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
 
 
-def validate_apollo_key(api_key: str) -> bool:
+def validate_apollo_key(api_key: str, require_master: bool = False) -> bool:
     """
-    Validate Apollo API key by making a test API call.
+    Validate Apollo API key by making a small test API call.
 
     Args:
         api_key: Apollo API key to validate
+        require_master: Also require access to the sequences API, which only
+            master API keys have
 
     Returns:
         True if valid, False otherwise
@@ -97,8 +188,12 @@ def validate_apollo_key(api_key: str) -> bool:
     try:
         from .core.apollo_search import ApolloClient
         client = ApolloClient(api_key=api_key)
-        # Try to list sequences as a validation check
-        client.list_sequences()
+        if require_master:
+            # The first page of sequences is enough to prove sequences access
+            next(client.iter_sequences(), None)
+        else:
+            # A one-person search is the cheapest authenticated call
+            client.search_people(per_page=1)
         return True
     except Exception:
         return False
@@ -123,58 +218,93 @@ def get_sequence_config() -> Optional[Dict[str, str]]:
     return None
 
 
-def clear_sequence_config():
-    """Clear sequence configuration."""
-    save_config("DEFAULT_SEQUENCE_NAME", "", user_config=True)
-    save_config("DEFAULT_SEQUENCE_ID", "", user_config=True)
-    save_config("DEFAULT_EMAIL_ACCOUNT_ID", "", user_config=True)
+def clear_sequence_config() -> bool:
+    """
+    Clear sequence configuration.
 
+    The three sequence keys are blanked with a single atomic rewrite of the
+    user config file.
 
-def fuzzy_match_sequence(query: str, sequences: list) -> list:
+    Returns:
+        True if successful, False otherwise
+    """
+    return save_config_values({
+        "DEFAULT_SEQUENCE_NAME": "",
+        "DEFAULT_SEQUENCE_ID": "",
+        "DEFAULT_EMAIL_ACCOUNT_ID": "",
+    }, user_config=True)
+
+
+def fuzzy_match_sequence(query: str, sequences: list, limit: Optional[int] = None) -> list:
     """
     Fuzzy match a sequence name query against available sequences.
 
     Args:
         query: User's query string
         sequences: List of sequence dictionaries from Apollo API
+        limit: Optional maximum number of matches to return (the best ones)
 
     Returns:
-        List of matching sequences, sorted by relevance
+        List of matching sequences, sorted by relevance. If no name contains
+        every query word and rapidfuzz is installed, names within a few typos
+        of the query are returned instead.
     """
     query_lower = query.lower()
+    # Each distinct word is checked once, longest (usually most selective) first,
+    # so most non-matching names are rejected by the first check
+    query_words = sorted(set(query_lower.split()), key=len, reverse=True)
     matches = []
 
-    for seq in sequences:
-        name = seq.get("name", "")
-        name_lower = name.lower()
-
-        # Calculate match score
-        score = 0
-
-        # Exact match
-        if name_lower == query_lower:
-            score = 100
-        # Starts with query
-        elif name_lower.startswith(query_lower):
-            score = 80
-        # Contains query
-        elif query_lower in name_lower:
+    # Lowercase each name once up front (a missing or null "name" matches nothing)
+    lowered = [((seq.get("name") or "").lower(), seq) for seq in sequences]
+
+    for name_lower, seq in lowered:
+        # Cheapest rejection first: a match of any tier contains every query word
+        if not all(word in name_lower for word in query_words):
+            continue
+
+        # One search decides the tier: exact (100), starts with (80),
+        # contains (60), or only contains all the words (40)
+        position = name_lower.find(query_lower)
+        if position == 0:
+            score = 100 if len(name_lower) == len(query_lower) else 80
+        elif position > 0:
             score = 60
-        # Contains all words from query
         else:
-            query_words = query_lower.split()
-            if all(word in name_lower for word in query_words):
-                score = 40
+            score = 40
+
+        matches.append((score, seq))
 
-        if score > 0:
-            matches.append((score, seq))
+    # Nothing contains the query words; with rapidfuzz installed, allow for typos
+    if not matches and query_words:
+        return _typo_tolerant_matches(query_lower, lowered, limit)
 
-    # Sort by score (highest first)
-    matches.sort(key=lambda x: x[0], reverse=True)
+    # Highest score first; ties keep the API's order (nlargest is stable too)
+    if limit is not None:
+        matches = heapq.nlargest(limit, matches, key=itemgetter(0))
+    else:
+        matches.sort(key=itemgetter(0), reverse=True)
 
     return [seq for score, seq in matches]
 
 
+def _typo_tolerant_matches(query_lower: str, lowered: list, limit: Optional[int]) -> list:
+    """Rank (name_lower, seq) pairs by edit-distance similarity, if rapidfuzz is installed."""
+    try:
+        from rapidfuzz import fuzz, process
+    except ImportError:
+        return []
+
+    results = process.extract(
+        query_lower,
+        [name_lower for name_lower, _ in lowered],
+        scorer=fuzz.WRatio,
+        limit=limit,
+        score_cutoff=TYPO_MATCH_CUTOFF
+    )
+    return [lowered[index][1] for _, _, index in results]
+
+
 def is_configured() -> bool:
     """
     Check if the tool is fully configured.
@@ -2,8 +2,18 @@
 Core functionality for job scraping and role analysis.
 """
 
-from .job_scraper import JobScraper, JobPosting, scrape_job
-from .role_analyzer import RoleAnalyzer, ContactRole, analyze_job
+import importlib
+
+# Submodules are loaded on first attribute access so that importing e.g.
+# core.apollo_search doesn't also pull in the Gemini SDK.
+_LAZY_ATTRS = {
+    "JobScraper": ".job_scraper",
+    "JobPosting": ".job_scraper",
+    "scrape_job": ".job_scraper",
+    "RoleAnalyzer": ".role_analyzer",
+    "ContactRole": ".role_analyzer",
+    "analyze_job": ".role_analyzer",
+}
 
 __all__ = [
     "JobScraper",
@@ -13,3 +23,10 @@ __all__ = [
     "ContactRole",
     "analyze_job",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,376 @@
+"""
+Cache for job analysis results.
+
+Lets the analyze command skip the Jina scrape and the Gemini call when a job
+URL has already been analyzed with the same model and prompt, and skip just the
+Gemini call when a freshly scraped posting has the same content as one analyzed
+before. Optionally, near-duplicate postings (cosine similarity of their content
+embeddings above a threshold) can reuse each other's analysis as well. Recently
+used entries are kept in memory for the current process, and all entries are
+persisted in the SQLite database.
+
+Database errors in lookups and writes are swallowed, and payloads that can't be
+decoded count as misses: a broken cache means a fresh analysis, never a failed one.
+"""
+
+import hashlib
+import math
+import operator
+import re
+import threading
+from array import array
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from . import fast_json
+from .job_scraper import JobPosting
+from .role_analyzer import RoleAnalyzer, ContactRole
+from .scrape_cache import get_cached_page
+from ..database.db import (
+    get_cached_analysis,
+    set_cached_analysis,
+    iter_analysis_embeddings,
+    get_analysis_embedding_payload,
+    set_analysis_embedding,
+    get_analyzed_job_by_url,
+)
+
+CachedAnalysis = Tuple[JobPosting, Dict[str, str], List[ContactRole]]
+
+CachedRoles = Tuple[Dict[str, str], List[ContactRole]]
+
+# How long a content-keyed analysis stays valid
+CONTENT_CACHE_TTL = timedelta(days=30)
+
+# Legal-form words ignored when comparing company names ("Acme, Inc." == "Acme")
+COMPANY_SUFFIXES = frozenset({"inc", "llc", "ltd", "co", "corp", "corporation", "company", "gmbh", "plc"})
+
+# Raised decoding a malformed or older-shaped payload, which is treated as a miss
+PAYLOAD_ERRORS = (ValueError, KeyError, TypeError)
+
+# In-process layer: cache_key -> (version, payload), least recently used evicted first
+MEMORY_CACHE_SIZE = 256
+_memory_cache: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def analysis_version(model: str = RoleAnalyzer.DEFAULT_MODEL) -> str:
+    """Version string for cached analyses produced by the given model and current prompt."""
+    return f"{model}:{RoleAnalyzer.PROMPT_HASH}"
+
+
+def _url_key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def _content_key(raw_content: str) -> str:
+    return hashlib.sha256(f"content:{raw_content}".encode("utf-8")).hexdigest()
+
+
+def _remember(key: str, version: str, payload: str) -> None:
+    with _memory_lock:
+        _memory_cache[key] = (version, payload)
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def _load(key: str, version: str, max_age: Optional[timedelta] = None) -> Optional[str]:
+    """Payload for key from memory or the database, or None on a miss or error."""
+    with _memory_lock:
+        cached = _memory_cache.get(key)
+        if cached and cached[0] == version:
+            _memory_cache.move_to_end(key)
+            return cached[1]
+
+    try:
+        payload = get_cached_analysis(key, version, max_age=max_age)
+    except Exception:
+        return None
+    if payload is not None:
+        _remember(key, version, payload)
+    return payload
+
+
+def _store(key: str, version: str, payload: str) -> None:
+    _remember(key, version, payload)
+    try:
+        set_cached_analysis(key, version, payload)
+    except Exception:
+        pass
+
+
+def _decode_roles(payload: str) -> Optional[CachedRoles]:
+    """(job_info, roles) from a content-keyed payload, or None if it can't be decoded."""
+    try:
+        data = fast_json.loads(payload)
+        return data["job_info"], [ContactRole(**role) for role in data["suggested_roles"]]
+    except PAYLOAD_ERRORS:
+        return None
+
+
+def get_cached(url: str, version: str) -> Optional[CachedAnalysis]:
+    """
+    Get a cached analysis for a job URL.
+
+    Args:
+        url: Job posting URL
+        version: Analyzer version (see analysis_version)
+
+    Returns:
+        Tuple of (JobPosting, job_info dict, list of ContactRole), or None on a miss
+    """
+    payload = _load(_url_key(url), version)
+    if payload is None:
+        return None
+
+    try:
+        data = fast_json.loads(payload)
+        job = JobPosting(**data["job"])
+        page_key = data.get("raw_content_key")
+        job_info = data["job_info"]
+        roles = [ContactRole(**role) for role in data["suggested_roles"]]
+    except PAYLOAD_ERRORS:
+        return None
+    if page_key:
+        # The page itself is kept once, in the scraped page cache (see put_cached)
+        job.raw_content = get_cached_page(url, max_age=None)
+        if job.raw_content is None or _content_key(job.raw_content) != page_key:
+            return None
+    if job.description is None:
+        job.description = job.raw_content
+    return job, job_info, roles
+
+
+def get_saved(url: str) -> Optional[CachedAnalysis]:
+    """
+    Rebuild an analysis from a job previously saved with `analyze --save`.
+
+    Saved jobs don't record which model or prompt produced them, so this is a
+    fallback for URLs analyzed before the analysis cache existed (or whose
+    cache entry has been invalidated).
+
+    Args:
+        url: Job posting URL
+
+    Returns:
+        Tuple of (JobPosting, job_info dict, list of ContactRole), or None if the
+        URL was never saved or has no suggested roles
+    """
+    try:
+        saved = get_analyzed_job_by_url(url)
+    except Exception:
+        return None
+    if not saved or not saved["suggested_roles"]:
+        return None
+
+    job = JobPosting(
+        url=saved["url"],
+        description=saved["description"],
+        raw_content=saved["raw_content"],
+    )
+    job_info = {
+        "title": saved["title"],
+        "company": saved["company"],
+        "location": saved["location"],
+        "company_domain": saved["company_domain"],
+        "linkedin_company": saved["linkedin_company_url"],
+    }
+    roles = [ContactRole(**role) for role in saved["suggested_roles"]]
+    return job, job_info, roles
+
+
+def put_cached(
+    url: str,
+    version: str,
+    job: JobPosting,
+    job_info: Dict[str, str],
+    roles: List[ContactRole]
+) -> None:
+    """
+    Cache an analysis for a job URL.
+
+    Args:
+        url: Job posting URL
+        version: Analyzer version (see analysis_version)
+        job: JobPosting as returned by the scraper
+        job_info: Job info extracted by the analyzer
+        roles: Suggested roles from the analyzer
+    """
+    job_data = job.to_dict()
+    if job_data["description"] == job_data["raw_content"]:
+        # Usually identical (see JobScraper.scrape_job_posting); restored by get_cached
+        job_data["description"] = None
+    raw_content_key = None
+    if job.raw_content and get_cached_page(url, max_age=None) == job.raw_content:
+        # Already stored (compressed) by the scraper; get_cached reads it back from there
+        raw_content_key = _content_key(job.raw_content)
+        job_data["raw_content"] = None
+    payload = fast_json.dumps({
+        "job": job_data,
+        "raw_content_key": raw_content_key,
+        "job_info": job_info,
+        "suggested_roles": [role.to_dict() for role in roles],
+    })
+    _store(_url_key(url), version, payload)
+
+
+def get_cached_roles(raw_content: str, version: str) -> Optional[CachedRoles]:
+    """
+    Get a cached analysis for scraped job content.
+
+    Args:
+        raw_content: Raw content returned by the scraper
+        version: Analyzer version (see analysis_version)
+
+    Returns:
+        Tuple of (job_info dict, list of ContactRole), or None on a miss
+    """
+    if not raw_content:
+        return None
+
+    payload = _load(_content_key(raw_content), version, max_age=CONTENT_CACHE_TTL)
+    if payload is None:
+        return None
+
+    return _decode_roles(payload)
+
+
+def put_cached_roles(
+    raw_content: str,
+    version: str,
+    job_info: Dict[str, str],
+    roles: List[ContactRole]
+) -> None:
+    """
+    Cache an analysis for scraped job content.
+
+    Args:
+        raw_content: Raw content returned by the scraper
+        version: Analyzer version (see analysis_version)
+        job_info: Job info extracted by the analyzer
+        roles: Suggested roles from the analyzer
+    """
+    if not raw_content:
+        return
+
+    payload = fast_json.dumps({
+        "job_info": job_info,
+        "suggested_roles": [role.to_dict() for role in roles],
+    })
+    _store(_content_key(raw_content), version, payload)
+
+
+def _normalize(embedding: Sequence[float]) -> array:
+    """L2-normalize an embedding into a float32 array, so a dot product is the cosine similarity."""
+    norm = math.sqrt(sum(x * x for x in embedding)) or 1.0
+    return array("f", (x / norm for x in embedding))
+
+
+def find_similar_roles(
+    embedding: Sequence[float],
+    version: str,
+    threshold: float
+) -> Optional[Tuple[float, CachedRoles]]:
+    """
+    Find the cached analysis whose content embedding is most similar to this one.
+
+    Args:
+        embedding: Content embedding of the posting being analyzed
+        version: Analyzer version (see analysis_version)
+        threshold: Minimum cosine similarity for a match
+
+    Returns:
+        Tuple of (similarity, (job_info dict, list of ContactRole)), or None if nothing
+        is at least `threshold` similar
+    """
+    query = _normalize(embedding)
+
+    best_score = -1.0
+    best_key = None
+    try:
+        # Embeddings are streamed in batches; only the best match's payload is loaded
+        for cache_key, blob in iter_analysis_embeddings(version):
+            stored = array("f")
+            stored.frombytes(blob)
+            if len(stored) != len(query):
+                continue
+            score = sum(map(operator.mul, stored, query))
+            if score > best_score:
+                best_score, best_key = score, cache_key
+
+        if best_key is None or best_score < threshold:
+            return None
+
+        payload = get_analysis_embedding_payload(best_key)
+    except Exception:
+        return None
+
+    if payload is None:
+        return None
+
+    cached_roles = _decode_roles(payload)
+    if cached_roles is None:
+        return None
+    return best_score, cached_roles
+
+
+def _company_key(name: Optional[str]) -> str:
+    words = re.findall(r"[a-z0-9]+", (name or "").lower())
+    return " ".join(word for word in words if word not in COMPANY_SUFFIXES)
+
+
+def reuse_similar_roles(job: JobPosting, similar: CachedRoles) -> Optional[CachedRoles]:
+    """
+    Adopt a near-duplicate posting's suggested roles for a freshly scraped job.
+
+    Postings that share boilerplate can still be for another role, so only the
+    roles (and the company's domain and LinkedIn page) are reused; the title and
+    location are this posting's own, as extracted by the scraper.
+
+    Args:
+        job: JobPosting as returned by the scraper
+        similar: (job_info dict, list of ContactRole) found by find_similar_roles
+
+    Returns:
+        Tuple of (job_info dict, list of ContactRole) for this job, or None if the
+        postings aren't from the same company or the job's title is unknown
+    """
+    job_info, roles = similar
+    company = _company_key(job.company)
+    if not job.title or not company or company != _company_key(job_info.get("company")):
+        return None
+    return {**job_info, "title": job.title, "location": job.location}, roles
+
+
+def put_similarity_entry(
+    raw_content: str,
+    version: str,
+    embedding: Sequence[float],
+    job_info: Dict[str, str],
+    roles: List[ContactRole]
+) -> None:
+    """
+    Store an analysis so later near-duplicate postings can find it by embedding.
+
+    Args:
+        raw_content: Raw content returned by the scraper
+        version: Analyzer version (see analysis_version)
+        embedding: Content embedding of the posting
+        job_info: Job info extracted by the analyzer
+        roles: Suggested roles from the analyzer
+    """
+    payload = fast_json.dumps({
+        "job_info": job_info,
+        "suggested_roles": [role.to_dict() for role in roles],
+    })
+    try:
+        set_analysis_embedding(
+            _content_key(raw_content or ""),
+            version,
+            _normalize(embedding).tobytes(),
+            payload
+        )
+    except Exception:
+        pass
@@ -5,13 +5,47 @@ This module provides integration with Apollo.io's People Search API
 to find actual contacts at companies based on job titles and domains.
 """
 
+import asyncio
+import functools
+import hashlib
+import heapq
 import os
+import random
+import sys
+import threading
+import time
 import requests
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator, List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass, replace
+from email.utils import parsedate_to_datetime
+from operator import itemgetter
+from types import MappingProxyType
 
+from . import fast_json
+from .http import Http2Session, create_session
+from .ttl_cache import ttl_lru_cache
 
-@dataclass
+# Placeholder Apollo returns in place of emails that haven't been unlocked yet
+LOCKED_EMAIL_PLACEHOLDER = "email_not_unlocked@domain.com"
+
+# Email values that don't identify a reachable person
+LOCKED_EMAILS = frozenset({None, "", LOCKED_EMAIL_PLACEHOLDER})
+
+# Query-string spelling of boolean flags
+QUERY_BOOLEANS = {True: "true", False: "false"}
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+; searches can
+# return hundreds of contacts, so use them where available
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Normalize a sequence/custom field name for case-insensitive lookups."""
+    return (name or "").strip().lower()
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ApolloContact:
     """Represents a contact found via Apollo.io."""
     name: str
@@ -36,6 +70,18 @@ class ApolloContact:
             "contact_id": self.contact_id
         }
 
+    @property
+    def has_unlocked_email(self) -> bool:
+        """Whether the contact has a real (unlocked) email address."""
+        return self.email not in LOCKED_EMAILS
+
+    def split_name(self) -> Tuple[str, str]:
+        """Split the full name into (first_name, last_name) on the first space."""
+        # Surrounding/doubled whitespace would otherwise give an empty first name
+        # or a last name starting with a space
+        first_name, _, last_name = self.name.strip().partition(" ")
+        return first_name, last_name.lstrip()
+
 
 class ApolloClient:
     """Client for interacting with Apollo.io API."""
@@ -43,19 +89,75 @@ class ApolloClient:
     API_BASE_URL = "https://api.apollo.io"
     PEOPLE_SEARCH_ENDPOINT = "/api/v1/mixed_people/search"
     PEOPLE_ENRICHMENT_ENDPOINT = "/api/v1/people/match"
+    PEOPLE_BULK_ENRICHMENT_ENDPOINT = "/api/v1/people/bulk_match"
     SEQUENCES_SEARCH_ENDPOINT = "/api/v1/emailer_campaigns/search"
     SEQUENCES_ADD_CONTACTS_ENDPOINT = "/api/v1/emailer_campaigns/{sequence_id}/add_contact_ids"
     CUSTOM_FIELDS_ENDPOINT = "/api/v1/typed_custom_fields"
     UPDATE_CONTACT_ENDPOINT = "/api/v1/contacts/{contact_id}"
+    BULK_UPDATE_CONTACTS_ENDPOINT = "/api/v1/contacts/bulk_update"
     CREATE_CONTACT_ENDPOINT = "/v1/contacts"
     EMAIL_ACCOUNTS_ENDPOINT = "/api/v1/email_accounts"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Maximum number of contact IDs Apollo accepts in a single bulk request
+    BULK_BATCH_SIZE = 100
+
+    # Maximum number of people Apollo matches in a single bulk enrichment request
+    BULK_ENRICHMENT_BATCH_SIZE = 10
+
+    # Sequences requested per page when listing sequences
+    SEQUENCES_PAGE_SIZE = 100
+
+    # The people search API returns at most this many people per page
+    PEOPLE_PAGE_SIZE = 100
+
+    # How long account metadata (email accounts, custom fields) is cached
+    METADATA_CACHE_TTL_SECONDS = 300
+
+    # How long people search results are reused for the same domain and titles
+    SEARCH_CACHE_TTL_SECONDS = 600
+
+    # Concurrency cap for per-role searches, across all threads using the client
+    # (keeps us under Apollo's rate limit)
+    MAX_CONCURRENT_SEARCHES = 5
+
+    # Concurrency cap for enrichment (email unlock) requests, across all threads using the client
+    MAX_CONCURRENT_ENRICHMENTS = 5
+
+    # Concurrency cap for sequence-add batches after the first one
+    MAX_CONCURRENT_SEQUENCE_ADDS = 4
+
+    # Concurrency cap for create-contact requests in create_contacts
+    MAX_CONCURRENT_CONTACT_CREATES = 8
+
+    # Retry settings for rate-limited (429), transient server (5xx) and timed-out requests
+    MAX_RETRIES = 4
+    RETRY_BACKOFF_SECONDS = 1.0
+    MAX_RETRY_BACKOFF_SECONDS = 30.0
+
+    # Per-request timeouts (to connect, and between bytes of the response) so a
+    # stalled connection can't hang the CLI or hold a thread pool slot
+    CONNECT_TIMEOUT_SECONDS = 5
+    REQUEST_TIMEOUT_SECONDS = 30
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        use_http2: bool = False
+    ):
         """
         Initialize Apollo.io client.
 
         Args:
             api_key: Apollo.io API key. If not provided, will try to load from APOLLO_API_KEY env var.
+            session: Optional requests session to share with other clients (see http.create_session)
+            use_http2: Send requests over one multiplexed HTTP/2 connection (needs the
+                http2 extra). Ignored when a session is passed.
+
+        Raises:
+            ValueError: If no API key is available
+            ImportError: If use_http2 is set but httpx isn't installed
         """
         self.api_key = api_key or os.getenv("APOLLO_API_KEY")
         if not self.api_key:
@@ -64,6 +166,107 @@ class ApolloClient:
                 "or pass api_key parameter."
             )
 
+        # Identifies the account in per-process caches without keeping the raw key in cache keys
+        self.api_key_hash = hashlib.sha256(self.api_key.encode("utf-8")).hexdigest()[:16]
+
+        # Shared session so keep-alive connections are reused across calls and threads.
+        # The headers are passed per request rather than set on the session, since the
+        # session may be shared with clients for other hosts. They're built once and
+        # read-only, since every request (from any thread) sends the same mapping.
+        self._owns_session = session is None
+        self.session = session or (Http2Session() if use_http2 else create_session())
+        self.headers = MappingProxyType({
+            "Cache-Control": "no-cache",
+            "Content-Type": "application/json",
+            "X-Api-Key": self.api_key
+        })
+
+        # Batch runs search and enrich for several jobs at once on one client; these
+        # keep the total number of in-flight search/enrichment requests under the caps
+        self._search_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_SEARCHES)
+        self._enrichment_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_ENRICHMENTS)
+
+        # After a 429, every thread sharing this client waits until this monotonic
+        # time before sending, instead of each one hitting the rate limit again
+        self._throttled_until = 0.0
+        self._throttle_lock = threading.Lock()
+
+    def close(self) -> None:
+        """
+        Close the client's pooled connections.
+
+        A session passed in by the caller is left open, since other clients may
+        still be using it; whoever created it closes it.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "ApolloClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request on the shared session, retrying timeouts and 429 and
+        transient 5xx responses.
+
+        The wait before each retry is the server's Retry-After when given, and
+        otherwise exponential backoff with jitter. A 429 also pauses every other
+        request on this client for that long.
+
+        Returns:
+            The final response (which may still be an error once retries are exhausted)
+
+        Raises:
+            requests.exceptions.Timeout: If the last attempt times out
+        """
+        kwargs.setdefault("timeout", (self.CONNECT_TIMEOUT_SECONDS, self.REQUEST_TIMEOUT_SECONDS))
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            self._wait_for_throttle()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.Timeout:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                continue
+
+            if response.status_code not in self.RETRYABLE_STATUS_CODES or attempt == self.MAX_RETRIES:
+                return response
+
+            delay = self._retry_delay(attempt, response)
+            if response.status_code == 429:
+                with self._throttle_lock:
+                    self._throttled_until = max(self._throttled_until, time.monotonic() + delay)
+            time.sleep(delay)
+
+    def _wait_for_throttle(self) -> None:
+        with self._throttle_lock:
+            remaining = self._throttled_until - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Seconds to wait before retry number `attempt`, capped at MAX_RETRY_BACKOFF_SECONDS."""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            # Either a number of seconds or an HTTP date
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(self.MAX_RETRY_BACKOFF_SECONDS, max(0.0, delay))
+
+        delay = self.RETRY_BACKOFF_SECONDS * (2 ** attempt) * random.uniform(0.5, 1.5)
+        return min(self.MAX_RETRY_BACKOFF_SECONDS, delay)
+
     def search_people(
         self,
         organization_domains: Optional[List[str]] = None,
@@ -90,12 +293,6 @@ class ApolloClient:
         """
         url = f"{self.API_BASE_URL}{self.PEOPLE_SEARCH_ENDPOINT}"
 
-        headers = {
-            "Cache-Control": "no-cache",
-            "Content-Type": "application/json",
-            "X-Api-Key": self.api_key
-        }
-
         # Build request payload
         payload = {
             "per_page": min(per_page, 100),  # Cap at 100
@@ -115,9 +312,9 @@ class ApolloClient:
         payload.update(kwargs)
 
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = self._send("POST", url, headers=self.headers, data=fast_json.dumps_bytes(payload))
             response.raise_for_status()
-            return response.json()
+            return fast_json.loads(response.content)
         except requests.exceptions.HTTPError as e:
             raise Exception(f"Apollo.io API error: {e.response.status_code} - {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -153,16 +350,10 @@ class ApolloClient:
         """
         url = f"{self.API_BASE_URL}{self.PEOPLE_ENRICHMENT_ENDPOINT}"
 
-        headers = {
-            "Cache-Control": "no-cache",
-            "Content-Type": "application/json",
-            "X-Api-Key": self.api_key
-        }
-
         # Build query parameters
         params = {
-            "reveal_personal_emails": str(reveal_personal_emails).lower(),
-            "reveal_phone_number": str(reveal_phone_number).lower()
+            "reveal_personal_emails": QUERY_BOOLEANS[bool(reveal_personal_emails)],
+            "reveal_phone_number": QUERY_BOOLEANS[bool(reveal_phone_number)]
         }
 
         # Add identification parameters
@@ -178,21 +369,65 @@ class ApolloClient:
             params["domain"] = domain
 
         try:
-            response = requests.post(url, headers=headers, params=params)
+            response = self._send("POST", url, headers=self.headers, params=params)
             response.raise_for_status()
-            return response.json()
+            return fast_json.loads(response.content)
         except requests.exceptions.HTTPError as e:
             raise Exception(f"Apollo.io enrichment error: {e.response.status_code} - {e.response.text}")
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to connect to Apollo.io enrichment API: {str(e)}")
 
+    def enrich_people_bulk(
+        self,
+        details: List[Dict[str, Any]],
+        reveal_personal_emails: bool = True,
+        reveal_phone_number: bool = False
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Enrich up to BULK_ENRICHMENT_BATCH_SIZE people in one request.
+
+        Args:
+            details: One dict per person with the same identifying fields as
+                enrich_person (e.g. {"name": ..., "domain": ...})
+            reveal_personal_emails: Whether to reveal personal emails (default: True)
+            reveal_phone_number: Whether to reveal phone number (default: False)
+
+        Returns:
+            Person data for each entry of `details`, in the same order (None where
+            Apollo found no match)
+
+        Raises:
+            Exception: If the API call fails
+        """
+        url = f"{self.API_BASE_URL}{self.PEOPLE_BULK_ENRICHMENT_ENDPOINT}"
+        params = {
+            "reveal_personal_emails": QUERY_BOOLEANS[bool(reveal_personal_emails)],
+            "reveal_phone_number": QUERY_BOOLEANS[bool(reveal_phone_number)]
+        }
+        payload = {"details": details}
+
+        try:
+            response = self._send(
+                "POST", url, headers=self.headers, params=params, data=fast_json.dumps_bytes(payload)
+            )
+            response.raise_for_status()
+            matches = fast_json.loads(response.content).get("matches") or []
+        except requests.exceptions.HTTPError as e:
+            raise Exception(f"Apollo.io enrichment error: {e.response.status_code} - {e.response.text}")
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Failed to connect to Apollo.io enrichment API: {str(e)}")
+
+        # Pad in case Apollo returns fewer matches than details
+        return (list(matches) + [None] * len(details))[:len(details)]
+
     def create_contact(
         self,
         email: str,
         first_name: Optional[str] = None,
         last_name: Optional[str] = None,
         title: Optional[str] = None,
-        organization_name: Optional[str] = None
+        organization_name: Optional[str] = None,
+        custom_fields: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Create a new contact in Apollo.io.
@@ -206,6 +441,7 @@ class ApolloClient:
             last_name: Contact's last name
             title: Contact's job title
             organization_name: Contact's company name
+            custom_fields: Dictionary of custom field ID -> value pairs to set at creation time
 
         Returns:
             Dictionary containing created contact data including person_id
@@ -215,12 +451,6 @@ class ApolloClient:
         """
         url = f"{self.API_BASE_URL}{self.CREATE_CONTACT_ENDPOINT}"
 
-        headers = {
-            "Cache-Control": "no-cache",
-            "Content-Type": "application/json",
-            "X-Api-Key": self.api_key
-        }
-
         # Build request payload
         payload = {"email": email}
 
@@ -232,16 +462,127 @@ class ApolloClient:
             payload["title"] = title
         if organization_name:
             payload["organization_name"] = organization_name
+        if custom_fields:
+            payload["typed_custom_fields"] = custom_fields
 
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            # Sent without _send's retries: Apollo doesn't deduplicate, so a retried
+            # create could leave duplicate contacts behind
+            response = self.session.post(
+                url, headers=self.headers, data=fast_json.dumps_bytes(payload),
+                timeout=(self.CONNECT_TIMEOUT_SECONDS, self.REQUEST_TIMEOUT_SECONDS)
+            )
             response.raise_for_status()
-            return response.json()
+            return fast_json.loads(response.content)
         except requests.exceptions.HTTPError as e:
             raise Exception(f"Apollo.io create contact error: {e.response.status_code} - {e.response.text}")
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to create contact in Apollo.io: {str(e)}")
 
+    def create_contacts(
+        self,
+        contacts: List[ApolloContact],
+        custom_fields: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[ApolloContact, Exception]]:
+        """
+        Create several contacts in Apollo.io concurrently.
+
+        Each contact that is created gets its `contact_id` set from the response.
+        Callers decide which contacts to send (e.g. only those with unlocked emails).
+
+        Args:
+            contacts: ApolloContact objects to create
+            custom_fields: Dictionary of custom field ID -> value pairs set on every contact
+
+        Returns:
+            List of (contact, error) pairs for contacts that could not be created
+        """
+        if not contacts:
+            return []
+
+        def create(contact):
+            first_name, last_name = contact.split_name()
+            return self.create_contact(
+                email=contact.email,
+                first_name=first_name,
+                last_name=last_name,
+                title=contact.title,
+                organization_name=contact.company,
+                custom_fields=custom_fields
+            )
+
+        failures = []
+        max_workers = min(self.MAX_CONCURRENT_CONTACT_CREATES, len(contacts))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(create, contact): contact for contact in contacts}
+
+            for future in as_completed(futures):
+                contact = futures[future]
+                try:
+                    contact.contact_id = future.result().get("contact", {}).get("id")
+                except Exception as e:
+                    # One failed create shouldn't stop the others
+                    failures.append((contact, e))
+
+        return failures
+
+    def iter_contacts(
+        self,
+        domain: str,
+        titles: List[str],
+        max_results: int = 10
+    ) -> Iterator[ApolloContact]:
+        """
+        Iterate over contacts at a company with specific titles.
+
+        People are fetched one page (up to PEOPLE_PAGE_SIZE) at a time and yielded
+        as each page arrives, until max_results contacts have been yielded or the
+        results run out, so callers can stop early without fetching further pages.
+
+        Args:
+            domain: Company domain (e.g., "acmecorp.com")
+            titles: List of job titles to search for
+            max_results: Maximum number of contacts to yield (default: 10)
+
+        Yields:
+            ApolloContact objects
+        """
+        remaining = max_results
+        per_page = min(max_results, self.PEOPLE_PAGE_SIZE)
+        page = 1
+
+        while remaining > 0:
+            # Make API request
+            result = self.search_people(
+                organization_domains=[domain],
+                person_titles=titles,
+                per_page=per_page,
+                page=page
+            )
+
+            # Parse response
+            people = result.get("people", [])
+
+            for person in people[:remaining]:
+                # Organization info
+                organization = person.get("organization") or {}
+
+                yield ApolloContact(
+                    name=person.get("name", "Unknown"),
+                    title=person.get("title"),
+                    email=person.get("email"),
+                    linkedin_url=person.get("linkedin_url"),
+                    company=organization.get("name"),
+                    organization_id=organization.get("id"),
+                    person_id=person.get("id")
+                )
+            remaining -= min(len(people), remaining)
+
+            total_pages = (result.get("pagination") or {}).get("total_pages") or 1
+            if not people or page >= total_pages:
+                return
+            page += 1
+
     def search_contacts(
         self,
         domain: str,
@@ -251,54 +592,32 @@ class ApolloClient:
         """
         Search for contacts at a company with specific titles.
 
+        Results are cached per account for SEARCH_CACHE_TTL_SECONDS, keyed by
+        domain, the (case-insensitive) set of titles and max_results, so roles
+        with overlapping titles and re-analyzed jobs search once. Use
+        iter_contacts() for a fresh, streamed search.
+
         Args:
             domain: Company domain (e.g., "acmecorp.com")
             titles: List of job titles to search for
-            max_results: Maximum number of results to return (default: 10)
+            max_results: Maximum number of results to return (default: 10);
+                more than one page (PEOPLE_PAGE_SIZE) is fetched across pages
 
         Returns:
             List of ApolloContact objects
         """
-        contacts = []
-        per_page = min(max_results, 100)
-
-        # Make API request
-        result = self.search_people(
-            organization_domains=[domain],
-            person_titles=titles,
-            per_page=per_page
+        # Copies, so enriching or saving the contacts doesn't change the cached results
+        return [replace(contact) for contact in self._search_contacts(domain, tuple(titles), max_results)]
+
+    @ttl_lru_cache(
+        maxsize=256,
+        ttl=SEARCH_CACHE_TTL_SECONDS,
+        key=lambda self, domain, titles, max_results: (
+            self.api_key_hash, domain.lower(), frozenset(title.lower() for title in titles), max_results
         )
-
-        # Parse response
-        people = result.get("people", [])
-
-        for person in people[:max_results]:
-            # Extract contact information
-            name = person.get("name", "Unknown")
-            title = person.get("title")
-            email = person.get("email")
-            linkedin_url = person.get("linkedin_url")
-
-            # Organization info
-            organization = person.get("organization", {})
-            company = organization.get("name")
-            org_id = organization.get("id")
-
-            person_id = person.get("id")
-
-            contact = ApolloContact(
-                name=name,
-                title=title,
-                email=email,
-                linkedin_url=linkedin_url,
-                company=company,
-                organization_id=org_id,
-                person_id=person_id
-            )
-
-            contacts.append(contact)
-
-        return contacts
+    )
+    def _search_contacts(self, domain: str, titles: Tuple[str, ...], max_results: int) -> Tuple[ApolloContact, ...]:
+        return tuple(self.iter_contacts(domain, list(titles), max_results))
 
     def enrich_contact(self, contact: ApolloContact, domain: str) -> ApolloContact:
         """
@@ -313,36 +632,82 @@ class ApolloClient:
         """
         try:
             # Try to enrich by name and domain
-            enriched_data = self.enrich_person(
-                name=contact.name,
-                domain=domain,
-                reveal_personal_emails=True
-            )
+            with self._enrichment_slots:
+                enriched_data = self.enrich_person(
+                    name=contact.name,
+                    domain=domain,
+                    reveal_personal_emails=True
+                )
 
             # Extract person data from response
-            person = enriched_data.get("person", {})
-
-            # Update contact with enriched email if available
-            if person.get("email"):
-                contact.email = person.get("email")
-
-            # Update other fields if available
-            if person.get("linkedin_url"):
-                contact.linkedin_url = person.get("linkedin_url")
-
-            return contact
+            return self._apply_enrichment(contact, enriched_data.get("person"))
 
         except Exception as e:
             # If enrichment fails, just return original contact
-            print(f"Warning: Failed to enrich {contact.name}: {str(e)}")
+            print(f"Warning: Failed to enrich {contact.name}: {str(e)}", file=sys.stderr)
             return contact
 
+    def enrich_contacts(self, contacts: List[ApolloContact], domain: str) -> List[ApolloContact]:
+        """
+        Enrich several contacts to unlock their emails, using bulk enrichment requests.
+
+        Args:
+            contacts: ApolloContact objects to enrich (updated in place)
+            domain: Company domain
+
+        Returns:
+            The same contacts, in order
+        """
+        batches = [
+            contacts[i:i + self.BULK_ENRICHMENT_BATCH_SIZE]
+            for i in range(0, len(contacts), self.BULK_ENRICHMENT_BATCH_SIZE)
+        ]
+
+        def enrich_batch(batch: List[ApolloContact]) -> None:
+            try:
+                with self._enrichment_slots:
+                    people = self.enrich_people_bulk(
+                        [{"name": contact.name, "domain": domain} for contact in batch],
+                        reveal_personal_emails=True
+                    )
+            except Exception as e:
+                # If enrichment fails, keep the original contacts
+                print(f"Warning: Failed to enrich {', '.join(contact.name for contact in batch)}: {str(e)}", file=sys.stderr)
+                return
+
+            for contact, person in zip(batch, people):
+                self._apply_enrichment(contact, person)
+
+        if len(batches) == 1:
+            enrich_batch(batches[0])
+        elif batches:
+            max_workers = min(self.MAX_CONCURRENT_ENRICHMENTS, len(batches))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(enrich_batch, batches))
+
+        return contacts
+
+    @staticmethod
+    def _apply_enrichment(contact: ApolloContact, person: Optional[Dict[str, Any]]) -> ApolloContact:
+        person = person or {}
+
+        # Update contact with enriched email if available
+        if person.get("email"):
+            contact.email = person.get("email")
+
+        # Update other fields if available
+        if person.get("linkedin_url"):
+            contact.linkedin_url = person.get("linkedin_url")
+
+        return contact
+
     def search_by_role_suggestions(
         self,
         domain: str,
         role_suggestions: List[Any],
         max_per_role: int = 3,
-        enrich_top_n: Optional[int] = None
+        enrich_top_n: Optional[int] = None,
+        on_role_searched: Optional[Callable[[Any, List[ApolloContact]], None]] = None
     ) -> Dict[str, List[ApolloContact]]:
         """
         Search for contacts based on suggested roles from job analysis.
@@ -352,99 +717,142 @@ class ApolloClient:
             role_suggestions: List of ContactRole objects from role_analyzer
             max_per_role: Maximum contacts to find per role
             enrich_top_n: If specified, enriches the top N most relevant contacts to unlock emails
+            on_role_searched: Optional callback(role, contacts) invoked as soon as each
+                role's search finishes (in completion order, before enrichment)
 
         Returns:
             Dictionary mapping role title to list of contacts found
         """
         results = {}
-        all_contacts_with_priority = []
+        # Enrichment candidates: name -> (priority, position, contact) for the best
+        # (highest-priority, then earliest) occurrence of each name
+        best_by_name: Dict[str, Tuple[int, int, ApolloContact]] = {}
+        position = 0
 
-        for role in role_suggestions:
+        def search_role(role):
             # Use the role title and keywords for searching
             search_titles = [role.title] + role.keywords[:2]  # Role title + top 2 keywords
-
-            try:
-                contacts = self.search_contacts(
+            with self._search_slots:
+                return self.search_contacts(
                     domain=domain,
                     titles=search_titles,
                     max_results=max_per_role
                 )
 
-                if contacts:
-                    results[role.title] = contacts
+        # Run the per-role searches concurrently; total latency is bounded by the slowest role
+        max_workers = max(1, min(self.MAX_CONCURRENT_SEARCHES, len(role_suggestions)))
+        found: Dict[int, List[ApolloContact]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(search_role, role): i for i, role in enumerate(role_suggestions)}
+
+            # Report each role as soon as its search finishes
+            for future in as_completed(futures):
+                role = role_suggestions[futures[future]]
+                try:
+                    contacts = future.result()
+                except Exception as e:
+                    # Continue searching other roles even if one fails
+                    print(f"Warning: Failed to search for {role.title}: {str(e)}", file=sys.stderr)
+                    continue
+
+                found[futures[future]] = contacts
+                if on_role_searched:
+                    on_role_searched(role, contacts)
+
+        # Collect in role order so results keep the suggested priority ordering
+        for i, role in enumerate(role_suggestions):
+            contacts = found.get(i)
+            if contacts:
+                results[role.title] = contacts
+
+                # Track each contact's best priority for enrichment
+                for contact in contacts:
+                    best = best_by_name.get(contact.name)
+                    if best is None or role.priority < best[0]:
+                        best_by_name[contact.name] = (role.priority, position, contact)
+                    position += 1
 
-                    # Track contacts with their priority for enrichment
-                    for contact in contacts:
-                        all_contacts_with_priority.append((role.priority, contact))
+        # Enrich top N contacts if requested
+        if enrich_top_n and best_by_name:
+            print(f"\nEnriching top {enrich_top_n} contacts to unlock emails...", file=sys.stderr)
 
-            except Exception as e:
-                # Continue searching other roles even if one fails
-                print(f"Warning: Failed to search for {role.title}: {str(e)}")
-                continue
+            # Top N unique contacts by priority (lower number = higher priority),
+            # earliest found first among equals
+            contacts_to_enrich = [
+                contact
+                for _, _, contact in heapq.nsmallest(enrich_top_n, best_by_name.values(), key=itemgetter(0, 1))
+            ]
 
-        # Enrich top N contacts if requested
-        if enrich_top_n and all_contacts_with_priority:
-            print(f"\nEnriching top {enrich_top_n} contacts to unlock emails...")
+            # Contacts are updated in place, with errors handled per batch
+            enriched = self.enrich_contacts(contacts_to_enrich, domain)
+            enriched_count = sum(1 for contact in enriched if contact.has_unlocked_email)
 
-            # Sort by priority (lower number = higher priority)
-            all_contacts_with_priority.sort(key=lambda x: x[0])
+            print(f"Successfully enriched {enriched_count}/{len(contacts_to_enrich)} contacts", file=sys.stderr)
 
-            # Get top N unique contacts
-            seen_names = set()
-            contacts_to_enrich = []
+        return results
 
-            for priority, contact in all_contacts_with_priority:
-                if contact.name not in seen_names:
-                    contacts_to_enrich.append(contact)
-                    seen_names.add(contact.name)
+    def iter_sequences(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all sequences (email campaigns) in the Apollo.io account.
 
-                if len(contacts_to_enrich) >= enrich_top_n:
-                    break
+        Sequences are fetched one page (SEQUENCES_PAGE_SIZE) at a time and yielded
+        as each page arrives, so callers can stop early without fetching the rest.
 
-            # Enrich each contact
-            enriched_count = 0
-            for contact in contacts_to_enrich:
-                enriched = self.enrich_contact(contact, domain)
-                if enriched.email and enriched.email != "email_not_unlocked@domain.com":
-                    enriched_count += 1
+        Yields:
+            Sequence dictionaries with id, name, and other details
+
+        Raises:
+            Exception: If the API call fails (403 if not using master API key)
+        """
+        url = f"{self.API_BASE_URL}{self.SEQUENCES_SEARCH_ENDPOINT}"
 
-            print(f"Successfully enriched {enriched_count}/{len(contacts_to_enrich)} contacts")
+        page = 1
+        while True:
+            payload = {"page": page, "per_page": self.SEQUENCES_PAGE_SIZE}
 
-        return results
+            try:
+                response = self._send("POST", url, headers=self.headers, data=fast_json.dumps_bytes(payload))
+                response.raise_for_status()
+                data = fast_json.loads(response.content)
+            except requests.exceptions.HTTPError as e:
+                if e.response.status_code == 403:
+                    raise Exception(
+                        "403 Forbidden: Sequences API requires a master API key. "
+                        "Regular API keys cannot access sequences. "
+                        "Please create a master API key in Apollo.io settings."
+                    )
+                raise Exception(f"Apollo.io sequences API error: {e.response.status_code} - {e.response.text}")
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"Failed to connect to Apollo.io sequences API: {str(e)}")
+
+            sequences = data.get("emailer_campaigns", [])
+            yield from sequences
+
+            total_pages = (data.get("pagination") or {}).get("total_pages") or 1
+            if not sequences or page >= total_pages:
+                return
+            page += 1
 
     def list_sequences(self) -> List[Dict[str, Any]]:
         """
         List all sequences (email campaigns) in the Apollo.io account.
 
+        The full list is cached per account for a minute, so validating the key
+        and then picking a sequence (as the setup wizard does) lists them once.
+        Use iter_sequences() for a fresh, streamed listing.
+
         Returns:
             List of sequence dictionaries with id, name, and other details
 
         Raises:
             Exception: If the API call fails (403 if not using master API key)
         """
-        url = f"{self.API_BASE_URL}{self.SEQUENCES_SEARCH_ENDPOINT}"
+        # Copy so callers can't modify the cached list
+        return list(self._list_sequences())
 
-        headers = {
-            "Cache-Control": "no-cache",
-            "Content-Type": "application/json",
-            "X-Api-Key": self.api_key
-        }
-
-        try:
-            response = requests.post(url, headers=headers, json={})
-            response.raise_for_status()
-            data = response.json()
-            return data.get("emailer_campaigns", [])
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 403:
-                raise Exception(
-                    "403 Forbidden: Sequences API requires a master API key. "
-                    "Regular API keys cannot access sequences. "
-                    "Please create a master API key in Apollo.io settings."
-                )
-            raise Exception(f"Apollo.io sequences API error: {e.response.status_code} - {e.response.text}")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to connect to Apollo.io sequences API: {str(e)}")
+    @ttl_lru_cache(maxsize=8, ttl=60, key=lambda self: self.api_key_hash)
+    def _list_sequences(self) -> Tuple[Dict[str, Any], ...]:
+        return tuple(self.iter_sequences())
 
     def add_contacts_to_sequence(
         self,
@@ -452,7 +860,8 @@ class ApolloClient:
         contact_ids: List[str],
         sequence_name: Optional[str] = None,
         email_account_id: Optional[str] = None,
-        mailbox_rotation: bool = False
+        mailbox_rotation: bool = False,
+        progress_callback: Optional[Callable[[int], None]] = None
     ) -> Dict[str, Any]:
         """
         Add contacts to an Apollo.io sequence (email campaign).
@@ -460,71 +869,112 @@ class ApolloClient:
         IMPORTANT: This only ADDS contacts to the sequence. It does NOT start the campaign.
         You will need to manually start/resume the sequence in Apollo.io UI.
 
+        Contacts are sent in batches of BULK_BATCH_SIZE; after the first batch succeeds,
+        the rest are sent concurrently (up to MAX_CONCURRENT_SEQUENCE_ADDS at a time).
+        Each batch is retried on rate limits and transient server errors independently.
+
         Args:
             sequence_id: The ID of the sequence to add contacts to
             contact_ids: List of Apollo.io contact IDs (person_id from ApolloContact)
             sequence_name: Optional name for display purposes
             email_account_id: Email account ID to use for sending (optional, uses sequence default)
             mailbox_rotation: Whether to rotate mailboxes (default: False)
+            progress_callback: Optional callable invoked with the size of each batch once it is added
 
         Returns:
-            Dictionary with response data
+            Dictionary with "added_count" (total contacts added) and "responses"
+            (the response data of each batch)
 
         Raises:
             Exception: If the API call fails
         """
         url = f"{self.API_BASE_URL}{self.SEQUENCES_ADD_CONTACTS_ENDPOINT.format(sequence_id=sequence_id)}"
 
-        headers = {
-            "Cache-Control": "no-cache",
-            "Content-Type": "application/json",
-            "X-Api-Key": self.api_key
-        }
-
-        payload = {
-            "contact_ids": contact_ids,
-            "emailer_campaign_id": sequence_id,  # API requires this even though it's in the URL
-            "mailbox_rotation": mailbox_rotation
-        }
-
-        # Add email account ID if provided, otherwise try to use a default
-        # The API requires send_email_from_email_account_id parameter
-        if email_account_id:
-            payload["send_email_from_email_account_id"] = email_account_id
+        def add_batch(chunk: List[str]) -> Dict[str, Any]:
+            payload = {
+                "contact_ids": chunk,
+                "emailer_campaign_id": sequence_id,  # API requires this even though it's in the URL
+                "mailbox_rotation": mailbox_rotation
+            }
 
-        try:
-            response = requests.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 403:
-                raise Exception(
-                    "403 Forbidden: Sequences API requires a master API key. "
-                    "Regular API keys cannot access sequences."
-                )
-            elif e.response.status_code == 422 and "send_email_from_email_account_id" in e.response.text:
-                raise Exception(
-                    "Email account ID required. Please specify an email account to send from. "
-                    "You can find your email account IDs in Apollo.io -> Settings -> Email Accounts. "
-                    "Pass the email_account_id parameter or configure a default in the sequence."
-                )
-            raise Exception(f"Apollo.io sequences API error: {e.response.status_code} - {e.response.text}")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to add contacts to sequence: {str(e)}")
+            # Add email account ID if provided, otherwise try to use a default
+            # The API requires send_email_from_email_account_id parameter
+            if email_account_id:
+                payload["send_email_from_email_account_id"] = email_account_id
 
+            try:
+                response = self._send("POST", url, headers=self.headers, data=fast_json.dumps_bytes(payload))
+                response.raise_for_status()
+                return fast_json.loads(response.content)
+            except requests.exceptions.HTTPError as e:
+                if e.response.status_code == 403:
+                    raise Exception(
+                        "403 Forbidden: Sequences API requires a master API key. "
+                        "Regular API keys cannot access sequences."
+                    )
+                elif e.response.status_code == 422 and "send_email_from_email_account_id" in e.response.text:
+                    raise Exception(
+                        "Email account ID required. Please specify an email account to send from. "
+                        "You can find your email account IDs in Apollo.io -> Settings -> Email Accounts. "
+                        "Pass the email_account_id parameter or configure a default in the sequence."
+                    )
+                raise Exception(f"Apollo.io sequences API error: {e.response.status_code} - {e.response.text}")
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"Failed to add contacts to sequence: {str(e)}")
+
+        chunks = [
+            contact_ids[start:start + self.BULK_BATCH_SIZE]
+            for start in range(0, len(contact_ids), self.BULK_BATCH_SIZE)
+        ]
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(chunks)
+        added_count = 0
+        error = None
+
+        def record(index: int, data: Dict[str, Any]) -> None:
+            nonlocal added_count
+            responses[index] = data
+            added_count += len(chunks[index])
+            if progress_callback:
+                progress_callback(len(chunks[index]))
+
+        # The first batch goes alone so account-level errors (403, missing email
+        # account) surface once instead of from every worker
+        if chunks:
+            record(0, add_batch(chunks[0]))
+
+        if len(chunks) > 1:
+            workers = max(1, min(self.MAX_CONCURRENT_SEQUENCE_ADDS, len(chunks) - 1))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(add_batch, chunks[i]): i for i in range(1, len(chunks))}
+                for future in as_completed(futures):
+                    try:
+                        record(futures[future], future.result())
+                    except Exception as e:
+                        error = error or e
+
+        if error:
+            raise Exception(f"{str(error)} ({added_count} of {len(contact_ids)} contacts were added)")
+
+        return {"added_count": added_count, "responses": [r for r in responses if r is not None]}
+
+    @ttl_lru_cache(maxsize=64, ttl=300, key=lambda self, name: (self.api_key_hash, normalize_name(name)))
     def find_sequence_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
         Find a sequence by its name.
 
+        Results are cached per account for 5 minutes, so batch runs against the
+        same sequence only list sequences once.
+
         Args:
             name: The name of the sequence to find
 
         Returns:
             Sequence dictionary if found, None otherwise
         """
-        sequences = self.list_sequences()
-        for seq in sequences:
-            if seq.get("name", "").lower() == name.lower():
+        # Stops fetching pages as soon as the sequence is found
+        wanted = normalize_name(name)
+        for seq in self.iter_sequences():
+            if normalize_name(seq.get("name")) == wanted:
                 return seq
         return None
 
@@ -532,30 +982,31 @@ class ApolloClient:
         """
         Get list of all email accounts in the Apollo.io account.
 
+        Results are cached per account for METADATA_CACHE_TTL_SECONDS
+        (see invalidate_caches).
+
         Returns:
             List of email account IDs (as strings)
 
         Raises:
             Exception: If the API call fails (403 if not using master API key)
         """
-        url = f"{self.API_BASE_URL}{self.EMAIL_ACCOUNTS_ENDPOINT}"
+        return list(self._email_accounts())
 
-        headers = {
-            "Cache-Control": "no-cache",
-            "Content-Type": "application/json",
-            "X-Api-Key": self.api_key
-        }
+    @ttl_lru_cache(maxsize=8, ttl=METADATA_CACHE_TTL_SECONDS, key=lambda self: self.api_key_hash)
+    def _email_accounts(self) -> Tuple[str, ...]:
+        url = f"{self.API_BASE_URL}{self.EMAIL_ACCOUNTS_ENDPOINT}"
 
         try:
-            response = requests.get(url, headers=headers)
+            response = self._send("GET", url, headers=self.headers)
             response.raise_for_status()
-            data = response.json()
+            data = fast_json.loads(response.content)
 
             # API returns an object with an "email_accounts" array
             email_accounts = data.get("email_accounts", [])
 
             # Extract just the IDs from the email account objects
-            return [str(account.get("id")) for account in email_accounts if account.get("id")]
+            return tuple(str(account.get("id")) for account in email_accounts if account.get("id"))
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 403:
                 raise Exception(
@@ -571,25 +1022,26 @@ class ApolloClient:
         """
         Get list of all custom fields in Apollo.io account.
 
+        Results are cached per account for METADATA_CACHE_TTL_SECONDS
+        (see invalidate_caches).
+
         Returns:
             List of custom field dictionaries with id, name, type, etc.
 
         Raises:
             Exception: If the API call fails
         """
-        url = f"{self.API_BASE_URL}{self.CUSTOM_FIELDS_ENDPOINT}"
+        return list(self._custom_fields())
 
-        headers = {
-            "Cache-Control": "no-cache",
-            "Content-Type": "application/json",
-            "X-Api-Key": self.api_key
-        }
+    @ttl_lru_cache(maxsize=8, ttl=METADATA_CACHE_TTL_SECONDS, key=lambda self: self.api_key_hash)
+    def _custom_fields(self) -> Tuple[Dict[str, Any], ...]:
+        url = f"{self.API_BASE_URL}{self.CUSTOM_FIELDS_ENDPOINT}"
 
         try:
-            response = requests.get(url, headers=headers)
+            response = self._send("GET", url, headers=self.headers)
             response.raise_for_status()
-            data = response.json()
-            return data.get("typed_custom_fields", [])
+            data = fast_json.loads(response.content)
+            return tuple(data.get("typed_custom_fields", []))
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 403:
                 raise Exception(
@@ -609,11 +1061,33 @@ class ApolloClient:
         Returns:
             Custom field dictionary if found, None otherwise
         """
-        custom_fields = self.get_custom_fields()
-        for field in custom_fields:
-            if field.get("name", "").lower() == name.lower():
-                return field
-        return None
+        return self._custom_fields_by_name().get(normalize_name(name))
+
+    @ttl_lru_cache(maxsize=8, ttl=METADATA_CACHE_TTL_SECONDS, key=lambda self: self.api_key_hash)
+    def _custom_fields_by_name(self) -> Dict[str, Dict[str, Any]]:
+        # Normalized name -> field; the first field wins if names collide
+        index: Dict[str, Dict[str, Any]] = {}
+        for field in self._custom_fields():
+            index.setdefault(normalize_name(field.get("name")), field)
+        return index
+
+    @classmethod
+    def invalidate_caches(cls) -> None:
+        """
+        Drop cached searches, sequences, email accounts and custom fields (for every account).
+
+        Call this after changing them in Apollo.io mid-run, so the next lookup
+        fetches fresh data instead of waiting for the cache to expire.
+        """
+        for cached in (
+            cls._search_contacts,
+            cls._list_sequences,
+            cls.find_sequence_by_name,
+            cls._email_accounts,
+            cls._custom_fields,
+            cls._custom_fields_by_name,
+        ):
+            cached.cache_clear()
 
     def update_contact(
         self,
@@ -637,12 +1111,6 @@ class ApolloClient:
         """
         url = f"{self.API_BASE_URL}{self.UPDATE_CONTACT_ENDPOINT.format(contact_id=contact_id)}"
 
-        headers = {
-            "Cache-Control": "no-cache",
-            "Content-Type": "application/json",
-            "X-Api-Key": self.api_key
-        }
-
         payload = {}
 
         # Add custom fields if provided
@@ -653,9 +1121,9 @@ class ApolloClient:
         payload.update(kwargs)
 
         try:
-            response = requests.patch(url, headers=headers, json=payload)
+            response = self._send("PATCH", url, headers=self.headers, data=fast_json.dumps_bytes(payload))
             response.raise_for_status()
-            return response.json()
+            return fast_json.loads(response.content)
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 403:
                 raise Exception(
@@ -665,6 +1133,77 @@ class ApolloClient:
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to update contact: {str(e)}")
 
+    def bulk_update_contacts(
+        self,
+        contact_ids: List[str],
+        custom_fields: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Update several contacts with the same custom field values in one request.
+
+        Args:
+            contact_ids: Apollo.io contact IDs (at most BULK_BATCH_SIZE)
+            custom_fields: Dictionary of custom field ID -> value pairs
+            **kwargs: Additional contact fields to update
+
+        Returns:
+            Response data
+
+        Raises:
+            Exception: If the API call fails
+        """
+        url = f"{self.API_BASE_URL}{self.BULK_UPDATE_CONTACTS_ENDPOINT}"
+
+        payload = {"contact_ids": contact_ids}
+
+        # Add custom fields if provided
+        if custom_fields:
+            payload["typed_custom_fields"] = custom_fields
+
+        # Add any additional fields
+        payload.update(kwargs)
+
+        try:
+            response = self._send("POST", url, headers=self.headers, data=fast_json.dumps_bytes(payload))
+            response.raise_for_status()
+            return fast_json.loads(response.content)
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 403:
+                raise Exception(
+                    "403 Forbidden: Bulk update contacts API requires a master API key."
+                )
+            raise Exception(f"Apollo.io bulk update contacts error: {e.response.status_code} - {e.response.text}")
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Failed to bulk update contacts: {str(e)}")
+
+    def job_title_custom_fields(
+        self,
+        job_title: str,
+        custom_field_name: str = "Job_Posting_Title"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the custom field payload that sets a contact's job posting title.
+
+        Args:
+            job_title: The job title to set
+            custom_field_name: Name of the custom field to use (default: "Job_Posting_Title")
+
+        Returns:
+            Dictionary of custom field ID -> job title, or None if the field can't be found
+        """
+        try:
+            custom_field = self.find_custom_field_by_name(custom_field_name)
+        except Exception as e:
+            print(f"Warning: Failed to look up custom field '{custom_field_name}': {str(e)}", file=sys.stderr)
+            return None
+
+        if not custom_field:
+            print(f"Warning: Custom field '{custom_field_name}' not found. Please create it in Apollo.io first.", file=sys.stderr)
+            return None
+
+        return {custom_field.get("id"): job_title}
+
     def update_contact_with_job_title(
         self,
         contact_id: str,
@@ -687,7 +1226,7 @@ class ApolloClient:
             custom_field = self.find_custom_field_by_name(custom_field_name)
 
             if not custom_field:
-                print(f"Warning: Custom field '{custom_field_name}' not found. Please create it in Apollo.io first.")
+                print(f"Warning: Custom field '{custom_field_name}' not found. Please create it in Apollo.io first.", file=sys.stderr)
                 return False
 
             field_id = custom_field.get("id")
@@ -701,9 +1240,121 @@ class ApolloClient:
             return True
 
         except Exception as e:
-            print(f"Warning: Failed to update contact {contact_id} with job title: {str(e)}")
+            print(f"Warning: Failed to update contact {contact_id} with job title: {str(e)}", file=sys.stderr)
             return False
 
+    def bulk_update_contacts_with_job_title(
+        self,
+        contact_ids: List[str],
+        job_title: str,
+        custom_field_name: str = "Job_Posting_Title"
+    ) -> int:
+        """
+        Update many contacts with the job title they're applying for.
+
+        Sends one request per BULK_BATCH_SIZE contacts instead of one per contact.
+        If a bulk request fails, falls back to updating that batch one contact at a time.
+
+        Args:
+            contact_ids: Apollo.io contact IDs
+            job_title: The job title to set
+            custom_field_name: Name of the custom field to use (default: "Job_Posting_Title")
+
+        Returns:
+            Number of contacts updated
+        """
+        if not contact_ids:
+            return 0
+
+        custom_fields = self.job_title_custom_fields(job_title, custom_field_name)
+        if not custom_fields:
+            return 0
+
+        updated_count = 0
+
+        for start in range(0, len(contact_ids), self.BULK_BATCH_SIZE):
+            batch = contact_ids[start:start + self.BULK_BATCH_SIZE]
+            try:
+                self.bulk_update_contacts(batch, custom_fields=custom_fields)
+                updated_count += len(batch)
+            except Exception as e:
+                print(f"Warning: Bulk update failed, updating contacts individually: {str(e)}", file=sys.stderr)
+                for contact_id in batch:
+                    try:
+                        self.update_contact(contact_id=contact_id, custom_fields=custom_fields)
+                        updated_count += 1
+                    except Exception as e:
+                        print(f"Warning: Failed to update contact {contact_id} with job title: {str(e)}", file=sys.stderr)
+
+        return updated_count
+
+
+def _in_thread(method: Callable) -> Callable:
+    """Turn an ApolloClient method into a coroutine method of AsyncApolloClient."""
+    @functools.wraps(method)
+    async def wrapper(self: "AsyncApolloClient", *args, **kwargs):
+        return await asyncio.to_thread(method, self.client, *args, **kwargs)
+    return wrapper
+
+
+class AsyncApolloClient:
+    """
+    Asyncio interface to Apollo.io for callers that already run an event loop.
+
+    Each coroutine runs the ApolloClient method of the same name in a worker
+    thread, so requests share the sync client's connection pool, retries,
+    caches and concurrency caps; many calls can be awaited at once with
+    asyncio.gather.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        use_http2: bool = False,
+        client: Optional[ApolloClient] = None
+    ):
+        """
+        Initialize the async client.
+
+        Args:
+            api_key: Apollo.io API key (see ApolloClient)
+            session: Optional requests session to share with other clients
+            use_http2: Send requests over one multiplexed HTTP/2 connection (see ApolloClient)
+            client: Existing ApolloClient to wrap instead of creating one
+        """
+        self.client = client or ApolloClient(api_key=api_key, session=session, use_http2=use_http2)
+
+    async def aclose(self) -> None:
+        """Close the wrapped client's pooled connections."""
+        self.client.close()
+
+    async def __aenter__(self) -> "AsyncApolloClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    search_people = _in_thread(ApolloClient.search_people)
+    enrich_person = _in_thread(ApolloClient.enrich_person)
+    enrich_people_bulk = _in_thread(ApolloClient.enrich_people_bulk)
+    search_contacts = _in_thread(ApolloClient.search_contacts)
+    enrich_contact = _in_thread(ApolloClient.enrich_contact)
+    enrich_contacts = _in_thread(ApolloClient.enrich_contacts)
+    search_by_role_suggestions = _in_thread(ApolloClient.search_by_role_suggestions)
+    create_contact = _in_thread(ApolloClient.create_contact)
+    create_contacts = _in_thread(ApolloClient.create_contacts)
+    list_sequences = _in_thread(ApolloClient.list_sequences)
+    find_sequence_by_name = _in_thread(ApolloClient.find_sequence_by_name)
+    add_contacts_to_sequence = _in_thread(ApolloClient.add_contacts_to_sequence)
+    get_email_accounts = _in_thread(ApolloClient.get_email_accounts)
+    get_custom_fields = _in_thread(ApolloClient.get_custom_fields)
+    find_custom_field_by_name = _in_thread(ApolloClient.find_custom_field_by_name)
+    update_contact = _in_thread(ApolloClient.update_contact)
+    bulk_update_contacts = _in_thread(ApolloClient.bulk_update_contacts)
+    update_contact_with_job_title = _in_thread(ApolloClient.update_contact_with_job_title)
+    bulk_update_contacts_with_job_title = _in_thread(ApolloClient.bulk_update_contacts_with_job_title)
+
 
 def search_contacts(
     domain: str,
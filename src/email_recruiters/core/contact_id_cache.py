@@ -0,0 +1,116 @@
+"""
+Cache of Apollo.io contact IDs, keyed by email address.
+
+Apollo creates a new contact on every create call, even when one with the
+same email already exists. When a hiring manager shows up in the results of
+several jobs, looking their contact up here first saves the HTTP round-trip
+and avoids a duplicate contact in the user's account. Contact IDs belong to
+the Apollo account that created them, so entries are keyed by account (the
+client's api_key_hash) and email. Entries are kept in memory for the current
+process and persisted in the SQLite database.
+
+Database errors are ignored; at worst a contact is created again.
+"""
+
+import threading
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from .apollo_search import ApolloContact
+from ..database.db import get_apollo_contact_ids, set_apollo_contact_ids
+
+# How long a remembered contact ID is trusted (contacts may be deleted in Apollo)
+CONTACT_ID_CACHE_TTL = timedelta(days=30)
+
+# In-process layer: (account, email) -> contact ID
+_memory_cache: Dict[Tuple[str, str], str] = {}
+_lock = threading.Lock()
+
+
+def _email_key(contact: ApolloContact) -> str:
+    return contact.email.strip().lower()
+
+
+def apply_cached_contact_ids(contacts: List[ApolloContact], account: str) -> List[ApolloContact]:
+    """
+    Set `contact_id` on contacts whose email already has an Apollo contact.
+
+    Args:
+        contacts: Contacts with unlocked emails that are about to be created
+        account: Apollo account the contacts are created in (ApolloClient.api_key_hash)
+
+    Returns:
+        The contacts that still need to be created
+    """
+    with _lock:
+        emails = {_email_key(contact) for contact in contacts}
+        missing = {email for email in emails if (account, email) not in _memory_cache}
+
+    if missing:
+        try:
+            found = get_apollo_contact_ids(account, sorted(missing), max_age=CONTACT_ID_CACHE_TTL)
+        except Exception:
+            found = {}
+        with _lock:
+            _memory_cache.update(((account, email), contact_id) for email, contact_id in found.items())
+
+    to_create = []
+    with _lock:
+        for contact in contacts:
+            contact_id = _memory_cache.get((account, _email_key(contact)))
+            if contact_id:
+                contact.contact_id = contact_id
+            else:
+                to_create.append(contact)
+    return to_create
+
+
+def remember_contact_ids(contacts: List[ApolloContact], account: str) -> None:
+    """
+    Remember the Apollo contacts just created for these contacts' emails.
+
+    Args:
+        contacts: Contacts passed to create; those without a `contact_id` are ignored
+        account: Apollo account the contacts were created in (ApolloClient.api_key_hash)
+    """
+    created = {_email_key(contact): contact.contact_id for contact in contacts if contact.contact_id}
+    if not created:
+        return
+
+    with _lock:
+        _memory_cache.update(((account, email), contact_id) for email, contact_id in created.items())
+    try:
+        set_apollo_contact_ids(account, created)
+    except Exception:
+        pass
+
+
+def create_new_contacts(
+    apollo_client,
+    contacts: List[ApolloContact],
+    custom_fields: Optional[Dict[str, Any]] = None
+) -> Tuple[List[ApolloContact], List[Tuple[ApolloContact, Exception]]]:
+    """
+    Create contacts in Apollo.io, except those whose email already has a contact.
+
+    A reused contact gets its `contact_id` set but belongs to the job it was
+    created for: its job title custom field and sequence enrollment are that
+    job's, so callers shouldn't update or enroll it again.
+
+    Args:
+        apollo_client: ApolloClient to create the contacts with
+        contacts: Contacts with unlocked emails
+        custom_fields: Dictionary of custom field ID -> value pairs set on created contacts
+
+    Returns:
+        Tuple of (reused contacts, list of (contact, error) pairs for contacts that
+        could not be created)
+    """
+    account = apollo_client.api_key_hash
+    to_create = apply_cached_contact_ids(contacts, account)
+    creating = {id(contact) for contact in to_create}
+    reused = [contact for contact in contacts if id(contact) not in creating]
+
+    failures = apollo_client.create_contacts(to_create, custom_fields=custom_fields)
+    remember_contact_ids(to_create, account)
+    return reused, failures
@@ -0,0 +1,48 @@
+"""
+JSON encoding helpers that use orjson when it's installed.
+
+orjson is an optional speedup (pip install "email-recruiters[fast]"); without
+it the stdlib json module is used and the output is equivalent.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Indent with two spaces (default: compact output)
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 encoded JSON (e.g. for a request body)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: str) -> Any:
+    """Parse a JSON string (or bytes)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
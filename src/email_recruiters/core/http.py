@@ -0,0 +1,118 @@
+"""
+Shared HTTP session factory.
+
+JobScraper and ApolloClient each talk to a single host, but batch runs use
+both from several threads at once. Creating the session here lets callers
+hand one pooled session to every client so the whole run shares one
+connection pool.
+"""
+
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Connection pool sizing; large enough for the CLI's thread pools to share one session
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 64
+
+
+def create_session(
+    pool_connections: int = POOL_CONNECTIONS,
+    pool_maxsize: int = POOL_MAXSIZE
+) -> requests.Session:
+    """
+    Create a requests session with a connection pool sized for concurrent use.
+
+    Retries are left to the clients (see ApolloClient._send), so the adapter
+    doesn't retry on its own. Compressed responses need no setup: requests
+    advertises gzip/deflate (plus br when the optional brotli package is
+    installed) and decompresses transparently, so per-request headers should
+    not set Accept-Encoding themselves.
+
+    Args:
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum connections kept open per host
+
+    Returns:
+        New requests.Session with the pooled adapter mounted for http and https
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class Http2Session:
+    """
+    Minimal requests.Session stand-in that sends requests over HTTP/2 with httpx.
+
+    Concurrent requests to one host share a single multiplexed connection.
+    Responses are converted to requests.Response and transport errors to
+    requests exceptions, so callers written against requests keep working.
+    Needs the optional http2 extra (pip install 'email-recruiters[http2]').
+    """
+
+    def __init__(self, max_connections: int = POOL_MAXSIZE, max_keepalive_connections: int = POOL_CONNECTIONS):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "HTTP/2 support requires httpx. Install it with: pip install 'email-recruiters[http2]'"
+            )
+
+        self._httpx = httpx
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            )
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Any] = None,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> requests.Response:
+        httpx = self._httpx
+        if isinstance(timeout, tuple):
+            # requests-style (connect, read)
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        if isinstance(data, (bytes, str)):
+            kwargs["content"] = data
+        elif data is not None:
+            kwargs["data"] = data
+
+        try:
+            response = self._client.request(method, url, timeout=timeout, **kwargs)
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(str(e))
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e))
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e))
+
+        converted = requests.Response()
+        converted.status_code = response.status_code
+        converted.reason = response.reason_phrase
+        converted.headers = CaseInsensitiveDict(response.headers)
+        converted.url = str(response.url)
+        converted.encoding = response.encoding
+        converted._content = response.content
+        return converted
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        self._client.close()
@@ -6,10 +6,17 @@ using Jina AI's reader service to convert web pages to clean markdown.
 """
 
 import os
+import random
 import re
+import time
 import requests
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
+from datetime import timedelta
+
+from .http import create_session
 
 
 @dataclass
@@ -39,12 +46,74 @@ class JobScraper:
 
     JINA_READER_BASE_URL = "https://r.jina.ai/"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Per-request timeout so a stalled page render can't hang the CLI
+    REQUEST_TIMEOUT_SECONDS = 30
+
+    # Default number of pages scrape_many fetches at the same time
+    MAX_CONCURRENT_SCRAPES = 8
+
+    # Retry settings for rate-limited (429) and transient server (5xx) errors
+    MAX_RETRIES = 2
+    RETRY_BACKOFF_SECONDS = 1.0
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    # Extraction patterns (in priority order), compiled once per process rather
+    # than on every scrape
+    TITLE_PATTERNS = tuple(
+        re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+        for pattern in (
+            r"^#\s+(.+?)(?:\n|$)",  # First H1 heading
+            r"Job Title:?\s*(.+?)(?:\n|$)",
+            r"Position:?\s*(.+?)(?:\n|$)",
+            r"Role:?\s*(.+?)(?:\n|$)",
+        )
+    )
+    COMPANY_PATTERNS = tuple(
+        re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+        for pattern in (
+            r"Company:?\s*(.+?)(?:\n|$)",
+            r"Organization:?\s*(.+?)(?:\n|$)",
+            r"##\s*About\s+(.+?)(?:\n|$)",
+            # Capture bounded by the 100-char limit in _extract_company: unbounded, every
+            # "at X" on a long line rescanned to its end (quadratic on non-matching text)
+            r"at\s+([A-Z][A-Za-z0-9\s&.,-]{0,99}?)(?:\n|Location:|$)",
+        )
+    )
+    LOCATION_PATTERNS = tuple(
+        re.compile(pattern, re.MULTILINE)
+        for pattern in (
+            r"Location:?\s*(.+?)(?:\n|$)",
+            r"Based in:?\s*(.+?)(?:\n|$)",
+            r"Office:?\s*(.+?)(?:\n|$)",
+            # City, State pattern
+            r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?,\s*[A-Z]{2}(?:\s+\d{5})?)",
+            # City, Country pattern
+            r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?,\s*[A-Z][a-z]+)",
+        )
+    )
+    # Title, company and location are almost always near the top of the page, so
+    # the patterns run on this many leading characters before the whole page
+    HEAD_WINDOW_CHARS = 4096
+
+    REMOTE_PATTERN = re.compile(r'\b(remote|hybrid|work from home)\b', re.IGNORECASE)
+    MARKDOWN_ARTIFACTS = re.compile(r'[#*\[\]()]')
+    LINKEDIN_JOB_PATTERN = re.compile(r'/jobs/view/([^/]+)')
+    LINKEDIN_COMPANY_PATTERN = re.compile(r'company/([^/]+)')
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        cache_ttl: Optional[timedelta] = None
+    ):
         """
         Initialize the job scraper.
 
         Args:
             api_key: Jina API key. If not provided, will try to load from JINA_API_KEY env var.
+            session: Optional requests session to share with other clients (see http.create_session)
+            cache_ttl: If given, reuse pages scraped within this long instead of fetching
+                them again (see core/scrape_cache.py)
         """
         self.api_key = api_key or os.getenv("JINA_API_KEY")
         if not self.api_key:
@@ -53,6 +122,33 @@ class JobScraper:
                 "or pass api_key parameter."
             )
 
+        # Reused across scrapes so batch runs keep the connection to Jina open. The
+        # headers are passed per request, since the session may be shared with
+        # clients for other hosts.
+        self._owns_session = session is None
+        self.session = session or create_session()
+        self.cache_ttl = cache_ttl
+        self.headers = MappingProxyType({
+            "Authorization": f"Bearer {self.api_key}",
+            "X-Return-Format": "markdown"
+        })
+
+    def close(self) -> None:
+        """
+        Close the scraper's pooled connections.
+
+        A session passed in by the caller is left open, since other clients may
+        still be using it; whoever created it closes it.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "JobScraper":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def scrape_job_posting(self, url: str) -> JobPosting:
         """
         Scrape a job posting from the given URL.
@@ -66,19 +162,20 @@ class JobScraper:
         Raises:
             requests.RequestException: If the request fails
         """
-        # Use Jina Reader API to fetch clean markdown
-        jina_url = f"{self.JINA_READER_BASE_URL}{url}"
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "X-Return-Format": "markdown"
-        }
+        content = None
+        if self.cache_ttl:
+            from .scrape_cache import get_cached_page, put_cached_page
+            content = get_cached_page(url, max_age=self.cache_ttl)
 
         try:
-            response = requests.get(jina_url, headers=headers, timeout=30)
-            response.raise_for_status()
+            if content is None:
+                # Use Jina Reader API to fetch clean markdown
+                response = self._get(f"{self.JINA_READER_BASE_URL}{url}")
+                response.raise_for_status()
 
-            content = response.text
+                content = response.text
+                if self.cache_ttl:
+                    put_cached_page(url, content)
 
             # Create job posting object
             job = JobPosting(
@@ -97,32 +194,54 @@ class JobScraper:
         except requests.RequestException as e:
             raise Exception(f"Failed to scrape job posting: {str(e)}")
 
+    def scrape_many(self, urls: List[str], max_concurrency: int = MAX_CONCURRENT_SCRAPES) -> List[JobPosting]:
+        """
+        Scrape several job postings concurrently over the scraper's pooled session.
+
+        Args:
+            urls: URLs of the job postings
+            max_concurrency: Maximum pages fetched at the same time (default: 8)
+
+        Returns:
+            JobPosting objects, in the same order as urls
+
+        Raises:
+            Exception: If a scrape fails (the first failure, in URL order)
+        """
+        if not urls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(urls)))) as executor:
+            return list(executor.map(self.scrape_job_posting, urls))
+
+    def _get(self, url: str) -> requests.Response:
+        """
+        GET a Jina Reader URL, backing off exponentially (with jitter) on 429 and
+        transient 5xx responses.
+
+        Returns:
+            The final response (which may still be an error once retries are exhausted)
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            response = self.session.get(url, headers=self.headers, timeout=self.REQUEST_TIMEOUT_SECONDS)
+            if response.status_code not in self.RETRYABLE_STATUS_CODES or attempt == self.MAX_RETRIES:
+                return response
+            time.sleep(self.RETRY_BACKOFF_SECONDS * (2 ** attempt) * random.uniform(0.5, 1.5))
+
     def _extract_title(self, content: str, url: str) -> Optional[str]:
         """
         Extract job title from content.
 
         Looks for common patterns in job postings.
         """
-        # Try to find title patterns
-        patterns = [
-            r"^#\s+(.+?)(?:\n|$)",  # First H1 heading
-            r"Job Title:?\s*(.+?)(?:\n|$)",
-            r"Position:?\s*(.+?)(?:\n|$)",
-            r"Role:?\s*(.+?)(?:\n|$)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE | re.MULTILINE)
-            if match:
-                title = match.group(1).strip()
-                # Clean up markdown artifacts
-                title = re.sub(r'[#*\[\]()]', '', title).strip()
-                if title and len(title) < 150:  # Reasonable title length
-                    return title
+        # Try to find title patterns (150 chars is a reasonable title length)
+        title = self._match_field(self.TITLE_PATTERNS, content, max_length=150)
+        if title:
+            return title
 
         # Fallback: try to extract from URL
         if "linkedin.com" in url:
-            match = re.search(r'/jobs/view/([^/]+)', url)
+            match = self.LINKEDIN_JOB_PATTERN.search(url)
             if match:
                 return match.group(1).replace('-', ' ').title()
 
@@ -132,25 +251,13 @@ class JobScraper:
         """
         Extract company name from content.
         """
-        patterns = [
-            r"Company:?\s*(.+?)(?:\n|$)",
-            r"Organization:?\s*(.+?)(?:\n|$)",
-            r"##\s*About\s+(.+?)(?:\n|$)",
-            r"at\s+([A-Z][A-Za-z0-9\s&.,-]+?)(?:\n|Location:|$)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE | re.MULTILINE)
-            if match:
-                company = match.group(1).strip()
-                # Clean up
-                company = re.sub(r'[#*\[\]()]', '', company).strip()
-                if company and len(company) < 100:
-                    return company
+        company = self._match_field(self.COMPANY_PATTERNS, content, max_length=100)
+        if company:
+            return company
 
         # Try to extract from URL
         if "linkedin.com" in url:
-            match = re.search(r'company/([^/]+)', url)
+            match = self.LINKEDIN_COMPANY_PATTERN.search(url)
             if match:
                 return match.group(1).replace('-', ' ').title()
 
@@ -160,31 +267,41 @@ class JobScraper:
         """
         Extract job location from content.
         """
-        patterns = [
-            r"Location:?\s*(.+?)(?:\n|$)",
-            r"Based in:?\s*(.+?)(?:\n|$)",
-            r"Office:?\s*(.+?)(?:\n|$)",
-            # City, State pattern
-            r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?,\s*[A-Z]{2}(?:\s+\d{5})?)",
-            # City, Country pattern
-            r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?,\s*[A-Z][a-z]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE)
-            if match:
-                location = match.group(1).strip()
-                # Clean up
-                location = re.sub(r'[#*\[\]()]', '', location).strip()
-                if location and len(location) < 100:
-                    return location
+        location = self._match_field(self.LOCATION_PATTERNS, content, max_length=100)
+        if location:
+            return location
 
         # Check for remote work
-        if re.search(r'\b(remote|hybrid|work from home)\b', content, re.IGNORECASE):
+        if self.REMOTE_PATTERN.search(content):
             return "Remote"
 
         return None
 
+    def _match_field(self, patterns: Tuple[re.Pattern, ...], content: str, max_length: int) -> Optional[str]:
+        """
+        Return the first pattern's capture (in priority order) that is non-empty
+        and shorter than max_length once markdown artifacts are removed.
+
+        The patterns are tried on the head of the content first (cut at a line
+        break, so no line is truncated) and on the whole content only if none of
+        them gave a valid match there.
+        """
+        texts = (content,)
+        if len(content) > self.HEAD_WINDOW_CHARS:
+            cut = content.rfind("\n", 0, self.HEAD_WINDOW_CHARS)
+            if cut >= 0:
+                texts = (content[:cut + 1], content)
+
+        for text in texts:
+            for pattern in patterns:
+                match = pattern.search(text)
+                if match:
+                    value = self.MARKDOWN_ARTIFACTS.sub('', match.group(1).strip()).strip()
+                    if value and len(value) < max_length:
+                        return value
+
+        return None
+
 
 def scrape_job(url: str, api_key: Optional[str] = None) -> JobPosting:
     """
@@ -197,5 +314,5 @@ def scrape_job(url: str, api_key: Optional[str] = None) -> JobPosting:
     Returns:
         JobPosting object with extracted information
     """
-    scraper = JobScraper(api_key=api_key)
-    return scraper.scrape_job_posting(url)
+    with JobScraper(api_key=api_key) as scraper:
+        return scraper.scrape_job_posting(url)
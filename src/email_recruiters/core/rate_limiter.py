@@ -0,0 +1,48 @@
+"""
+Thread-safe token bucket for pacing API requests.
+
+Used to stay under a requests-per-minute quota proactively (e.g. Gemini's)
+instead of sending requests until the API starts answering 429.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Allows `requests_per_minute` acquisitions per minute, in bursts of at most `capacity`."""
+
+    def __init__(self, requests_per_minute: float, capacity: float = 1.0):
+        """
+        Initialize the bucket (full).
+
+        Args:
+            requests_per_minute: Sustained rate at which tokens are added
+            capacity: Maximum tokens stored, i.e. the largest burst allowed after idling
+
+        Raises:
+            ValueError: If requests_per_minute or capacity is not positive
+        """
+        if requests_per_minute <= 0 or capacity <= 0:
+            raise ValueError("requests_per_minute and capacity must be positive")
+
+        self.rate = requests_per_minute / 60.0
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # Reserve the token now (the balance may go negative) and wait outside
+            # the lock, so concurrent callers queue up one interval apart
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
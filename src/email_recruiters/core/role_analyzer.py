@@ -7,9 +7,18 @@ for cold emailing purposes using Google's Gemini LLM.
 
 import os
 import json
+import hashlib
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+
+from . import fast_json
+from .rate_limiter import TokenBucket
 
 
 @dataclass
@@ -100,13 +109,114 @@ Avoid suggesting:
 IMPORTANT: Return ONLY the JSON object, no additional text or markdown formatting.
 """
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.5-pro"):
+    # ANALYSIS_PROMPT split around {content} (braces unescaped), so building a prompt is a concatenation
+    PROMPT_PREFIX, PROMPT_SUFFIX = (
+        part.replace("{{", "{").replace("}}", "}")
+        for part in ANALYSIS_PROMPT.split("{content}")
+    )
+
+    # Same instructions, for several postings answered with one JSON array (see analyze_job_postings)
+    BATCH_ANALYSIS_PROMPT = (
+        ANALYSIS_PROMPT
+        .replace("Job Posting Content:\n{content}\n", "Job Postings ({count}):\n{content}\n")
+        .replace(
+            "Provide a JSON response with this exact structure:",
+            "For each posting, provide a JSON object with this exact structure:"
+        )
+        .replace(
+            "Return ONLY the JSON object, no additional text or markdown formatting.",
+            "Return ONLY a JSON array with one such object per posting, in the same order "
+            "as the postings, no additional text or markdown formatting."
+        )
+    )
+
+    # Structured output schemas: Gemini returns JSON matching these directly (no code fences)
+    ANALYSIS_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "job_info": {
+                "type": "object",
+                "properties": {
+                    field: {"type": "string", "nullable": True}
+                    for field in ("title", "company", "location", "company_domain", "linkedin_company")
+                },
+            },
+            "suggested_roles": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "title": {"type": "string"},
+                        "priority": {"type": "integer"},
+                        "keywords": {"type": "array", "items": {"type": "string"}},
+                        "reasoning": {"type": "string"},
+                    },
+                    "required": ["title", "priority", "keywords", "reasoning"],
+                },
+            },
+        },
+        "required": ["job_info", "suggested_roles"],
+    }
+    BATCH_ANALYSIS_SCHEMA = {"type": "array", "items": ANALYSIS_SCHEMA}
+
+    # Sampling temperature; a response that still fails to parse is retried once at 0
+    TEMPERATURE = 0.2
+
+    # Approximate input tokens of each posting included in a prompt (about 8000 characters)
+    MAX_INPUT_TOKENS = 2000
+    CHARS_PER_TOKEN = 4
+
+    # Jina Reader chrome that carries no signal: its "Published Time:"/"Markdown Content:"
+    # header lines and lines that are only an image
+    CONTENT_CHROME_PATTERN = re.compile(
+        r'^(?:Published Time:.*|Markdown Content:|[*-]?\s*(?:!\[[^\]]*\]\([^)]*\)\s*)+)[ \t]*$\n?',
+        re.MULTILINE
+    )
+    BLANK_LINES_PATTERN = re.compile(r'\n(?:[ \t]*\n){2,}')
+
+    # Postings analyzed per Gemini request by analyze_job_postings
+    ANALYSIS_BATCH_SIZE = 4
+
+    # Changes whenever anything shaping Gemini's answer is edited (prompt, response
+    # schema, temperature, content cleaning or budget), so cached analyses are invalidated
+    PROMPT_HASH = hashlib.sha256("\n".join([
+        ANALYSIS_PROMPT,
+        json.dumps(ANALYSIS_SCHEMA, sort_keys=True),
+        repr(TEMPERATURE),
+        repr(MAX_INPUT_TOKENS * CHARS_PER_TOKEN),
+        CONTENT_CHROME_PATTERN.pattern,
+        BLANK_LINES_PATTERN.pattern,
+    ]).encode("utf-8")).hexdigest()[:16]
+
+    DEFAULT_MODEL = "gemini-2.5-pro"
+
+    # Used to compare postings for the similarity cache (see core/analysis_cache.py)
+    EMBEDDING_MODEL = "models/text-embedding-004"
+    EMBEDDING_CONTENT_LIMIT = 4000
+
+    # Retry settings for rate-limited (429) and overloaded (503) Gemini requests
+    MAX_RETRIES = 3
+    RETRY_BACKOFF_SECONDS = 2.0
+    MAX_RETRY_BACKOFF_SECONDS = 60.0
+    RETRYABLE_ERRORS = (google_exceptions.ResourceExhausted, google_exceptions.ServiceUnavailable)
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = DEFAULT_MODEL,
+        requests_per_minute: Optional[float] = None,
+        max_input_tokens: int = MAX_INPUT_TOKENS
+    ):
         """
         Initialize the role analyzer.
 
         Args:
             api_key: Gemini API key. If not provided, will try to load from GEMINI_API_KEY env var.
             model: Gemini model to use (default: gemini-2.5-pro)
+            requests_per_minute: Optional Gemini quota to pace requests under, across
+                all threads using this analyzer (default: no pacing)
+            max_input_tokens: Approximate token budget for each posting's content in a
+                prompt (default: 2000)
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
@@ -118,6 +228,8 @@ IMPORTANT: Return ONLY the JSON object, no additional text or markdown formattin
         # Configure Gemini
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel(model)
+        self._rate_limiter = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.max_input_tokens = max_input_tokens
 
     def analyze_job_posting(
         self,
@@ -137,54 +249,180 @@ IMPORTANT: Return ONLY the JSON object, no additional text or markdown formattin
             Exception: If the API call fails or response parsing fails
         """
         # Build the prompt
-        prompt = self.ANALYSIS_PROMPT.format(
-            content=content[:8000]  # Limit content length for API
-        )
+        prompt = self.PROMPT_PREFIX + self._prompt_content(content) + self.PROMPT_SUFFIX
 
         try:
-            # Call Gemini API
-            response = self.model.generate_content(prompt)
-
-            # Extract the response text
-            response_text = response.text.strip()
-
-            # Remove markdown code blocks if present
-            if response_text.startswith("```"):
-                # Remove first line with ```json and last line with ```
-                lines = response_text.split("\n")
-                response_text = "\n".join(lines[1:-1])
-
-            # Parse JSON response
-            data = json.loads(response_text)
-
-            # Extract job info
-            job_info = data.get("job_info", {
-                "title": None,
-                "company": None,
-                "location": None
-            })
-
-            # Extract and convert suggested roles to ContactRole objects
-            roles = []
-            for role_data in data.get("suggested_roles", []):
-                role = ContactRole(
-                    title=role_data.get("title", ""),
-                    priority=role_data.get("priority", 99),
-                    keywords=role_data.get("keywords", []),
-                    reasoning=role_data.get("reasoning", "")
-                )
-                roles.append(role)
-
-            # Sort by priority
-            roles.sort(key=lambda x: x.priority)
-
-            return job_info, roles
-
-        except json.JSONDecodeError as e:
-            raise Exception(f"Failed to parse Gemini response as JSON: {str(e)}\nResponse: {response_text}")
+            data = self._generate_json(prompt, self.ANALYSIS_SCHEMA)
+            return self._parse_analysis(data)
         except Exception as e:
             raise Exception(f"Failed to analyze job posting with Gemini: {str(e)}")
 
+    def analyze_job_postings(
+        self,
+        contents: List[str],
+        batch_size: int = ANALYSIS_BATCH_SIZE
+    ) -> List[Tuple[Dict[str, str], List[ContactRole]]]:
+        """
+        Analyze several job postings, sending up to batch_size of them per Gemini request.
+
+        Batching spreads the per-request latency and the shared instructions over
+        several postings. A batch whose response can't be matched up with its
+        postings is analyzed again one posting at a time.
+
+        Args:
+            contents: Job posting contents (markdown text)
+            batch_size: Postings per Gemini request (default: 4)
+
+        Returns:
+            List of (job_info dict, list of ContactRole objects), one per posting, in order
+
+        Raises:
+            Exception: If the API call fails or response parsing fails
+        """
+        batch_size = max(1, batch_size)
+        results = []
+
+        for start in range(0, len(contents), batch_size):
+            batch = contents[start:start + batch_size]
+            if len(batch) == 1:
+                results.append(self.analyze_job_posting(batch[0]))
+                continue
+
+            try:
+                results.extend(self._analyze_batch(batch))
+            except Exception as e:
+                print(f"Warning: Batch analysis failed, analyzing postings individually: {str(e)}")
+                results.extend(self.analyze_job_posting(content) for content in batch)
+
+        return results
+
+    def _analyze_batch(self, contents: List[str]) -> List[Tuple[Dict[str, str], List[ContactRole]]]:
+        postings = "\n".join(
+            f"--- POSTING {number} ---\n{self._prompt_content(content)}\n"
+            for number, content in enumerate(contents, 1)
+        )
+        prompt = self.BATCH_ANALYSIS_PROMPT.format(count=len(contents), content=postings)
+
+        data = self._generate_json(prompt, self.BATCH_ANALYSIS_SCHEMA)
+        if not isinstance(data, list) or len(data) != len(contents):
+            raise Exception(f"Expected a JSON array of {len(contents)} analyses from Gemini")
+
+        return [self._parse_analysis(item) for item in data]
+
+    def analyze_many(
+        self,
+        contents: List[str],
+        max_workers: int = 8
+    ) -> List[Tuple[Dict[str, str], List[ContactRole]]]:
+        """
+        Analyze job postings concurrently, one Gemini request per posting.
+
+        Requests are paced by the analyzer's requests_per_minute, if set.
+
+        Args:
+            contents: Job posting contents (markdown text)
+            max_workers: Maximum analyses in flight at once (default: 8)
+
+        Returns:
+            List of (job_info dict, list of ContactRole objects), one per posting, in order
+
+        Raises:
+            Exception: If an analysis fails (the first failure, in posting order)
+        """
+        if not contents:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(contents)))) as executor:
+            return list(executor.map(self.analyze_job_posting, contents))
+
+    def _prompt_content(self, content: str) -> str:
+        """Posting content for a prompt: Jina chrome removed, blank lines collapsed, truncated to the token budget."""
+        content = self.CONTENT_CHROME_PATTERN.sub("", content)
+        content = self.BLANK_LINES_PATTERN.sub("\n\n", content).strip()
+        return content[:self.max_input_tokens * self.CHARS_PER_TOKEN]
+
+    def _generate_json(self, prompt: str, schema: Dict[str, Any]) -> Any:
+        """Send a prompt to Gemini and parse its JSON response, retrying once at temperature 0 if it is malformed."""
+        for temperature in (self.TEMPERATURE, 0.0):
+            response_text = self._generate(prompt, schema, temperature).text
+            try:
+                return fast_json.loads(response_text)
+            except json.JSONDecodeError as e:
+                # Also raised by orjson (its JSONDecodeError subclasses json's)
+                error = e
+
+        raise Exception(f"Failed to parse Gemini response as JSON: {str(error)}\nResponse: {response_text}")
+
+    def _generate(self, prompt: str, schema: Dict[str, Any], temperature: float):
+        """
+        Send a prompt to Gemini for a JSON response matching schema, backing off
+        exponentially (with jitter) when it is rate limited or overloaded.
+        """
+        generation_config = {
+            "response_mime_type": "application/json",
+            "response_schema": schema,
+            "temperature": temperature,
+        }
+        for attempt in range(self.MAX_RETRIES + 1):
+            if self._rate_limiter:
+                self._rate_limiter.acquire()
+            try:
+                return self.model.generate_content(prompt, generation_config=generation_config)
+            except self.RETRYABLE_ERRORS:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                delay = self.RETRY_BACKOFF_SECONDS * (2 ** attempt) * random.uniform(0.5, 1.5)
+                time.sleep(min(self.MAX_RETRY_BACKOFF_SECONDS, delay))
+
+    @staticmethod
+    def _parse_analysis(data: Dict[str, Any]) -> Tuple[Dict[str, str], List[ContactRole]]:
+        """Convert one parsed analysis object to (job_info, roles sorted by priority)."""
+        # Extract job info
+        job_info = data.get("job_info", {
+            "title": None,
+            "company": None,
+            "location": None
+        })
+
+        # Extract and convert suggested roles to ContactRole objects
+        roles = []
+        for role_data in data.get("suggested_roles", []):
+            role = ContactRole(
+                title=role_data.get("title", ""),
+                priority=role_data.get("priority", 99),
+                keywords=role_data.get("keywords", []),
+                reasoning=role_data.get("reasoning", "")
+            )
+            roles.append(role)
+
+        # Sort by priority
+        roles.sort(key=lambda x: x.priority)
+
+        return job_info, roles
+
+    def embed(self, content: str) -> List[float]:
+        """
+        Compute an embedding of job posting content for similarity comparisons.
+
+        Args:
+            content: Job posting content (only the first EMBEDDING_CONTENT_LIMIT characters are used)
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            Exception: If the API call fails
+        """
+        try:
+            result = genai.embed_content(
+                model=self.EMBEDDING_MODEL,
+                content=content[:self.EMBEDDING_CONTENT_LIMIT],
+                task_type="semantic_similarity"
+            )
+            return result["embedding"]
+        except Exception as e:
+            raise Exception(f"Failed to embed job posting with Gemini: {str(e)}")
+
     def analyze_from_job_posting(self, job_posting) -> Tuple[Dict[str, str], List[ContactRole]]:
         """
         Analyze a JobPosting object.
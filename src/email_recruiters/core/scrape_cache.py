@@ -0,0 +1,56 @@
+"""
+Cache of scraped job posting pages, keyed by URL.
+
+Jina Reader is the slowest step of an analysis. The analysis cache already
+skips it for URLs analyzed with the current model and prompt; this cache also
+covers re-analysis after the prompt or model changes (and repeated scrapes of
+URLs that weren't saved), for entries younger than the TTL. Pages are
+persisted in the SQLite database.
+
+Database errors are treated as a miss, so a broken cache only costs a fresh
+scrape.
+"""
+
+import hashlib
+from datetime import timedelta
+from typing import Optional
+
+from ..database.db import get_scraped_page, set_scraped_page
+
+# How long a scraped page is reused (postings get edited or taken down)
+SCRAPE_CACHE_TTL = timedelta(hours=24)
+
+
+def _url_key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def get_cached_page(url: str, max_age: Optional[timedelta] = SCRAPE_CACHE_TTL) -> Optional[str]:
+    """
+    Get the markdown last scraped for a URL.
+
+    Args:
+        url: Job posting URL
+        max_age: Maximum age of the cached page, or None for any age
+
+    Returns:
+        The scraped markdown, or None on a miss
+    """
+    try:
+        return get_scraped_page(_url_key(url), max_age=max_age)
+    except Exception:
+        return None
+
+
+def put_cached_page(url: str, content: str) -> None:
+    """
+    Remember the markdown scraped for a URL.
+
+    Args:
+        url: Job posting URL
+        content: Scraped markdown
+    """
+    try:
+        set_scraped_page(_url_key(url), content)
+    except Exception:
+        pass
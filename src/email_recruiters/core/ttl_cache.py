@@ -0,0 +1,64 @@
+"""
+Small in-process LRU cache with per-entry expiry.
+
+Used to memoize Apollo.io lookups that are repeated within one process
+(e.g. batch runs that resolve the same sequence for every job URL).
+"""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+def ttl_lru_cache(
+    maxsize: int = 128,
+    ttl: float = 300.0,
+    key: Optional[Callable[..., Hashable]] = None
+) -> Callable:
+    """
+    Decorator that caches a function's results for `ttl` seconds.
+
+    Args:
+        maxsize: Maximum number of entries kept; least recently used entries are evicted first
+        ttl: Seconds an entry stays valid
+        key: Optional function building the cache key from the call's arguments.
+            Defaults to the positional and keyword arguments themselves.
+
+    Returns:
+        Decorator. The wrapped function gains a `cache_clear()` method.
+    """
+    def decorator(func: Callable) -> Callable:
+        entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            with lock:
+                entry = entries.get(cache_key)
+                if entry is not None and entry[0] > now:
+                    entries.move_to_end(cache_key)
+                    return entry[1]
+
+            value = func(*args, **kwargs)
+
+            with lock:
+                entries[cache_key] = (now + ttl, value)
+                entries.move_to_end(cache_key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+
+            return value
+
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
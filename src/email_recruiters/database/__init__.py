@@ -3,7 +3,7 @@ Database models and utilities.
 """
 
 from .models import Base, AnalyzedJob, SuggestedRole, Contact
-from .db import Database, get_database, save_analyzed_job
+from .db import Database, get_database, save_analyzed_job, save_analyzed_job_with_contacts, get_analyzed_job_by_url
 
 __all__ = [
     "Base",
@@ -13,4 +13,6 @@ __all__ = [
     "Database",
     "get_database",
     "save_analyzed_job",
+    "save_analyzed_job_with_contacts",
+    "get_analyzed_job_by_url",
 ]
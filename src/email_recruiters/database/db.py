@@ -3,11 +3,15 @@ Database connection and session management.
 """
 
 import os
+import threading
+from datetime import datetime, timedelta
 from pathlib import Path
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, event, func, insert, inspect, make_url, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import lazyload, sessionmaker, Session
 from contextlib import contextmanager
-from typing import Generator, Optional
+from typing import Dict, Generator, Iterable, Iterator, List, Optional, Tuple
 
 from .models import Base
 
@@ -15,6 +19,57 @@ from .models import Base
 # Default database location
 DEFAULT_DB_PATH = Path.home() / ".email_recruiters" / "data.db"
 
+# Database URLs whose tables were already created by this process
+_initialized_urls = set()
+
+# Connections kept open / allowed on top of those. batch-add's scrape workers (8) and
+# fetch and write workers (up to 16 each with --workers) can all hold a session at once,
+# more than SQLAlchemy's default 5 + 10, which would block them for up to the pool timeout
+DB_POOL_SIZE = 10
+DB_POOL_MAX_OVERFLOW = 20
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE, used to upsert analyzed jobs by URL
+UPSERT_INSERTS = {"sqlite": sqlite_insert, "postgresql": pg_insert}
+
+# Rows fetched per round trip when scanning the similarity cache's embeddings
+EMBEDDING_SCAN_BATCH_SIZE = 1000
+
+# Number of new contacts inserted per flush in save_contacts
+CONTACT_INSERT_CHUNK_SIZE = 500
+
+# Applied to every SQLite connection: WAL lets readers run alongside a writer and,
+# with synchronous=NORMAL, commits no longer fsync the main database file each time.
+# cache_size is in KiB when negative (64 MiB page cache instead of the 2 MiB default)
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """SQLAlchemy connect hook that tunes a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _pool_options(url) -> dict:
+    """create_engine options sizing the connection pool for the process's worker threads."""
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory databases use a single-connection pool with no size settings
+        return {}
+    options = {"pool_size": DB_POOL_SIZE, "max_overflow": DB_POOL_MAX_OVERFLOW}
+    if url.get_backend_name() != "sqlite":
+        # Networked servers drop idle connections; check before reuse instead of failing a query
+        options["pool_pre_ping"] = True
+    return options
+
 
 class Database:
     """Database connection manager."""
@@ -36,7 +91,9 @@ class Database:
                 # Assume it's a file path
                 db_path = f"sqlite:///{db_path}"
 
-        self.engine = create_engine(db_path, echo=False)
+        self.engine = create_engine(db_path, echo=False, **_pool_options(make_url(db_path)))
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", _apply_sqlite_pragmas)
         self.SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
@@ -44,12 +101,41 @@ class Database:
         )
 
     def create_tables(self):
-        """Create all database tables."""
+        """Create all database tables (once per database file per process)."""
+        url = self.engine.url.render_as_string(hide_password=False)
+        # Every in-memory engine is a separate database, so those are always set up
+        persistent = self.engine.url.database not in (None, "", ":memory:")
+        if persistent and url in _initialized_urls:
+            return
+
         Base.metadata.create_all(bind=self.engine)
+        # create_all skips tables that already exist, so add indexes introduced
+        # since an existing database was created
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.dialect_kwargs.get("postgresql_using") == "gin" and not self._columns_are_jsonb(index):
+                    # Older PostgreSQL databases still store these columns as json,
+                    # which GIN jsonb_path_ops can't index until they're converted
+                    continue
+                index.create(bind=self.engine, checkfirst=True)
+
+        if persistent:
+            _initialized_urls.add(url)
+
+    def _columns_are_jsonb(self, index) -> bool:
+        """Whether every column of index is stored as jsonb in the existing database."""
+        if self.engine.dialect.name != "postgresql":
+            return True
+        types = {
+            column["name"]: str(column["type"]).lower()
+            for column in inspect(self.engine).get_columns(index.table.name)
+        }
+        return all(types.get(column.name) == "jsonb" for column in index.columns)
 
     def drop_tables(self):
         """Drop all database tables."""
         Base.metadata.drop_all(bind=self.engine)
+        _initialized_urls.discard(self.engine.url.render_as_string(hide_password=False))
 
     @contextmanager
     def session(self) -> Generator[Session, None, None]:
@@ -75,6 +161,7 @@ class Database:
 
 # Global database instance
 _db_instance = None
+_db_lock = threading.Lock()
 
 
 def get_database(db_path: Optional[str] = None) -> Database:
@@ -89,11 +176,169 @@ def get_database(db_path: Optional[str] = None) -> Database:
     """
     global _db_instance
     if _db_instance is None:
-        _db_instance = Database(db_path)
-        _db_instance.create_tables()
+        # Double-checked so concurrent workers don't each build an engine
+        with _db_lock:
+            if _db_instance is None:
+                instance = Database(db_path)
+                instance.create_tables()
+                _db_instance = instance
     return _db_instance
 
 
+def _write_analyzed_job(
+    session: Session,
+    url: str,
+    title: Optional[str],
+    company: Optional[str],
+    location: Optional[str],
+    company_domain: Optional[str],
+    linkedin_company_url: Optional[str],
+    description: Optional[str],
+    raw_content: Optional[str],
+    suggested_roles: list
+) -> int:
+    """Insert or update a job and its suggested roles in the given session. Returns the job ID."""
+    from .models import AnalyzedJob, SuggestedRole
+
+    fields = {
+        "title": title,
+        "company": company,
+        "location": location,
+        "company_domain": company_domain,
+        "linkedin_company_url": linkedin_company_url,
+        # The scraper uses the full content as the description; store that text once
+        "description": None if description == raw_content else description,
+        "raw_content": raw_content,
+    }
+
+    dialect = session.get_bind().dialect
+    upsert_insert = UPSERT_INSERTS.get(dialect.name)
+    if upsert_insert is not None and dialect.insert_returning:
+        # One INSERT ... ON CONFLICT(url) DO UPDATE ... RETURNING id instead of SELECT + UPDATE/INSERT
+        stmt = upsert_insert(AnalyzedJob).values(url=url, **fields)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AnalyzedJob.url],
+            set_={**fields, "updated_at": func.now()}
+        )
+        job_id = session.execute(stmt.returning(AnalyzedJob.id)).scalar_one()
+    else:
+        # Check if job already exists (its old roles are deleted below, so don't load them)
+        job = (
+            session.query(AnalyzedJob)
+            .options(lazyload(AnalyzedJob.suggested_roles))
+            .filter_by(url=url)
+            .first()
+        )
+        if job:
+            # Update existing job
+            for name, value in fields.items():
+                setattr(job, name, value)
+        else:
+            # Create new job
+            job = AnalyzedJob(url=url, **fields)
+            session.add(job)
+
+        # Flush to get the job ID
+        session.flush()
+        job_id = job.id
+
+    # Remove old suggested roles in one DELETE (no-op for a new job)
+    session.query(SuggestedRole).filter_by(job_id=job_id).delete(synchronize_session=False)
+
+    # Add suggested roles with one ORM bulk INSERT (multi-row VALUES); nothing uses
+    # them as objects afterwards, so skip building and tracking instances
+    if suggested_roles:
+        session.execute(insert(SuggestedRole), [
+            {
+                "job_id": job_id,
+                "title": role.title,
+                "priority": role.priority,
+                "keywords": role.keywords,
+                "reasoning": role.reasoning,
+            }
+            for role in suggested_roles
+        ])
+
+    return job_id
+
+
+def _email_key(email: str) -> str:
+    """Email address as compared when matching contacts (addresses are case-insensitive)."""
+    return email.strip().lower()
+
+
+def _write_contacts(session: Session, job_id: int, contacts: Iterable) -> int:
+    """Insert or update contacts for a job in the given session. Returns the number of new contacts."""
+    from .models import Contact
+    from ..core.apollo_search import LOCKED_EMAILS
+
+    # Load the job's existing contacts once instead of querying per contact.
+    # Apollo's locked-email placeholder is shared by many people, so it's never a match key;
+    # other emails match case-insensitively.
+    by_email = {}
+    by_linkedin = {}
+    for existing in session.query(Contact).filter_by(job_id=job_id).order_by(Contact.id):
+        if existing.email not in LOCKED_EMAILS:
+            by_email.setdefault(_email_key(existing.email), existing)
+        if existing.linkedin_url:
+            by_linkedin.setdefault(existing.linkedin_url, existing)
+
+    saved_count = 0
+    pending = []
+
+    for contact in contacts:
+        # Check if contact already exists (by email or LinkedIn URL)
+        existing_contact = None
+        has_email = contact.email not in LOCKED_EMAILS
+
+        if has_email:
+            existing_contact = by_email.get(_email_key(contact.email))
+
+        if not existing_contact and contact.linkedin_url:
+            existing_contact = by_linkedin.get(contact.linkedin_url)
+
+        if existing_contact:
+            # Update existing contact
+            existing_contact.name = contact.name
+            existing_contact.title = contact.title
+            existing_contact.company = contact.company
+            if existing_contact.email in LOCKED_EMAILS and has_email:
+                existing_contact.email = contact.email
+                by_email.setdefault(_email_key(contact.email), existing_contact)
+            if not existing_contact.linkedin_url and contact.linkedin_url:
+                existing_contact.linkedin_url = contact.linkedin_url
+                by_linkedin.setdefault(contact.linkedin_url, existing_contact)
+        else:
+            # Create new contact
+            new_contact = Contact(
+                job_id=job_id,
+                name=contact.name,
+                email=contact.email,
+                title=contact.title,
+                company=contact.company,
+                linkedin_url=contact.linkedin_url,
+                source="apollo",
+                status="new"
+            )
+            if has_email:
+                by_email[_email_key(contact.email)] = new_contact
+            if contact.linkedin_url:
+                by_linkedin[contact.linkedin_url] = new_contact
+            pending.append(new_contact)
+            saved_count += 1
+
+            # Flushed in chunks; SQLAlchemy batches each chunk into multi-row INSERTs
+            if len(pending) >= CONTACT_INSERT_CHUNK_SIZE:
+                session.add_all(pending)
+                session.flush()
+                pending = []
+
+    if pending:
+        session.add_all(pending)
+
+    return saved_count
+
+
 def save_analyzed_job(
     url: str,
     title: Optional[str],
@@ -124,125 +369,388 @@ def save_analyzed_job(
     Returns:
         ID of the saved job
     """
-    from .models import AnalyzedJob, SuggestedRole
-
     if db is None:
         db = get_database()
 
     with db.session() as session:
-        # Check if job already exists
-        existing_job = session.query(AnalyzedJob).filter_by(url=url).first()
-        if existing_job:
-            # Update existing job
-            existing_job.title = title
-            existing_job.company = company
-            existing_job.location = location
-            existing_job.company_domain = company_domain
-            existing_job.linkedin_company_url = linkedin_company_url
-            existing_job.description = description
-            existing_job.raw_content = raw_content
-
-            # Remove old suggested roles
-            for role in existing_job.suggested_roles:
-                session.delete(role)
-
-            job = existing_job
-        else:
-            # Create new job
-            job = AnalyzedJob(
-                url=url,
-                title=title,
-                company=company,
-                location=location,
-                company_domain=company_domain,
-                linkedin_company_url=linkedin_company_url,
-                description=description,
-                raw_content=raw_content
-            )
-            session.add(job)
-
-        # Flush to get the job ID
-        session.flush()
-
-        # Add suggested roles
-        for role in suggested_roles:
-            suggested_role = SuggestedRole(
-                job_id=job.id,
-                title=role.title,
-                priority=role.priority,
-                keywords=role.keywords,
-                reasoning=role.reasoning
-            )
-            session.add(suggested_role)
-
+        job_id = _write_analyzed_job(
+            session, url, title, company, location, company_domain,
+            linkedin_company_url, description, raw_content, suggested_roles
+        )
         session.commit()
-        return job.id
+        return job_id
 
 
 def save_contacts(
     job_id: int,
-    contacts: list,
+    contacts: Iterable,
     db: Optional[Database] = None
 ) -> int:
     """
     Save contacts from Apollo.io to the database.
 
+    Contacts are consumed lazily, so any iterable (e.g. a generator) works, and
+    new rows are inserted in chunks of CONTACT_INSERT_CHUNK_SIZE.
+
     Args:
         job_id: ID of the job these contacts are associated with
-        contacts: List of ApolloContact objects
+        contacts: Iterable of ApolloContact objects
         db: Optional Database instance
 
     Returns:
         Number of contacts saved
     """
-    from .models import Contact
+    if db is None:
+        db = get_database()
 
+    with db.session() as session:
+        saved_count = _write_contacts(session, job_id, contacts)
+        session.commit()
+
+    return saved_count
+
+
+def save_analyzed_job_with_contacts(
+    url: str,
+    title: Optional[str],
+    company: Optional[str],
+    location: Optional[str],
+    company_domain: Optional[str],
+    linkedin_company_url: Optional[str],
+    description: Optional[str],
+    raw_content: Optional[str],
+    suggested_roles: list,
+    contacts: Iterable = (),
+    db: Optional[Database] = None
+) -> Tuple[int, int]:
+    """
+    Save an analyzed job posting and its Apollo.io contacts in a single transaction.
+
+    Args:
+        url: Job posting URL
+        title: Job title
+        company: Company name
+        location: Job location
+        company_domain: Company website domain
+        linkedin_company_url: LinkedIn company page URL
+        description: Job description
+        raw_content: Raw content from scraper
+        suggested_roles: List of ContactRole objects
+        contacts: Iterable of ApolloContact objects
+        db: Optional Database instance
+
+    Returns:
+        Tuple of (job ID, number of contacts saved)
+    """
     if db is None:
         db = get_database()
 
-    saved_count = 0
+    with db.session() as session:
+        job_id = _write_analyzed_job(
+            session, url, title, company, location, company_domain,
+            linkedin_company_url, description, raw_content, suggested_roles
+        )
+        saved_count = _write_contacts(session, job_id, contacts)
+        session.commit()
+        return job_id, saved_count
+
+
+def get_analyzed_job_by_url(url: str, db: Optional[Database] = None) -> Optional[dict]:
+    """
+    Look up a previously saved analysis of a job URL.
+
+    Args:
+        url: Job posting URL
+        db: Optional Database instance
+
+    Returns:
+        Dictionary with the stored job fields and a "suggested_roles" list of
+        role dictionaries (ordered by priority), or None if the URL was never saved
+    """
+    from .models import AnalyzedJob, job_with_roles_options
+
+    if db is None:
+        db = get_database()
 
     with db.session() as session:
-        for contact in contacts:
-            # Check if contact already exists (by email or LinkedIn URL)
-            existing_contact = None
-
-            if contact.email:
-                existing_contact = session.query(Contact).filter_by(
-                    email=contact.email,
-                    job_id=job_id
-                ).first()
-
-            if not existing_contact and contact.linkedin_url:
-                existing_contact = session.query(Contact).filter_by(
-                    linkedin_url=contact.linkedin_url,
-                    job_id=job_id
-                ).first()
-
-            if existing_contact:
-                # Update existing contact
-                existing_contact.name = contact.name
-                existing_contact.title = contact.title
-                existing_contact.company = contact.company
-                if not existing_contact.email and contact.email:
-                    existing_contact.email = contact.email
-                if not existing_contact.linkedin_url and contact.linkedin_url:
-                    existing_contact.linkedin_url = contact.linkedin_url
-            else:
-                # Create new contact
-                new_contact = Contact(
-                    job_id=job_id,
-                    name=contact.name,
-                    email=contact.email,
-                    title=contact.title,
-                    company=contact.company,
-                    linkedin_url=contact.linkedin_url,
-                    source="apollo",
-                    status="new"
-                )
-                session.add(new_contact)
-                saved_count += 1
+        job = (
+            session.query(AnalyzedJob)
+            .options(*job_with_roles_options(with_text=True))
+            .filter_by(url=url)
+            .first()
+        )
+        if job is None:
+            return None
+        return {
+            "url": job.url,
+            "title": job.title,
+            "company": job.company,
+            "location": job.location,
+            "company_domain": job.company_domain,
+            "linkedin_company_url": job.linkedin_company_url,
+            "description": job.raw_content if job.description is None else job.description,
+            "raw_content": job.raw_content,
+            "suggested_roles": [
+                {
+                    "title": role.title,
+                    "priority": role.priority,
+                    "keywords": role.keywords,
+                    "reasoning": role.reasoning,
+                }
+                for role in sorted(job.suggested_roles, key=lambda r: r.priority)
+            ],
+        }
+
+
+def get_cached_analysis(
+    cache_key: str,
+    version: str,
+    db: Optional[Database] = None,
+    max_age: Optional[timedelta] = None
+) -> Optional[str]:
+    """
+    Look up a cached analysis payload.
 
-        session.commit()
+    Args:
+        cache_key: Hash identifying the analysis inputs
+        version: Analyzer version the payload must have been built with
+        db: Optional Database instance
+        max_age: Optional maximum age of the entry; older entries count as a miss
 
-    return saved_count
+    Returns:
+        The JSON payload, or None if missing, expired, or built with a different version
+    """
+    from .models import AnalysisCacheEntry
+
+    if db is None:
+        db = get_database()
+
+    with db.session() as session:
+        entry = session.get(AnalysisCacheEntry, cache_key)
+        if entry is None or entry.version != version:
+            return None
+        if max_age is not None and entry.created_at and datetime.utcnow() - entry.created_at > max_age:
+            return None
+        return entry.payload
+
+
+def set_cached_analysis(
+    cache_key: str,
+    version: str,
+    payload: str,
+    db: Optional[Database] = None
+) -> None:
+    """
+    Store (or replace) a cached analysis payload.
+
+    Args:
+        cache_key: Hash identifying the analysis inputs
+        version: Analyzer version the payload was built with
+        payload: JSON payload to store
+        db: Optional Database instance
+    """
+    from .models import AnalysisCacheEntry
+
+    if db is None:
+        db = get_database()
+
+    with db.session() as session:
+        session.merge(AnalysisCacheEntry(
+            cache_key=cache_key,
+            version=version,
+            payload=payload,
+            created_at=datetime.utcnow()
+        ))
+
+
+def iter_analysis_embeddings(
+    version: str,
+    db: Optional[Database] = None,
+    batch_size: int = EMBEDDING_SCAN_BATCH_SIZE
+) -> Iterator[Tuple[str, bytes]]:
+    """
+    Stream the cached analysis embeddings built with an analyzer version.
+
+    Rows are fetched batch_size at a time while the caller iterates, so memory
+    stays bounded however many analyses are cached. Payloads aren't loaded; fetch
+    the one needed with get_analysis_embedding_payload.
+
+    Args:
+        version: Analyzer version the payloads must have been built with
+        db: Optional Database instance
+        batch_size: Rows fetched per round trip
+
+    Yields:
+        (cache key, embedding bytes) tuples
+    """
+    from .models import AnalysisEmbedding
+
+    if db is None:
+        db = get_database()
+
+    with db.session() as session:
+        rows = session.execute(
+            select(AnalysisEmbedding.cache_key, AnalysisEmbedding.embedding)
+            .filter_by(version=version)
+            .execution_options(yield_per=batch_size)
+        )
+        for row in rows:
+            yield row.cache_key, row.embedding
+
+
+def get_analysis_embedding_payload(cache_key: str, db: Optional[Database] = None) -> Optional[str]:
+    """
+    Get the JSON payload stored with a cached analysis embedding.
+
+    Args:
+        cache_key: Hash identifying the analyzed content
+        db: Optional Database instance
+
+    Returns:
+        The JSON payload, or None if there is no such entry
+    """
+    from .models import AnalysisEmbedding
+
+    if db is None:
+        db = get_database()
+
+    with db.session() as session:
+        return session.query(AnalysisEmbedding.payload).filter_by(cache_key=cache_key).scalar()
+
+
+def set_analysis_embedding(
+    cache_key: str,
+    version: str,
+    embedding: bytes,
+    payload: str,
+    db: Optional[Database] = None
+) -> None:
+    """
+    Store (or replace) a cached analysis along with its content embedding.
+
+    Args:
+        cache_key: Hash identifying the analyzed content
+        version: Analyzer version the payload was built with
+        embedding: Serialized, L2-normalized embedding vector
+        payload: JSON payload to store
+        db: Optional Database instance
+    """
+    from .models import AnalysisEmbedding
+
+    if db is None:
+        db = get_database()
+
+    with db.session() as session:
+        session.merge(AnalysisEmbedding(
+            cache_key=cache_key,
+            version=version,
+            embedding=embedding,
+            payload=payload,
+            created_at=datetime.utcnow()
+        ))
+
+
+def get_apollo_contact_ids(
+    account: str,
+    emails: List[str],
+    db: Optional[Database] = None,
+    max_age: Optional[timedelta] = None
+) -> Dict[str, str]:
+    """
+    Look up the Apollo.io contacts previously created for email addresses.
+
+    Args:
+        account: Apollo account the contacts were created in (ApolloClient.api_key_hash)
+        emails: Lowercased email addresses
+        db: Optional Database instance
+        max_age: Optional maximum age of an entry; older entries count as a miss
+
+    Returns:
+        Dictionary of email -> Apollo contact ID for the emails found
+    """
+    from .models import ApolloContactId
+
+    if not emails:
+        return {}
+
+    if db is None:
+        db = get_database()
+
+    with db.session() as session:
+        query = session.query(ApolloContactId).filter(
+            ApolloContactId.account == account,
+            ApolloContactId.email.in_(emails)
+        )
+        if max_age is not None:
+            query = query.filter(ApolloContactId.created_at >= datetime.utcnow() - max_age)
+        return {row.email: row.contact_id for row in query}
+
+
+def set_apollo_contact_ids(account: str, contact_ids: Dict[str, str], db: Optional[Database] = None) -> None:
+    """
+    Store (or replace) the Apollo.io contacts created for email addresses.
+
+    Args:
+        account: Apollo account the contacts were created in (ApolloClient.api_key_hash)
+        contact_ids: Dictionary of lowercased email -> Apollo contact ID
+        db: Optional Database instance
+    """
+    from .models import ApolloContactId
+
+    if not contact_ids:
+        return
+
+    if db is None:
+        db = get_database()
+
+    now = datetime.utcnow()
+    with db.session() as session:
+        for email, contact_id in contact_ids.items():
+            session.merge(ApolloContactId(account=account, email=email, contact_id=contact_id, created_at=now))
+
+
+def get_scraped_page(
+    url_hash: str,
+    db: Optional[Database] = None,
+    max_age: Optional[timedelta] = None
+) -> Optional[str]:
+    """
+    Look up the page content last scraped for a URL.
+
+    Args:
+        url_hash: sha256 hex digest of the URL
+        db: Optional Database instance
+        max_age: Optional maximum age of the entry; an older entry counts as a miss
+
+    Returns:
+        The scraped markdown, or None on a miss
+    """
+    from .models import ScrapedPage
+
+    if db is None:
+        db = get_database()
+
+    with db.session() as session:
+        query = session.query(ScrapedPage.content).filter(ScrapedPage.url_hash == url_hash)
+        if max_age is not None:
+            query = query.filter(ScrapedPage.created_at >= datetime.utcnow() - max_age)
+        row = query.first()
+        return row.content if row else None
+
+
+def set_scraped_page(url_hash: str, content: str, db: Optional[Database] = None) -> None:
+    """
+    Store (or replace) the page content scraped for a URL.
+
+    Args:
+        url_hash: sha256 hex digest of the URL
+        content: Scraped markdown
+        db: Optional Database instance
+    """
+    from .models import ScrapedPage
+
+    if db is None:
+        db = get_database()
+
+    with db.session() as session:
+        session.merge(ScrapedPage(url_hash=url_hash, content=content, created_at=datetime.utcnow()))
@@ -2,13 +2,70 @@
 Database models for storing analyzed job postings and contact roles.
 """
 
-from datetime import datetime
+import zlib
 from typing import Optional
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
-
-Base = declarative_base()
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, JSON, LargeBinary, MetaData
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import declarative_base, deferred, raiseload, relationship, selectinload, undefer
+from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Deterministic constraint and index names, identical on every backend (the index
+# pattern matches SQLAlchemy's default, so existing indexes keep their names)
+NAMING_CONVENTION = {
+    "ix": "ix_%(column_0_label)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "ck": "ck_%(table_name)s_%(constraint_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+}
+
+Base = declarative_base(metadata=MetaData(naming_convention=NAMING_CONVENTION))
+
+# Every zstd frame starts with these bytes (a zlib stream never does)
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text stored compressed as a BLOB: zstd (level 3) when zstandard is installed
+    (pip install "email-recruiters[fast]"), zlib (level 1) otherwise.
+
+    Scraped job pages and cached analysis payloads are large and compress well. Values are decoded by their
+    format, so zlib rows and rows written before compression was introduced keep
+    working: plain strings (SQLite TEXT) are returned unchanged, and uncompressed
+    UTF-8 bytes (PostgreSQL text columns converted to bytea) are decoded.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if zstandard is not None:
+            return zstandard.compress(value.encode("utf-8"), 3)
+        return zlib.compress(value.encode("utf-8"), 1)
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        if value[:4] == ZSTD_MAGIC:
+            if zstandard is None:
+                raise Exception(
+                    "Database contains zstd-compressed text; install zstandard "
+                    '(pip install "email-recruiters[fast]") to read it'
+                )
+            return zstandard.decompress(value).decode("utf-8")
+        try:
+            return zlib.decompress(value).decode("utf-8")
+        except zlib.error:
+            return value.decode("utf-8")
 
 
 class AnalyzedJob(Base):
@@ -23,16 +80,20 @@ class AnalyzedJob(Base):
     location = Column(String(200), nullable=True)
     company_domain = Column(String(200), nullable=True)
     linkedin_company_url = Column(String(500), nullable=True)
-    description = Column(Text, nullable=True)
-    raw_content = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-    # Relationship to suggested roles
+    # Long text is deferred, so queries that don't show it skip reading and
+    # decompressing it (opt in with undefer(), see job_with_roles_options)
+    description = deferred(Column(CompressedText, nullable=True))
+    raw_content = deferred(Column(CompressedText, nullable=True))
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    # Relationship to suggested roles, loaded with one extra SELECT ... IN for all
+    # jobs a query returns (instead of one SELECT per job on first access)
     suggested_roles = relationship(
         "SuggestedRole",
         back_populates="job",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="selectin"
     )
 
     def __repr__(self):
@@ -45,16 +106,27 @@ class SuggestedRole(Base):
     __tablename__ = "suggested_roles"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    job_id = Column(Integer, ForeignKey("analyzed_jobs.id"), nullable=False)
+    job_id = Column(Integer, ForeignKey("analyzed_jobs.id"), nullable=False, index=True)
     title = Column(String(200), nullable=False)
     priority = Column(Integer, nullable=False)
-    keywords = Column(JSON, nullable=False)  # List of search keywords
-    reasoning = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # List of search keywords (binary JSONB on PostgreSQL, so it's parsed once and indexable)
+    keywords = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+    reasoning = deferred(Column(Text, nullable=True))
+    created_at = Column(DateTime, default=func.now())
 
     # Relationship back to job
     job = relationship("AnalyzedJob", back_populates="suggested_roles")
 
+    __table_args__ = (
+        # Keyword containment lookups (keywords @> '["Python"]'); PostgreSQL only
+        Index(
+            "ix_suggested_roles_keywords_gin",
+            "keywords",
+            postgresql_using="gin",
+            postgresql_ops={"keywords": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     def __repr__(self):
         return f"<SuggestedRole(id={self.id}, title='{self.title}', priority={self.priority})>"
 
@@ -65,17 +137,103 @@ class Contact(Base):
     __tablename__ = "contacts"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    job_id = Column(Integer, ForeignKey("analyzed_jobs.id"), nullable=True)
+    job_id = Column(Integer, ForeignKey("analyzed_jobs.id"), nullable=True, index=True)
     name = Column(String(200), nullable=False)
     email = Column(String(200), nullable=True)
     title = Column(String(200), nullable=True)
     company = Column(String(200), nullable=True)
     linkedin_url = Column(String(500), nullable=True)
     source = Column(String(100), nullable=True)  # e.g., "apollo", "linkedin", "manual"
-    notes = Column(Text, nullable=True)
+    notes = deferred(Column(Text, nullable=True))
     status = Column(String(50), default="new")  # new, contacted, responded, etc.
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
     def __repr__(self):
         return f"<Contact(id={self.id}, name='{self.name}', title='{self.title}')>"
+
+
+class AnalysisCacheEntry(Base):
+    """Represents a cached job analysis, keyed by a hash of the analysis inputs."""
+
+    __tablename__ = "analysis_cache"
+
+    cache_key = Column(String(64), primary_key=True)  # sha256 hex digest
+    version = Column(String(100), nullable=False)  # model + prompt hash the payload was built with
+    payload = Column(CompressedText, nullable=False)  # JSON: job, job_info, suggested_roles
+    created_at = Column(DateTime, default=func.now())
+
+    def __repr__(self):
+        return f"<AnalysisCacheEntry(cache_key='{self.cache_key}', version='{self.version}')>"
+
+
+class AnalysisEmbedding(Base):
+    """Represents a cached job analysis, keyed by job content and searchable by embedding similarity."""
+
+    __tablename__ = "analysis_embeddings"
+
+    cache_key = Column(String(64), primary_key=True)  # sha256 hex digest of the content
+    version = Column(String(100), nullable=False, index=True)  # model + prompt hash the payload was built with
+    embedding = Column(LargeBinary, nullable=False)  # L2-normalized float32 vector
+    payload = Column(CompressedText, nullable=False)  # JSON: job_info, suggested_roles
+    created_at = Column(DateTime, default=func.now())
+
+    def __repr__(self):
+        return f"<AnalysisEmbedding(cache_key='{self.cache_key}', version='{self.version}')>"
+
+
+class ApolloContactId(Base):
+    """Represents the Apollo.io contact created for an email address in one Apollo account."""
+
+    # Contact IDs are only valid in the account that created them. Replaces the
+    # earlier apollo_contact_ids table, which was keyed by email alone and is no longer read
+    __tablename__ = "apollo_account_contact_ids"
+
+    account = Column(String(16), primary_key=True)  # ApolloClient.api_key_hash
+    email = Column(String(200), primary_key=True)  # lowercased
+    contact_id = Column(String(100), nullable=False)
+    created_at = Column(DateTime, default=func.now())
+
+    def __repr__(self):
+        return f"<ApolloContactId(account='{self.account}', email='{self.email}', contact_id='{self.contact_id}')>"
+
+
+class ScrapedPage(Base):
+    """Represents a job posting page as last fetched from Jina Reader, keyed by a hash of its URL."""
+
+    __tablename__ = "scraped_pages"
+
+    url_hash = Column(String(64), primary_key=True)  # sha256 hex digest of the URL
+    content = Column(CompressedText, nullable=False)  # markdown returned by Jina
+    created_at = Column(DateTime, default=func.now())
+
+    def __repr__(self):
+        return f"<ScrapedPage(url_hash='{self.url_hash}')>"
+
+
+def job_with_roles_options(with_text: bool = False) -> tuple:
+    """
+    Loader options for reading jobs together with their suggested roles.
+
+    Roles are loaded with one SELECT ... IN for all returned jobs, and any other
+    relationship access that would need a query raises instead of silently
+    issuing one per row:
+
+        session.query(AnalyzedJob).options(*job_with_roles_options())
+
+    Args:
+        with_text: Also load the deferred long text (job description, scraped
+            page and role reasoning) in the same queries
+
+    Returns:
+        Tuple of loader options
+    """
+    roles = selectinload(AnalyzedJob.suggested_roles)
+    if not with_text:
+        return (roles, raiseload("*", sql_only=True))
+    return (
+        roles.undefer(SuggestedRole.reasoning),
+        undefer(AnalyzedJob.description),
+        undefer(AnalyzedJob.raw_content),
+        raiseload("*", sql_only=True),
+    )
@@ -0,0 +1,40 @@
+"""
+Shared pytest configuration.
+"""
+
+import pytest
+from dotenv import load_dotenv
+
+from email_recruiters.database import db as db_module
+from email_recruiters.database.db import Database
+from email_recruiters.database.models import Base
+
+
+@pytest.fixture(scope="session", autouse=True)
+def load_env():
+    """Load API keys from .env once for the whole test session."""
+    load_dotenv()
+
+
+@pytest.fixture(scope="session")
+def database_engine():
+    """One in-memory SQLite database shared by the whole test session."""
+    return Database("sqlite:///:memory:")
+
+
+@pytest.fixture
+def database(database_engine):
+    """The session database with freshly created, empty tables."""
+    # Recreate the schema in one transaction. Dropping first guarantees the tables
+    # are gone, so create_all can skip its per-table existence checks
+    with database_engine.engine.begin() as conn:
+        Base.metadata.drop_all(conn, checkfirst=True)
+        Base.metadata.create_all(conn, checkfirst=False)
+    return database_engine
+
+
+@pytest.fixture
+def global_database(database, monkeypatch):
+    """The test database, also returned by get_database() (used by the caches)."""
+    monkeypatch.setattr(db_module, "_db_instance", database)
+    return database
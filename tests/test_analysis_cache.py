@@ -0,0 +1,127 @@
+"""
+Tests for the job analysis cache.
+"""
+
+from collections import OrderedDict
+
+import pytest
+
+from email_recruiters.core import analysis_cache
+from email_recruiters.core.analysis_cache import (
+    _content_key,
+    _url_key,
+    find_similar_roles,
+    get_cached,
+    get_cached_roles,
+    put_cached,
+    put_cached_roles,
+    put_similarity_entry,
+    reuse_similar_roles,
+)
+from email_recruiters.database.db import set_analysis_embedding, set_cached_analysis
+from email_recruiters.core.job_scraper import JobPosting
+from email_recruiters.core.role_analyzer import ContactRole
+
+VERSION = "test-model:0123456789abcdef"
+
+JOB_INFO = {
+    "title": "Backend Engineer",
+    "company": "Acme, Inc.",
+    "location": "Remote",
+    "company_domain": "acme.com",
+    "linkedin_company": "linkedin.com/company/acme",
+}
+
+ROLES = [ContactRole("Engineering Manager, Backend", 1, ["Engineering Manager"], "Hiring manager")]
+
+
+@pytest.fixture(autouse=True)
+def empty_memory_cache(global_database, monkeypatch):
+    monkeypatch.setattr(analysis_cache, "_memory_cache", OrderedDict())
+
+
+URL = "https://acme.com/jobs/1"
+
+CONTENT = "# Backend Engineer at Acme"
+
+
+def test_url_cache_round_trip():
+    job = JobPosting(url=URL, title="Backend Engineer", description=CONTENT, raw_content=CONTENT)
+    put_cached(URL, VERSION, job, JOB_INFO, ROLES)
+
+    # Read back from the database, not the in-process layer
+    analysis_cache._memory_cache.clear()
+    cached_job, job_info, roles = get_cached(URL, VERSION)
+
+    assert cached_job == job
+    assert job_info == JOB_INFO
+    assert roles == ROLES
+    assert get_cached(URL, "other-model:0123456789abcdef") is None
+
+
+def test_content_cache_round_trip():
+    put_cached_roles(CONTENT, VERSION, JOB_INFO, ROLES)
+    analysis_cache._memory_cache.clear()
+
+    assert get_cached_roles(CONTENT, VERSION) == (JOB_INFO, ROLES)
+    assert get_cached_roles("# Something else", VERSION) is None
+
+
+@pytest.mark.parametrize("payload", [
+    "not json",
+    "[]",
+    '{"job_info": {}}',
+    '{"job_info": {}, "suggested_roles": [{"title": "Recruiter"}]}',
+])
+def test_undecodable_payloads_are_misses(global_database, payload):
+    set_cached_analysis(_url_key(URL), VERSION, payload, db=global_database)
+    set_cached_analysis(_content_key(CONTENT), VERSION, payload, db=global_database)
+    set_analysis_embedding(
+        _content_key(CONTENT), VERSION, analysis_cache._normalize([1.0, 0.0]).tobytes(), payload,
+        db=global_database
+    )
+
+    assert get_cached(URL, VERSION) is None
+    assert get_cached_roles(CONTENT, VERSION) is None
+    assert find_similar_roles([1.0, 0.0], VERSION, threshold=0.5) is None
+
+
+def test_older_shaped_url_payload_is_a_miss(global_database):
+    payload = '{"job": {"url": "x", "salary": 1}, "job_info": {}, "suggested_roles": []}'
+    set_cached_analysis(_url_key(URL), VERSION, payload, db=global_database)
+
+    assert get_cached(URL, VERSION) is None
+
+
+def test_find_similar_roles():
+    put_similarity_entry("# Backend Engineer at Acme", VERSION, [1.0, 0.0, 0.0], JOB_INFO, ROLES)
+
+    score, (job_info, roles) = find_similar_roles([0.9, 0.1, 0.0], VERSION, threshold=0.9)
+    assert score > 0.9
+    assert job_info == JOB_INFO
+    assert roles == ROLES
+
+    assert find_similar_roles([0.0, 1.0, 0.0], VERSION, threshold=0.9) is None
+    assert find_similar_roles([1.0, 0.0, 0.0], "other-model:0123456789abcdef", threshold=0.9) is None
+
+
+def test_reuse_similar_roles_keeps_the_postings_own_fields():
+    job = JobPosting(url="https://acme.com/jobs/2", title="Frontend Engineer", company="Acme", location="Berlin")
+
+    job_info, roles = reuse_similar_roles(job, (JOB_INFO, ROLES))
+
+    assert job_info["title"] == "Frontend Engineer"
+    assert job_info["location"] == "Berlin"
+    assert job_info["company_domain"] == "acme.com"
+    assert roles == ROLES
+
+
+@pytest.mark.parametrize("title, company", [
+    ("Backend Engineer", "Globex"),
+    ("Backend Engineer", None),
+    (None, "Acme"),
+])
+def test_reuse_similar_roles_rejects_other_postings(title, company):
+    job = JobPosting(url="https://example.com/jobs/1", title=title, company=company)
+
+    assert reuse_similar_roles(job, (JOB_INFO, ROLES)) is None
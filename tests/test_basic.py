@@ -0,0 +1,58 @@
+"""
+Basic tests to verify the modules can be imported and instantiated.
+"""
+
+import os
+
+import pytest
+
+from email_recruiters.core.job_scraper import JobScraper, JobPosting
+from email_recruiters.core.role_analyzer import RoleAnalyzer, ContactRole
+from email_recruiters.database.models import AnalyzedJob, SuggestedRole
+
+
+def require_env(name):
+    """Skip the requesting test when an API key isn't configured."""
+    if not os.getenv(name):
+        pytest.skip(f"{name} not set")
+
+
+@pytest.fixture(scope="module")
+def scraper():
+    require_env("JINA_API_KEY")
+    with JobScraper() as job_scraper:
+        yield job_scraper
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    require_env("GEMINI_API_KEY")
+    return RoleAnalyzer()
+
+
+def test_imports():
+    assert JobPosting and ContactRole
+    assert AnalyzedJob.__tablename__ == "analyzed_jobs"
+    assert SuggestedRole.__tablename__ == "suggested_roles"
+
+
+def test_job_scraper_instantiation(scraper):
+    assert scraper.api_key
+
+
+def test_role_analyzer_instantiation(analyzer):
+    assert analyzer.api_key
+
+
+def test_job_posting_creation():
+    test_job = JobPosting(
+        url="https://example.com/job/123",
+        title="Senior Software Engineer",
+        company="Tech Corp",
+        location="San Francisco, CA",
+        description="We are looking for a senior software engineer..."
+    )
+
+    assert test_job.title == "Senior Software Engineer"
+    assert test_job.company == "Tech Corp"
+    assert test_job.to_dict()["location"] == "San Francisco, CA"
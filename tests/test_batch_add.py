@@ -0,0 +1,40 @@
+"""
+Tests for spotting duplicate job URLs within a batch.
+"""
+
+import pytest
+
+from email_recruiters.cli.batch_add import _normalize_url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("HTTPS://Boards.Greenhouse.io/acme/jobs/123", "https://boards.greenhouse.io/acme/jobs/123"),
+    ("https://example.com/jobs/123/", "https://example.com/jobs/123"),
+    ("https://example.com/jobs/123#apply", "https://example.com/jobs/123"),
+    ("https://example.com/jobs/123?utm_source=x&UTM_Medium=y", "https://example.com/jobs/123"),
+    ("https://example.com/jobs/123?src=li&source=feed&ref=abc", "https://example.com/jobs/123"),
+    ("https://www.linkedin.com/jobs/view/123/?trk=public&refId=1&trackingId=2",
+     "https://www.linkedin.com/jobs/view/123"),
+    # Parameters that identify the posting are kept, in order
+    ("https://example.com/careers?gh_jid=42&utm_source=x", "https://example.com/careers?gh_jid=42"),
+    ("https://example.com/careers?id=7&lang=en", "https://example.com/careers?id=7&lang=en"),
+    # The path is case-sensitive on many job boards
+    ("https://example.com/Jobs/ABC", "https://example.com/Jobs/ABC"),
+])
+def test_normalize_url(url, expected):
+    assert _normalize_url(url) == expected
+
+
+@pytest.mark.parametrize("first, second", [
+    ("https://example.com/careers?gh_jid=1", "https://example.com/careers?gh_jid=2"),
+    ("https://example.com/jobs/1", "https://example.com/jobs/2"),
+    ("https://example.com/jobs/abc", "https://example.com/jobs/ABC"),
+])
+def test_different_postings_stay_distinct(first, second):
+    assert _normalize_url(first) != _normalize_url(second)
+
+
+def test_tracking_variants_are_duplicates():
+    assert _normalize_url("https://Example.com/jobs/1/?utm_campaign=a#top") == _normalize_url(
+        "https://example.com/jobs/1?ref=newsletter"
+    )
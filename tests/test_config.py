@@ -0,0 +1,95 @@
+"""
+Tests for sequence name matching.
+"""
+
+import sys
+
+import pytest
+
+from email_recruiters.config import fuzzy_match_sequence
+
+
+def sequences(*names):
+    return [{"id": str(index), "name": name} for index, name in enumerate(names)]
+
+
+def names(matches):
+    return [seq["name"] for seq in matches]
+
+
+SEQUENCES = sequences(
+    "Outreach to Engineering",
+    "Q3 Engineering Outreach",
+    "Engineering Outreach Followup",
+    "Sales Outreach",
+    "Engineering Outreach",
+    None,
+)
+
+
+@pytest.mark.parametrize("query, expected", [
+    # Exact, starts with, contains, then only contains all the words
+    ("engineering outreach", [
+        "Engineering Outreach",
+        "Engineering Outreach Followup",
+        "Q3 Engineering Outreach",
+        "Outreach to Engineering",
+    ]),
+    # Case-insensitive
+    ("ENGINEERING Outreach", [
+        "Engineering Outreach",
+        "Engineering Outreach Followup",
+        "Q3 Engineering Outreach",
+        "Outreach to Engineering",
+    ]),
+    # Partial words match; ties keep the API's order
+    ("eng", [
+        "Engineering Outreach Followup",
+        "Engineering Outreach",
+        "Outreach to Engineering",
+        "Q3 Engineering Outreach",
+    ]),
+    ("sales outreach", ["Sales Outreach"]),
+    ("outreach sales", ["Sales Outreach"]),
+])
+def test_match_tiers(query, expected):
+    assert names(fuzzy_match_sequence(query, SEQUENCES)) == expected
+
+
+@pytest.mark.parametrize("limit, expected", [
+    (1, ["Engineering Outreach"]),
+    (2, ["Engineering Outreach", "Engineering Outreach Followup"]),
+    (10, [
+        "Engineering Outreach",
+        "Engineering Outreach Followup",
+        "Q3 Engineering Outreach",
+        "Outreach to Engineering",
+    ]),
+])
+def test_limit_keeps_best_matches(limit, expected):
+    assert names(fuzzy_match_sequence("engineering outreach", SEQUENCES, limit=limit)) == expected
+
+
+def test_limit_ties_keep_api_order():
+    seqs = sequences("Sales Q1", "Sales Q2", "Sales Q3")
+    assert names(fuzzy_match_sequence("sales", seqs, limit=2)) == ["Sales Q1", "Sales Q2"]
+
+
+def test_missing_names_never_match():
+    seqs = [{"id": "1"}, {"id": "2", "name": None}, {"id": "3", "name": "Sales"}]
+    assert names(fuzzy_match_sequence("sales", seqs)) == ["Sales"]
+
+
+def test_no_match_without_rapidfuzz(monkeypatch):
+    # A None entry in sys.modules makes the import fail as if it weren't installed
+    monkeypatch.setitem(sys.modules, "rapidfuzz", None)
+    assert fuzzy_match_sequence("enginering outreach", SEQUENCES) == []
+
+
+def test_typo_tolerant_fallback():
+    pytest.importorskip("rapidfuzz")
+
+    matches = names(fuzzy_match_sequence("enginering outreach", SEQUENCES))
+    assert matches[0] == "Engineering Outreach"
+    assert names(fuzzy_match_sequence("enginering outreach", SEQUENCES, limit=1)) == ["Engineering Outreach"]
+    assert fuzzy_match_sequence("zzzz", SEQUENCES) == []
@@ -0,0 +1,73 @@
+"""
+Tests for reusing Apollo.io contacts across jobs.
+"""
+
+import pytest
+
+from email_recruiters.core import contact_id_cache
+from email_recruiters.core.apollo_search import ApolloContact
+from email_recruiters.core.contact_id_cache import create_new_contacts
+
+
+class FakeApolloClient:
+    """Stands in for ApolloClient.create_contacts, numbering the contacts it creates."""
+
+    def __init__(self, api_key_hash="account-a"):
+        self.api_key_hash = api_key_hash
+        self.created = []
+
+    def create_contacts(self, contacts, custom_fields=None):
+        for contact in contacts:
+            self.created.append(contact.email)
+            contact.contact_id = f"{self.api_key_hash}-{len(self.created)}"
+        return []
+
+
+def contact(email, name="Ada Lovelace"):
+    return ApolloContact(name, "Engineering Manager", email, None, "Example", None, None)
+
+
+@pytest.fixture(autouse=True)
+def empty_memory_cache(global_database, monkeypatch):
+    monkeypatch.setattr(contact_id_cache, "_memory_cache", {})
+
+
+def test_two_jobs_sharing_an_email_create_one_contact():
+    client = FakeApolloClient()
+    first_job = [contact("ada@example.com"), contact("bob@example.com", "Bob Smith")]
+    second_job = [contact(" Ada@Example.com"), contact("cy@example.com", "Cy Young")]
+
+    reused, failures = create_new_contacts(client, first_job)
+    assert reused == [] and failures == []
+
+    reused, failures = create_new_contacts(client, second_job)
+    # The shared contact keeps the first job's ID and is reported as reused, so
+    # callers leave its job title and sequence enrollment alone
+    assert reused == [second_job[0]]
+    assert second_job[0].contact_id == first_job[0].contact_id
+    assert second_job[1].contact_id not in (None, first_job[0].contact_id)
+    assert client.created == ["ada@example.com", "bob@example.com", "cy@example.com"]
+
+
+def test_contact_ids_are_remembered_in_the_database(monkeypatch):
+    client = FakeApolloClient()
+    create_new_contacts(client, [contact("ada@example.com")])
+
+    # A new process starts with an empty memory cache
+    monkeypatch.setattr(contact_id_cache, "_memory_cache", {})
+    later = contact("ada@example.com")
+    reused, _ = create_new_contacts(client, [later])
+
+    assert reused == [later]
+    assert later.contact_id == "account-a-1"
+    assert client.created == ["ada@example.com"]
+
+
+def test_contact_ids_are_per_account():
+    create_new_contacts(FakeApolloClient("account-a"), [contact("ada@example.com")])
+
+    other_account = FakeApolloClient("account-b")
+    reused, _ = create_new_contacts(other_account, [contact("ada@example.com")])
+
+    assert reused == []
+    assert other_account.created == ["ada@example.com"]
@@ -0,0 +1,56 @@
+"""
+Tests for saving and loading analyzed jobs.
+"""
+
+from email_recruiters.core.role_analyzer import ContactRole
+from email_recruiters.database.db import get_analyzed_job_by_url, save_analyzed_job
+from email_recruiters.database.models import CompressedText
+
+URL = "https://example.com/jobs/1"
+
+
+def save(database, roles, description="Build things", raw_content="# Engineer\nBuild things"):
+    return save_analyzed_job(
+        URL, "Engineer", "Example", "Remote", "example.com", None,
+        description, raw_content, roles, db=database,
+    )
+
+
+def test_save_and_load_job(database):
+    save(database, [
+        ContactRole("Recruiter", 2, ["Recruiter"], "Screens candidates"),
+        ContactRole("Engineering Manager", 1, ["Engineering Manager"], "Hiring manager"),
+    ])
+
+    job = get_analyzed_job_by_url(URL, db=database)
+    assert job["company_domain"] == "example.com"
+    assert job["description"] == "Build things"
+    assert job["raw_content"] == "# Engineer\nBuild things"
+    assert [role["title"] for role in job["suggested_roles"]] == ["Engineering Manager", "Recruiter"]
+    assert job["suggested_roles"][0]["reasoning"] == "Hiring manager"
+
+
+def test_resave_replaces_roles(database):
+    first_id = save(database, [ContactRole("Recruiter", 1, ["Recruiter"], "")])
+    # A description identical to the page is stored once and restored on load
+    second_id = save(database, [ContactRole("CTO", 1, ["CTO"], "")], description="same", raw_content="same")
+
+    job = get_analyzed_job_by_url(URL, db=database)
+    assert second_id == first_id
+    assert job["description"] == "same"
+    assert [role["title"] for role in job["suggested_roles"]] == ["CTO"]
+
+
+def test_unknown_url(database):
+    assert get_analyzed_job_by_url(URL, db=database) is None
+
+
+def test_compressed_text_reads_legacy_values():
+    column_type = CompressedText()
+    stored = column_type.process_bind_param("Build things", None)
+
+    assert isinstance(stored, bytes)
+    assert column_type.process_result_value(stored, None) == "Build things"
+    # Plain text from before compression: SQLite TEXT, and PostgreSQL text converted to bytea
+    assert column_type.process_result_value("Build things", None) == "Build things"
+    assert column_type.process_result_value(b"Build things", None) == "Build things"
@@ -0,0 +1,40 @@
+"""
+Tests for extracting job fields from scraped markdown (no network access).
+"""
+
+import time
+
+import pytest
+
+from email_recruiters.core.job_scraper import JobScraper
+
+URL = "https://example.com/jobs/1"
+
+
+@pytest.fixture
+def scraper():
+    return JobScraper(api_key="test")
+
+
+def test_extract_company_from_posting(scraper):
+    content = "# Senior Engineer\nWe are hiring at Acme Corp\nLocation: Remote\n"
+    assert scraper._extract_company(content, URL) == "Acme Corp"
+
+
+def test_extract_company_prefers_labelled_field(scraper):
+    content = "# Senior Engineer\nCompany: Initech\nWe are hiring at Acme Corp\n"
+    assert scraper._extract_company(content, URL) == "Initech"
+
+
+def test_extract_company_long_line_is_linear(scraper):
+    # 40 KB of "at X" candidates on one line that never reaches a terminator used
+    # to backtrack quadratically (~9 s)
+    content = "at b " * 8000
+
+    start = time.perf_counter()
+    company = scraper._extract_company(content, URL)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.0
+    # The first candidate short enough to end at the end of the line
+    assert company == "b at " * 19 + "b"
@@ -0,0 +1,86 @@
+"""
+Tests for the token bucket request pacer (with a fake clock).
+"""
+
+import pytest
+
+from email_recruiters.core import rate_limiter
+from email_recruiters.core.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    """monotonic()/sleep() pair; sleeping advances the clock unless `frozen`."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+        self.frozen = False
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        if not self.frozen:
+            self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", fake)
+    return fake
+
+
+@pytest.mark.parametrize("requests_per_minute, capacity", [(0, 1), (-5, 1), (60, 0)])
+def test_rejects_non_positive_settings(requests_per_minute, capacity):
+    with pytest.raises(ValueError):
+        TokenBucket(requests_per_minute, capacity)
+
+
+def test_burst_then_paced(clock):
+    bucket = TokenBucket(requests_per_minute=30, capacity=3)
+
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    # Empty: each further request waits one interval (60 / 30 = 2 s)
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == pytest.approx([2.0, 2.0])
+
+
+def test_refills_while_idle(clock):
+    bucket = TokenBucket(requests_per_minute=60, capacity=1)
+
+    bucket.acquire()
+    clock.now += 1.0
+    bucket.acquire()
+    assert clock.sleeps == []
+
+    clock.now += 0.25
+    bucket.acquire()
+    assert clock.sleeps == pytest.approx([0.75])
+
+
+def test_idle_refill_capped_at_capacity(clock):
+    bucket = TokenBucket(requests_per_minute=60, capacity=2)
+
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 3600
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == pytest.approx([1.0])
+
+
+def test_concurrent_callers_queue_one_interval_apart(clock):
+    # Callers that arrive together each reserve a token before sleeping, so their
+    # waits are staggered instead of all waking at once
+    clock.frozen = True
+    bucket = TokenBucket(requests_per_minute=60, capacity=1)
+
+    for _ in range(4):
+        bucket.acquire()
+    assert clock.sleeps == pytest.approx([1.0, 2.0, 3.0])
@@ -0,0 +1,114 @@
+"""
+Tests for the in-process TTL cache (with a fake clock).
+"""
+
+import pytest
+
+from email_recruiters.core import ttl_cache
+from email_recruiters.core.ttl_cache import ttl_lru_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(ttl_cache, "time", fake)
+    return fake
+
+
+def counted(**cache_options):
+    """A cached function that returns (argument, call number)."""
+    calls = []
+
+    @ttl_lru_cache(**cache_options)
+    def lookup(value, suffix=""):
+        calls.append(value)
+        return value + suffix, len(calls)
+
+    return lookup, calls
+
+
+def test_results_cached_until_ttl(clock):
+    lookup, calls = counted(ttl=60)
+
+    assert lookup("a") == ("a", 1)
+    clock.now += 59
+    assert lookup("a") == ("a", 1)
+    clock.now += 1
+    assert lookup("a") == ("a", 2)
+    assert calls == ["a", "a"]
+
+
+def test_arguments_are_part_of_the_key(clock):
+    lookup, calls = counted()
+
+    lookup("a")
+    lookup("b")
+    lookup("a", suffix="!")
+    lookup("a", suffix="!")
+    assert calls == ["a", "b", "a"]
+
+
+def test_errors_are_not_cached(clock):
+    attempts = []
+
+    @ttl_lru_cache(ttl=60)
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise Exception("temporary failure")
+        return "ok"
+
+    with pytest.raises(Exception, match="temporary failure"):
+        flaky()
+    assert flaky() == "ok"
+    assert flaky() == "ok"
+    assert len(attempts) == 2
+
+
+def test_least_recently_used_entry_evicted(clock):
+    lookup, calls = counted(maxsize=2)
+
+    lookup("a")
+    lookup("b")
+    lookup("a")  # Now the most recently used
+    lookup("c")  # Evicts "b"
+    lookup("a")
+    lookup("b")
+    assert calls == ["a", "b", "c", "b"]
+
+
+def test_custom_key_separates_accounts(clock):
+    class Client:
+        def __init__(self, api_key_hash):
+            self.api_key_hash = api_key_hash
+            self.calls = 0
+
+        @ttl_lru_cache(ttl=60, key=lambda self: self.api_key_hash)
+        def sequences(self):
+            self.calls += 1
+            return f"sequences of {self.api_key_hash}"
+
+    first, second, same_account = Client("k1"), Client("k2"), Client("k1")
+
+    assert first.sequences() == "sequences of k1"
+    assert second.sequences() == "sequences of k2"
+    # Another client for the same account reuses the first one's result
+    assert same_account.sequences() == "sequences of k1"
+    assert (first.calls, second.calls, same_account.calls) == (1, 1, 0)
+
+
+def test_cache_clear(clock):
+    lookup, calls = counted()
+
+    lookup("a")
+    lookup.cache_clear()
+    lookup("a")
+    assert calls == ["a", "a"]